@@ -70,7 +70,7 @@ FALSE
 
 
 -- Créer un logement associé à l'utilisateur Haruki Murakami
-INSERT INTO places (id, title, description, price, picture, latitude, longitude, owner_id)
+INSERT INTO places (id, title, description, price, picture, latitude, longitude, geohash, owner_id)
 VALUES (
 '7a9cfb4d-e422-4e9a-8917-998f8e8e1d7c', -- place id
 'Le passage de la nuit',
@@ -79,12 +79,13 @@ VALUES (
 'https://images.unsplash.com/photo-1670854753472-4d7cbe07a1c0?q=80&w=2070&auto=format&fit=crop&ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D',
 34.2,
 23.1,
+'sw06t9uvm', -- geohash de (34.2, 23.1)
 '31fbb9be-c2ef-4868-95c4-e5c3f2b78904' -- owner id
 );
 
 
 -- Créer un logement associé à l'utilisateur Yukio Mishima
-INSERT INTO places (id, title, description, price, picture, latitude, longitude, owner_id)
+INSERT INTO places (id, title, description, price, picture, latitude, longitude, geohash, owner_id)
 VALUES (
 '2r3uyt75-ki79-7z3n-3825-132f2a3iyu8j', -- place id
 'La mer et le couchant',
@@ -93,12 +94,13 @@ VALUES (
 'https://images.unsplash.com/photo-1695539330133-f0c931c95f27?q=80&w=1974&auto=format&fit=crop&ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D',
 34.2,
 23.1,
+'sw06t9uvm', -- geohash de (34.2, 23.1)
 '42abc567-d7f7-4072-91de-5153c3e15ed8' -- owner id
 );
 
 
 -- Créer un logement associé à l'utilisateur Natsume Souseki
-INSERT INTO places (id, title, description, price, picture, latitude, longitude, owner_id)
+INSERT INTO places (id, title, description, price, picture, latitude, longitude, geohash, owner_id)
 VALUES (
 '5dvgf3v-k789-0m6b-4093-678r1d6e2wz7p', -- place id
 'Les Sept Ponts',
@@ -107,12 +109,13 @@ VALUES (
 'https://images.unsplash.com/photo-1474168999089-5956598f4ea4?q=80&w=1929&auto=format&fit=crop&ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D',
 34.2,
 23.1,
+'sw06t9uvm', -- geohash de (34.2, 23.1)
 '51cvb728-e4r6-4635-12gr-7368c3e15ty0' -- owner id
 );
 
 
 -- Créer un logement associé à l'utilisateur Natsume Souseki
-INSERT INTO places (id, title, description, price, picture, latitude, longitude, owner_id)
+INSERT INTO places (id, title, description, price, picture, latitude, longitude, geohash, owner_id)
 VALUES (
 '6jndl9y-k789-0m6b-4093-827r1d6e2pa8b', -- place id
 'Grandeur Nature',
@@ -121,12 +124,13 @@ VALUES (
 'https://images.unsplash.com/photo-1686933021211-19a669f3acb2?q=80&w=2127&auto=format&fit=crop&ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D',
 34.2,
 23.1,
+'sw06t9uvm', -- geohash de (34.2, 23.1)
 '51cvb728-e4r6-4635-12gr-7368c3e15ty0' -- owner id
 );
 
 
 -- Créer un logement associé à l'utilisateur Yôko Ogawa
-INSERT INTO places (id, title, description, price, picture, latitude, longitude, owner_id)
+INSERT INTO places (id, title, description, price, picture, latitude, longitude, geohash, owner_id)
 VALUES (
 '8sgoi8n-k789-0m6b-4093-836m9qw9eyc93', -- place id
 'La loi du silence',
@@ -135,6 +139,7 @@ VALUES (
 'https://images.unsplash.com/photo-1722229808606-d060bf607028?q=80&w=2030&auto=format&fit=crop&ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D',
 34.2,
 23.1,
+'sw06t9uvm', -- geohash de (34.2, 23.1)
 '89vad163-j9c4-8507-09df-6780c5s77aw3' -- owner id
 );
 
@@ -253,6 +258,16 @@ VALUES (
 );
 
 
+-- Agrégats des avis de chaque logement (nombre, somme et histogramme des notes)
+UPDATE places SET
+review_count = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id),
+rating_sum = (SELECT COALESCE(SUM(rating), 0) FROM reviews WHERE reviews.place_id = places.id),
+rating_1 = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id AND rating = 1),
+rating_2 = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id AND rating = 2),
+rating_3 = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id AND rating = 3),
+rating_4 = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id AND rating = 4),
+rating_5 = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id AND rating = 5);
+
 
 -- Modifier le titre du logement
 --UPDATE places
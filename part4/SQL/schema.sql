@@ -21,12 +21,40 @@ price DECIMAL(10, 2),
 picture VARCHAR(1024),
 latitude FLOAT,
 longitude FLOAT,
+geohash VARCHAR(12),
+review_count INTEGER NOT NULL DEFAULT 0,
+rating_sum INTEGER NOT NULL DEFAULT 0,
+rating_1 INTEGER NOT NULL DEFAULT 0,
+rating_2 INTEGER NOT NULL DEFAULT 0,
+rating_3 INTEGER NOT NULL DEFAULT 0,
+rating_4 INTEGER NOT NULL DEFAULT 0,
+rating_5 INTEGER NOT NULL DEFAULT 0,
+version INTEGER NOT NULL DEFAULT 1,
 owner_id CHAR(36),
 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-FOREIGN KEY (owner_id) REFERENCES users(id)
+FOREIGN KEY (owner_id) REFERENCES users(id),
+CONSTRAINT unique_owner_place_title UNIQUE (owner_id, title)
 );
 
+-- Index for cursor pagination on places (default order and sort=newest)
+CREATE INDEX IF NOT EXISTS idx_places_created_at ON places (created_at, id);
+
+-- Index for price filtering and sort=price / sort=-price
+CREATE INDEX IF NOT EXISTS idx_places_price ON places (price, id);
+
+-- Spatial index: geohash prefix ranges for bbox and radius searches
+CREATE INDEX IF NOT EXISTS idx_places_geohash ON places (geohash);
+
+-- Index for the places of an owner, in cursor pagination order
+CREATE INDEX IF NOT EXISTS idx_places_owner ON places (owner_id, created_at, id);
+
+-- Index for exact title search (the per-owner check uses unique_owner_place_title)
+CREATE INDEX IF NOT EXISTS idx_places_title ON places (title);
+
+-- Index for re-reading recently modified places (in-memory rankings and amenity index)
+CREATE INDEX IF NOT EXISTS idx_places_updated_at ON places (updated_at);
+
 -- Create Review table
 CREATE TABLE IF NOT EXISTS reviews (
 id CHAR(36) PRIMARY KEY,
@@ -41,6 +69,9 @@ FOREIGN KEY (place_id) REFERENCES places(id),
 CONSTRAINT unique_user_place_review UNIQUE (user_id, place_id)
 );
 
+-- Index for the reviews of a place (reviews of a user use unique_user_place_review)
+CREATE INDEX IF NOT EXISTS idx_reviews_place ON reviews (place_id);
+
 -- Create Amenity table
 CREATE TABLE IF NOT EXISTS amenities (
 id CHAR(36) PRIMARY KEY,
@@ -57,3 +88,23 @@ PRIMARY KEY (place_id, amenity_id),
 FOREIGN KEY (place_id) REFERENCES places(id),
 FOREIGN KEY (amenity_id) REFERENCES amenities(id)
 );
+
+-- Create Revoked_Tokens table (refresh tokens consumed by rotation)
+CREATE TABLE IF NOT EXISTS revoked_tokens (
+id CHAR(36) PRIMARY KEY,
+jti CHAR(36) UNIQUE NOT NULL,
+user_id CHAR(36) NOT NULL,
+expires_at TIMESTAMP NULL,
+created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Index for loading the revocations of unexpired tokens
+CREATE INDEX IF NOT EXISTS idx_revoked_tokens_expires_at ON revoked_tokens (expires_at);
+
+-- Create Catalog_Versions table (version counters of the in-memory catalogs)
+-- Rows are created by the application on the first change of each catalog
+CREATE TABLE IF NOT EXISTS catalog_versions (
+name VARCHAR(50) PRIMARY KEY,
+version INTEGER NOT NULL DEFAULT 0
+);
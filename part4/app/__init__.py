@@ -1,15 +1,26 @@
 from flask import Flask
 from flask_restx import Api
-from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
+from sqlalchemy.orm import configure_mappers
 
 # Configuration par défaut
 from config import DevelopmentConfig
 
 # Extensions initialisées dans un fichier séparé
-from .extensions import db, jwt
+from .extensions import db, jwt, response_cache, password_hasher
+from app.passwords import PasswordHasherBusy
+from app.schemas import ValidationError
+from app.json_provider import make_json_provider, output_json
+
+# Classement des lieux, index et catalogue des commodités et jetons révoqués tenus en mémoire
+from app.services.rankings import place_rankings
+from app.services.amenity_index import place_amenity_index
+from app.services.amenity_catalog import amenity_catalog
+from app.services.token_blocklist import token_blocklist
+from app.services.user_auth_cache import user_auth_cache
+from app.services import facade
 
 # Import des namespaces API
 from app.api.v1.users import api as users_ns
@@ -18,9 +29,6 @@ from app.api.v1.amenities import api as amenities_ns
 from app.api.v1.reviews import api as reviews_ns
 from app.api.v1.auth import api as auth_ns
 
-# Instanciation manuelle de bcrypt (conforme à ta structure)
-bcrypt = Bcrypt()
-
 
 def create_app(config_class=DevelopmentConfig):
     # Création de l'application Flask
@@ -38,10 +46,24 @@ def create_app(config_class=DevelopmentConfig):
     # Désactive les warnings inutiles de SQLAlchemy (si pas déjà dans config.py)
     app.config.setdefault('SQLALCHEMY_TRACK_MODIFICATIONS', False)
 
+    # Encodage et décodage JSON (orjson ou module json, voir JSON_PROVIDER)
+    app.json = make_json_provider(app)
+
     # Initialisation des extensions
-    bcrypt.init_app(app)
     db.init_app(app)
     jwt.init_app(app)
+    password_hasher.init_app(app)
+    # Crée les relations déclarées par backref (ex. Place.owner) avant la
+    # première requête : les options de chargement y font référence
+    configure_mappers()
+    response_cache.init_app(app)
+    place_rankings.init_app(app)
+    place_amenity_index.init_app(app)
+    amenity_catalog.init_app(app)
+    token_blocklist.init_app(app)
+    user_auth_cache.init_app(app)
+    # Identity map de HBnBFacade vidée à la fin de chaque requête
+    app.teardown_request(facade.end_request)
 
     # Définition de l'API avec Swagger + auth JWT
     api = Api(
@@ -61,6 +83,19 @@ def create_app(config_class=DevelopmentConfig):
         }
     )
 
+    # Réponses de l'API encodées par le fournisseur JSON de l'application
+    api.representations['application/json'] = output_json
+
+    # Pool de hachage des mots de passe saturé : le client doit réessayer
+    @api.errorhandler(PasswordHasherBusy)
+    def handle_password_hasher_busy(error):
+        return {"error": str(error)}, 503, {"Retry-After": "1"}
+
+    # Données de requête refusées par un schéma (app/schemas.py)
+    @api.errorhandler(ValidationError)
+    def handle_validation_error(error):
+        return {"error": str(error)}, 400
+
     # Enregistrement des namespaces (endpoints)
     api.add_namespace(users_ns, path='/api/v1/users')
     api.add_namespace(places_ns, path='/api/v1/places')
@@ -2,6 +2,8 @@ from flask_restx import Namespace, Resource, fields
 from flask import request
 from flask_jwt_extended import jwt_required, get_jwt
 from app.services import facade
+from app.persistence.repository import unit_of_work_per_request
+from app.extensions import response_cache
 
 api = Namespace('amenities', description='Amenity operations')
 
@@ -18,6 +20,7 @@ class AmenityList(Resource):
     @api.response(201, 'Amenity successfully created')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Admin privileges required')
+    @unit_of_work_per_request
     def post(self):
         """Register a new amenity"""
         claims = get_jwt()
@@ -30,24 +33,26 @@ class AmenityList(Resource):
         amenity = facade.create_amenity(data)
         return {'id': amenity.id, 'name': amenity.name}, 201
 
+    @response_cache.cached("amenities")
     @api.response(200, 'List of amenities retrieved successfully')
     def get(self):
         """Retrieve a list of all amenities"""
-        amenities = facade.get_all_amenities()
-        result = [{'id': a.id, 'name': a.name} for a in amenities]
+        catalog = facade.get_amenity_catalog()
+        result = [{'id': amenity_id, 'name': name} for amenity_id, name in catalog.by_id.items()]
         return result, 200
 
 
 @api.route('/<string:amenity_id>')
 class AmenityResource(Resource):
+    @response_cache.cached("amenity:{amenity_id}")
     @api.response(200, 'Amenity details retrieved successfully')
     @api.response(404, 'Amenity not found')
     def get(self, amenity_id):
         """Get amenity details by ID"""
-        amenity = facade.get_amenity(amenity_id)
-        if not amenity:
+        name = facade.get_amenity_catalog().by_id.get(amenity_id)
+        if name is None:
             api.abort(404, "Amenity not found")
-        return {'id': amenity.id, 'name': amenity.name}, 200
+        return {'id': amenity_id, 'name': name}, 200
 
     @jwt_required()
     @api.expect(amenity_model)
@@ -55,6 +60,7 @@ class AmenityResource(Resource):
     @api.response(404, 'Amenity not found')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Admin privileges required')
+    @unit_of_work_per_request
     def put(self, amenity_id):
         """Update an amenity's information"""
         claims = get_jwt()
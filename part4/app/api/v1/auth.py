@@ -2,12 +2,17 @@
 
 Définit les routes d'authentification pour l'application HBnB.
 Comprend le point de terminaison /login pour la génération de jetons JWT,
-et un exemple de route protégée par JWT (/protected).
+/refresh pour leur renouvellement sans mot de passe, et un exemple de
+route protégée par JWT (/protected).
 """
 
+from datetime import datetime, timezone
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, get_jwt
-from app.services.facade import HBnBFacade
+from flask_jwt_extended import (
+    create_access_token, create_refresh_token, jwt_required, get_jwt_identity, get_jwt
+)
+from app.extensions import jwt
+from app.services import facade  # Accès à la couche métier
 
 # Création du namespace pour l'authentification
 api = Namespace('auth', description='Authentication operations')
@@ -18,17 +23,41 @@ login_model = api.model('Login', {
     'password': fields.String(required=True, description='User password')
 })
 
-# Instanciation de la façade métier
-facade = HBnBFacade()
+
+def create_tokens(user):
+    """
+    Crée le jeton d'accès (avec le claim is_admin) et le jeton de
+    rafraîchissement d'un utilisateur (User ou UserAuth).
+    """
+    identity = str(user.id)
+    return {
+        'access_token': create_access_token(
+            identity=identity,
+            additional_claims={"is_admin": bool(user.is_admin)}
+        ),
+        'refresh_token': create_refresh_token(identity=identity)
+    }
+
+
+@jwt.token_in_blocklist_loader
+def is_token_revoked(jwt_header, jwt_payload):
+    """
+    Refuse les jetons de rafraîchissement déjà consommés.
+    Les jetons d'accès ne sont jamais révoqués : aucune vérification.
+    """
+    if jwt_payload.get("type") != "refresh":
+        return False
+    return facade.is_token_revoked(jwt_payload["jti"])
 
 
 @api.route('/login')
 class Login(Resource):
     @api.expect(login_model)
-    @api.response(200, 'JWT token returned')
+    @api.response(200, 'JWT access and refresh tokens returned')
     @api.response(401, 'Invalid credentials')
+    @api.response(503, 'Password hashing pool saturated, retry later')
     def post(self):
-        """Authentifie l'utilisateur et renvoie un jeton JWT"""
+        """Authentifie l'utilisateur et renvoie un jeton d'accès et un jeton de rafraîchissement"""
         credentials = api.payload
         user = facade.get_user_by_email(credentials['email'])
 
@@ -37,14 +66,41 @@ class Login(Resource):
             return {'error': 'Invalid credentials'}, 401
 
         # Encodage avec identité str + claims admin
-        access_token = create_access_token(
-            identity=str(user.id),
-            additional_claims={
-                "is_admin": bool(user.is_admin)
-            }
-        )
-
-        return {'access_token': access_token}, 200
+        return create_tokens(user), 200
+
+
+@api.route('/refresh')
+class Refresh(Resource):
+    @jwt_required(refresh=True)
+    @api.response(200, 'New JWT access and refresh tokens returned')
+    @api.response(401, 'Missing, expired or already used refresh token')
+    @api.response(422, 'Not a refresh token')
+    def post(self):
+        """
+        Renouvelle les jetons à partir d'un jeton de rafraîchissement
+        (en-tête Authorization: Bearer <refresh_token>), sans mot de passe.
+
+        Rotation : le jeton présenté est révoqué et un nouveau jeton de
+        rafraîchissement est renvoyé ; chaque jeton n'est utilisable qu'une fois.
+        """
+        claims = get_jwt()
+        user = facade.get_user_auth(get_jwt_identity())
+        if not user:
+            return {'error': 'User not found'}, 401
+
+        try:
+            # Sans claim exp (JWT_REFRESH_TOKEN_EXPIRES = False), le jeton
+            # n'expire jamais : sa révocation est gardée sans date
+            expires_at = claims.get("exp")
+            facade.revoke_token(
+                claims["jti"], user.id,
+                datetime.fromtimestamp(expires_at, timezone.utc) if expires_at is not None else None
+            )
+        except ValueError:
+            # Jeton consommé entre-temps (requête concurrente ou autre processus)
+            return {'error': 'Token has been revoked'}, 401
+
+        return create_tokens(user), 200
 
 
 @api.route('/protected')
@@ -9,10 +9,15 @@ Chaque endpoint interagit avec la couche de logique métier via la facade
 HBnBFacade.
 """
 
+import math
 from flask_restx import Namespace, Resource, fields
-from flask import request
+from flask import Response, current_app, request, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app.services import facade  # Accès à la couche métier
+from app.persistence.repository import unit_of_work_per_request
+from app.extensions import response_cache
+from app.cache import conditional
+from app.api.v1.serializers import PLACE_FIELDS, PLACE_RELATIONS, get_place_serializer
 from app.api.v1.reviews import review_model
 
 # ===================================================
@@ -20,6 +25,13 @@ from app.api.v1.reviews import review_model
 # ===================================================
 api = Namespace('places', description='Place operations')
 
+# Taille de page par défaut et maximale pour la pagination par curseur
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Rayon maximal (km) d'une recherche de proximité
+MAX_RADIUS_KM = 200
+
 # ===================================================
 # Définition du modèle Amenity (utilisé en réponse)
 # ===================================================
@@ -52,6 +64,169 @@ place_model = api.model('Place', {
     'reviews': fields.List(fields.Nested(review_model), description='List of reviews')
 })
 
+# Réponses de création et de mise à jour d'un lieu
+CREATED_PLACE_FIELDS = ('id', 'title', 'description', 'price', 'latitude', 'longitude', 'owner_id')
+UPDATED_PLACE_FIELDS = ('id', 'title', 'description', 'price', 'picture', 'latitude', 'longitude', 'owner_id')
+
+# Nombre maximal de lieux créés par une requête POST /places/bulk
+MAX_BULK_PLACES = 1000
+
+# Nombre de lieux lus en base par lot lors de l'export NDJSON
+EXPORT_BATCH_SIZE = 500
+
+AMENITY_MATCHES = ('all', 'any')
+MAX_AMENITY_FILTERS = 20
+
+projection_params = {
+    'fields': f"Comma-separated place fields to return (default: all). Allowed: {', '.join(PLACE_FIELDS)}",
+    'include': f"Comma-separated relations to embed (default: all). Allowed: {', '.join(PLACE_RELATIONS)}"
+}
+
+
+def parse_list_param(name, allowed):
+    """
+    Lit un paramètre de requête sous forme de liste séparée par des virgules.
+    Retourne None si le paramètre est absent.
+    Lève une ValueError si une valeur n'est pas autorisée.
+    """
+    raw = request.args.get(name)
+    if raw is None:
+        return None
+    values = [value.strip() for value in raw.split(',') if value.strip()]
+    unknown = [value for value in values if value not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown value(s) for '{name}': {', '.join(unknown)}")
+    return values
+
+
+def parse_price_param(name):
+    """
+    Lit un paramètre de requête de prix (nombre).
+    Retourne None si le paramètre est absent.
+    Lève une ValueError si la valeur n'est pas un nombre.
+    """
+    raw = request.args.get(name)
+    if raw is None:
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        value = math.nan
+    if not math.isfinite(value):
+        raise ValueError(f"'{name}' must be a number")
+    return value
+
+
+def parse_limit_param():
+    """
+    Lit le paramètre limit (taille de page).
+    Lève une ValueError si la valeur n'est pas un entier entre 1 et MAX_PAGE_SIZE.
+    """
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise ValueError("'limit' must be an integer")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"'limit' must be between 1 and {MAX_PAGE_SIZE}")
+    return limit
+
+
+def parse_min_reviews_param():
+    """
+    Lit le paramètre min_reviews (nombre minimum d'avis, 1 par défaut).
+    Lève une ValueError si la valeur n'est pas un entier positif ou nul.
+    """
+    try:
+        min_reviews = int(request.args.get('min_reviews', 1))
+    except ValueError:
+        raise ValueError("'min_reviews' must be an integer")
+    if min_reviews < 0:
+        raise ValueError("'min_reviews' must be greater than or equal to 0")
+    return min_reviews
+
+
+def parse_float_param(name, minimum, maximum, required=False):
+    """
+    Lit un paramètre de requête numérique borné [minimum, maximum].
+    Retourne None si le paramètre est absent et facultatif.
+    Lève une ValueError si la valeur est absente (requise), invalide ou hors bornes.
+    """
+    raw = request.args.get(name)
+    if raw is None:
+        if required:
+            raise ValueError(f"Missing '{name}' query parameter")
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        value = math.nan
+    if not minimum <= value <= maximum:
+        raise ValueError(f"'{name}' must be a number between {minimum} and {maximum}")
+    return value
+
+
+def parse_bbox_param():
+    """
+    Lit le paramètre bbox=min_lon,min_lat,max_lon,max_lat.
+    Retourne None si le paramètre est absent.
+    min_lon peut dépasser max_lon si la zone traverse l'antiméridien.
+    Lève une ValueError si la bbox est invalide.
+    """
+    raw = request.args.get('bbox')
+    if raw is None:
+        return None
+    error = "'bbox' must be min_lon,min_lat,max_lon,max_lat"
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(v) for v in raw.split(','))
+    except ValueError:
+        raise ValueError(error)
+    if not (-180.0 <= min_lon <= 180.0 and -180.0 <= max_lon <= 180.0
+            and -90.0 <= min_lat <= max_lat <= 90.0):
+        raise ValueError(error)
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def parse_amenities_param():
+    """
+    Lit les paramètres amenities=id1,id2 et amenities_match=all|any.
+    Retour : (liste d'identifiants ou None, True si toutes les commodités sont exigées)
+    Lève une ValueError si amenities_match est invalide ou si trop d'identifiants sont donnés.
+    """
+    match = request.args.get('amenities_match', 'all')
+    if match not in AMENITY_MATCHES:
+        raise ValueError(f"'amenities_match' must be one of: {', '.join(AMENITY_MATCHES)}")
+
+    raw = request.args.get('amenities')
+    if raw is None:
+        return None, True
+    amenity_ids = list(dict.fromkeys(value.strip() for value in raw.split(',') if value.strip()))
+    if len(amenity_ids) > MAX_AMENITY_FILTERS:
+        raise ValueError(f"'amenities' accepts at most {MAX_AMENITY_FILTERS} IDs")
+    return amenity_ids or None, match == 'all'
+
+
+def parse_projection():
+    """
+    Lit les paramètres fields= et include= de la requête.
+    Retour : (champs, relations) dans l'ordre canonique.
+    - fields absent : tous les champs ; 'id' est toujours renvoyé
+    - include absent : toutes les relations ; include= vide : aucune
+    """
+    requested_fields = parse_list_param('fields', PLACE_FIELDS)
+    requested_include = parse_list_param('include', PLACE_RELATIONS)
+
+    if requested_fields is None:
+        place_fields = PLACE_FIELDS
+    else:
+        place_fields = tuple(f for f in PLACE_FIELDS if f == 'id' or f in requested_fields)
+
+    if requested_include is None:
+        include = PLACE_RELATIONS
+    else:
+        include = tuple(r for r in PLACE_RELATIONS if r in requested_include)
+
+    return place_fields, include
+
 
 # ===================================================
 # /api/v1/places/
@@ -67,6 +242,7 @@ class PlaceList(Resource):
     @api.response(404, 'Owner Not Found')
     @api.response(409, 'Conflict: Title already used by this owner')
     @api.response(500, 'Internal Server Error')
+    @unit_of_work_per_request
     def post(self):
         """
         Enregistre un nouveau lieu (place) à partir des données JSON reçues.
@@ -83,31 +259,19 @@ class PlaceList(Resource):
             # Ajout de l'ID du propriétaire dans les données reçues
             data['owner_id'] = current_user 
 
-            # Extraction de title et vérification de conflit avec cet owner
-            title = data.get("title")
-            existing_place = facade.get_place_by_title(title)
-            if existing_place and str(existing_place.owner.id) == str(current_user):
-                return {"error": "This owner already has a place with the same title"}, 409
-
-            # Création du lieu via la facade
+            # Création du lieu via la facade (vérifie aussi le conflit de titre)
             new_place = facade.create_place(data)
 
             # Construction de la réponse JSON
-            response = {
-                'id': new_place.id,
-                'title': new_place.title,
-                'description': new_place.description,
-                'price': new_place.price,
-                'latitude': new_place.latitude,
-                'longitude': new_place.longitude,
-                'owner_id': new_place.owner.id
-            }
-
-            return response, 201
+            serialize = get_place_serializer(CREATED_PLACE_FIELDS, ())
+            return serialize(new_place), 201
 
         # Gestion des erreurs de validation ou données incorrectes
         except (ValueError, TypeError, KeyError) as e:
-            return {"error": str(e)}, 400
+            error_msg = str(e)
+            if "Title already used" in error_msg:
+                return {"error": error_msg}, 409
+            return {"error": error_msg}, 400
 
         # Gestion des erreurs inattendues (ex : crash interne, bug imprévu)
         except Exception as e:
@@ -118,62 +282,57 @@ class PlaceList(Resource):
             traceback.print_exc()
             return {"error": "Internal server error"}, 500
 
+    @response_cache.cached("places")
+    @api.doc(params={
+        'limit': f'Number of places per page (1-{MAX_PAGE_SIZE}, default {DEFAULT_PAGE_SIZE})',
+        'after': 'Cursor returned as next_cursor by the previous page',
+        'min_price': 'Minimum price per night (inclusive)',
+        'max_price': 'Maximum price per night (inclusive)',
+        'sort': 'Sort order: price, -price or newest (default: oldest first)',
+        'bbox': 'Bounding box filter: min_lon,min_lat,max_lon,max_lat',
+        'amenities': 'Comma-separated amenity IDs the places must offer',
+        'amenities_match': f"How amenity IDs combine: {' or '.join(AMENITY_MATCHES)} (default: all)",
+        **projection_params
+    })
     @api.response(200, 'List of places retrieved successfully')
+    @api.response(400, 'Invalid query parameters')
     @api.response(500, 'Internal server error')
     def get(self):
         """
-        Récupère la liste de tous les lieux enregistrés.
+        Récupère une page de lieux, triés par date de création.
+        Le champ next_cursor de la réponse permet d'obtenir la page suivante.
         """
         try:
-            places = facade.get_all_places()
+            limit = parse_limit_param()
+            min_price = parse_price_param('min_price')
+            max_price = parse_price_param('max_price')
+            bbox = parse_bbox_param()
+            amenity_ids, match_all = parse_amenities_param()
+            place_fields, include = parse_projection()
+            places, next_cursor = facade.get_places_page(
+                limit, request.args.get('after'), include,
+                min_price=min_price,
+                max_price=max_price,
+                sort=request.args.get('sort'),
+                bbox=bbox,
+                amenity_ids=amenity_ids,
+                match_all=match_all
+            )
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        try:
             if not places:
                 return {
                     "message": "No places found",
-                    "places": []
+                    "places": [],
+                    "next_cursor": None
                 }, 200
 
-            result = []
-            for place in places:
-                result.append({
-                    "id": place.id,
-                    "title": place.title,
-                    "description": place.description,
-                    "price": place.price,
-                    "picture": place.picture,
-                    "latitude": place.latitude,
-                    "longitude": place.longitude,
-                    "owner": {
-                        "id": place.owner.id,
-                        "first_name": place.owner.first_name,
-                        "last_name": place.owner.last_name,
-                        "email": place.owner.email
-                    },
-                    "amenities": [
-                        {
-                            "id": amenity.id,
-                            "name": amenity.name
-                        }
-                        for amenity in place.amenities
-                    ],
-                    "reviews": [
-                        {
-                            "id": review.id,
-                            "text": review.text,
-                            "rating": review.rating,
-                            "user": {
-                                "id": review.author.id,
-                                "first_name": review.author.first_name,
-                                "last_name": review.author.last_name,
-                                "email": review.author.email
-                            }
-                        }
-                        for review in place.reviews
-                    ]
-                })
-
             return {
                 "message": "Places retrieved successfully",
-                "places": result
+                "places": get_place_serializer(place_fields, include).many(places),
+                "next_cursor": next_cursor
             }, 200
 
         except Exception as e:
@@ -183,13 +342,64 @@ class PlaceList(Resource):
             return {"error": "Internal server error"}, 500
 
 
+# ===================================================
+# /api/v1/places/bulk
+# Ressource pour créer plusieurs lieux en une requête
+# ===================================================
+@api.route('/bulk')
+class PlaceBulk(Resource):
+
+    @jwt_required()
+    @api.expect([place_model])
+    @api.response(201, 'All places successfully created')
+    @api.response(207, 'Some places created, see per-item results')
+    @api.response(400, 'Invalid input data, no place created')
+    @api.response(404, 'Owner Not Found')
+    @api.response(409, 'Conflict: Title already used by this owner')
+    @unit_of_work_per_request
+    def post(self):
+        """
+        Crée plusieurs lieux appartenant à l'utilisateur connecté, à partir
+        d'un tableau JSON. Les lieux valides sont créés en une seule
+        transaction ; le résultat de chaque élément est renvoyé dans l'ordre
+        du tableau (id du lieu créé, ou message d'erreur).
+        """
+        data = request.get_json(silent=True)
+        if not isinstance(data, list) or not data:
+            return {"error": "Expected a non-empty JSON array of places"}, 400
+        if len(data) > MAX_BULK_PLACES:
+            return {"error": f"At most {MAX_BULK_PLACES} places can be created per request"}, 400
+
+        try:
+            results = facade.create_places_bulk(get_jwt_identity(), data)
+        except ValueError as e:
+            error_msg = str(e)
+            if "Owner not found" in error_msg:
+                return {"error": error_msg}, 404
+            return {"error": error_msg}, 409
+
+        created = sum(1 for result in results if "id" in result)
+        if created == len(results):
+            status = 201
+        elif created:
+            status = 207
+        else:
+            status = 400
+        return {
+            "created": created,
+            "failed": len(results) - created,
+            "results": results
+        }, status
+
+
 # ===================================================
 # /api/v1/places/search
 # Ressource pour rechercher un lieu par son titre exact
 # ===================================================
 @api.route('/search')
 class PlaceSearch(Resource):
-    @api.doc(params={'title': 'Exact title of the place to search'})
+    @response_cache.cached("places")
+    @api.doc(params={'title': 'Exact title of the place to search', **projection_params})
     @api.response(200, 'Place found')
     @api.response(400, 'Missing title parameter')
     @api.response(404, 'Place not found')
@@ -201,43 +411,128 @@ class PlaceSearch(Resource):
         if not title:
             return {"error": "Missing 'title' query parameter"}, 400
 
-        place = facade.get_place_by_title(title)
+        try:
+            place_fields, include = parse_projection()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        place = facade.get_place_by_title(title, include)
         if not place:
             return {"error": "Place not found"}, 404
 
+        return get_place_serializer(place_fields, include)(place), 200
+
+
+# ===================================================
+# /api/v1/places/export
+# Ressource pour exporter tous les lieux en flux NDJSON
+# ===================================================
+@api.route('/export')
+class PlaceExport(Resource):
+    @api.doc(params=projection_params)
+    @api.response(200, 'Places streamed as NDJSON, one place per line')
+    @api.response(400, 'Invalid query parameters')
+    def get(self):
+        """
+        Exporte tous les lieux en NDJSON (un objet JSON par ligne), du plus
+        ancien au plus récent. Les lieux sont lus et envoyés par lots :
+        la mémoire utilisée ne dépend pas du nombre de lieux.
+        """
+        try:
+            place_fields, include = parse_projection()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        serialize = get_place_serializer(place_fields, include)
+        dumps = current_app.json.dumps
+
+        def generate():
+            for place in facade.iter_places_for_export(include, EXPORT_BATCH_SIZE):
+                yield dumps(serialize(place)) + "\n"
+
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+# ===================================================
+# /api/v1/places/top
+# Ressource pour récupérer les lieux les mieux notés
+# ===================================================
+@api.route('/top')
+class TopPlaces(Resource):
+    @response_cache.cached("places")
+    @api.doc(params={
+        'limit': f'Maximum number of places (1-{MAX_PAGE_SIZE}, default {DEFAULT_PAGE_SIZE})',
+        'min_reviews': 'Minimum number of reviews of a ranked place (default 1)',
+        **projection_params
+    })
+    @api.response(200, 'Top rated places retrieved successfully')
+    @api.response(400, 'Invalid query parameters')
+    def get(self):
+        """
+        Récupère les lieux les mieux notés, classés par note bayésienne.
+        Le classement est tenu en mémoire et mis à jour à chaque avis.
+        """
+        try:
+            limit = parse_limit_param()
+            min_reviews = parse_min_reviews_param()
+            place_fields, include = parse_projection()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        serialize = get_place_serializer(place_fields, include)
+        places = []
+        for place, score in facade.get_top_places(limit, min_reviews, include):
+            data = serialize(place)
+            data["score"] = round(score, 3)
+            places.append(data)
+
         return {
-            "id": place.id,
-            "title": place.title,
-            "description": place.description,
-            "price": place.price,
-            "picture": place.picture,
-            "latitude": place.latitude,
-            "longitude": place.longitude,
-            "owner": {
-                "id": place.owner.id,
-                "first_name": place.owner.first_name,
-                "last_name": place.owner.last_name,
-                "email": place.owner.email
-            },
-            "amenities": [
-                {
-                    "id": amenity.id,
-                    "name": amenity.name
-                } for amenity in place.amenities
-            ],
-            "reviews": [
-                {
-                    "id": review.id,
-                    "text": review.text,
-                    "rating": review.rating,
-                    "user": {
-                        "id": review.author.id,
-                        "first_name": review.author.first_name,
-                        "last_name": review.author.last_name,
-                        "email": review.author.email
-                    }
-                } for review in place.reviews
-            ]
+            "message": "Top rated places retrieved successfully",
+            "places": places
+        }, 200
+
+
+# ===================================================
+# /api/v1/places/nearby
+# Ressource pour rechercher les lieux proches d'une position
+# ===================================================
+@api.route('/nearby')
+class PlacesNearby(Resource):
+    @response_cache.cached("places")
+    @api.doc(params={
+        'lat': 'Latitude of the search center',
+        'lon': 'Longitude of the search center',
+        'radius_km': f'Search radius in kilometers (max {MAX_RADIUS_KM})',
+        'limit': f'Maximum number of places (1-{MAX_PAGE_SIZE}, default {DEFAULT_PAGE_SIZE})',
+        **projection_params
+    })
+    @api.response(200, 'Nearby places retrieved successfully')
+    @api.response(400, 'Invalid query parameters')
+    def get(self):
+        """
+        Récupère les lieux situés dans un rayon donné, du plus proche au plus éloigné.
+        """
+        try:
+            latitude = parse_float_param('lat', -90.0, 90.0, required=True)
+            longitude = parse_float_param('lon', -180.0, 180.0, required=True)
+            radius_km = parse_float_param('radius_km', 0.0, MAX_RADIUS_KM, required=True)
+            limit = parse_limit_param()
+            place_fields, include = parse_projection()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        nearby = facade.get_places_nearby(latitude, longitude, radius_km, limit, include)
+
+        serialize = get_place_serializer(place_fields, include)
+        places = []
+        for place, distance in nearby:
+            data = serialize(place)
+            data["distance_km"] = round(distance, 3)
+            places.append(data)
+
+        return {
+            "message": "Nearby places retrieved successfully",
+            "places": places
         }, 200
 
 
@@ -247,59 +542,36 @@ class PlaceSearch(Resource):
 # ===================================================
 @api.route('/user/<user_id>')
 class PlacesByUser(Resource):
+    @response_cache.cached("places")
+    @api.doc(params={
+        'limit': f'Number of places per page (1-{MAX_PAGE_SIZE}, default {DEFAULT_PAGE_SIZE})',
+        'after': 'Cursor returned as next_cursor by the previous page',
+        **projection_params
+    })
     @api.response(200, 'Places retrieved successfully for the user')
+    @api.response(400, 'Invalid query parameters')
     @api.response(404, 'User not found or has no places')
     def get(self, user_id):
         """
-        Récupère tous les lieux associés à un utilisateur (propriétaire) donné.
+        Récupère une page des lieux associés à un utilisateur (propriétaire) donné.
+        Le champ next_cursor de la réponse permet d'obtenir la page suivante.
         """
+        after = request.args.get('after')
         try:
-            places = facade.get_places_by_user(user_id)
-            if not places:
-                return {"error": "No places found for this user"}, 404
+            limit = parse_limit_param()
+            place_fields, include = parse_projection()
+            places, next_cursor = facade.get_places_by_user(user_id, limit, after, include)
+        except ValueError as e:
+            return {"error": str(e)}, 400
 
-            result = []
-            for place in places:
-                result.append({
-                    "id": place.id,
-                    "title": place.title,
-                    "description": place.description,
-                    "price": place.price,
-                    "picture": place.picture,
-                    "latitude": place.latitude,
-                    "longitude": place.longitude,
-                    "owner": {
-                        "id": place.owner.id,
-                        "first_name": place.owner.first_name,
-                        "last_name": place.owner.last_name,
-                        "email": place.owner.email
-                    },
-                    "amenities": [
-                        {
-                            "id": amenity.id,
-                            "name": amenity.name
-                        }
-                        for amenity in place.amenities
-                    ],
-                    "reviews": [
-                        {
-                            "id": review.id,
-                            "text": review.text,
-                            "rating": review.rating,
-                            "user": {
-                                "id": review.author.id,
-                                "first_name": review.author.first_name,
-                                "last_name": review.author.last_name,
-                                "email": review.author.email
-                            }
-                        }
-                        for review in place.reviews
-                    ]
-                })
+        try:
+            if not places and not after:
+                return {"error": "No places found for this user"}, 404
 
             return {
                 "message": "Places retrieved successfully for this user",
-                "places": result
+                "places": get_place_serializer(place_fields, include).many(places),
+                "next_cursor": next_cursor
             }, 200
 
         except Exception:
@@ -313,7 +585,12 @@ class PlacesByUser(Resource):
 @api.route('/<place_id>')
 class PlaceResource(Resource):
 
+    @response_cache.cached("place:{place_id}")
+    @conditional(facade.get_place_version)
+    @api.doc(params=projection_params)
     @api.response(200, 'Place details retrieved successfully')
+    @api.response(304, 'Place not modified since the ETag sent in If-None-Match')
+    @api.response(400, 'Invalid query parameters')
     @api.response(404, 'Place not found')
     @api.response(500, 'Internal server error')
     def get(self, place_id):
@@ -321,44 +598,16 @@ class PlaceResource(Resource):
         Récupère les détails d’un lieu spécifique par son ID.
         """
         try:
-            place = facade.get_place(place_id)
+            place_fields, include = parse_projection()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        try:
+            place = facade.get_place_details(place_id, include)
             if not place:
                 return {'error': 'Place not found'}, 404
 
-            return {
-                "id": place.id,
-                "title": place.title,
-                "description": place.description,
-                "price": place.price,
-                "picture": place.picture,
-                "latitude": place.latitude,
-                "longitude": place.longitude,
-                "owner": {
-                    "id": place.owner.id,
-                    "first_name": place.owner.first_name,
-                    "last_name": place.owner.last_name,
-                    "email": place.owner.email
-                },
-                "amenities": [
-                    {
-                        "id": amenity.id,
-                        "name": amenity.name
-                    } for amenity in place.amenities
-                ],
-                "reviews": [
-                    {
-                        "id": review.id,
-                        "text": review.text,
-                        "rating": review.rating,
-                        "user": {
-                            "id": review.author.id,
-                            "first_name": review.author.first_name,
-                            "last_name": review.author.last_name,
-                            "email": review.author.email
-                        }
-                    } for review in place.reviews
-                ]
-            }, 200
+            return get_place_serializer(place_fields, include)(place), 200
 
         except Exception:
             return {"error": "Internal server error"}, 500
@@ -371,6 +620,7 @@ class PlaceResource(Resource):
     @api.response(404, 'Place not found')
     @api.response(409, 'Conflict: Title already used by this owner')
     @api.response(500, 'Internal server error')
+    @unit_of_work_per_request
     def put(self, place_id):
         """
         Met à jour les informations d’un lieu par son ID.
@@ -384,7 +634,7 @@ class PlaceResource(Resource):
         claims = get_jwt()
         is_admin = claims.get('is_admin', False)
 
-        if not is_admin and str(place.owner.id) != str(current_user["id"]):
+        if not is_admin and str(place.owner_id) != str(current_user):
             return {'error': 'Unauthorized action'}, 403
 
         # - Récupération et validation du JSON
@@ -397,15 +647,13 @@ class PlaceResource(Resource):
         if "amenities" in data:
             amenities_ids = data.get("amenities")
 
-            if not isinstance(amenities_ids, list):
+            if not isinstance(amenities_ids, list) or not all(isinstance(a, str) for a in amenities_ids):
                 return {"error": "Field 'amenities' must be a list of IDs"}, 400
 
-            amenities = []
-            for amenity_id in amenities_ids:
-                amenity = facade.get_amenity(amenity_id)
-                if not amenity:
-                    return {"error": f"Amenity with id '{amenity_id}' not found"}, 400
-                amenities.append(amenity)
+            # - Résolution de toutes les amenities en une requête
+            amenities, missing = facade.get_amenities(amenities_ids)
+            if missing:
+                return {"error": f"Amenity not found: {', '.join(missing)}"}, 400
 
             # - Comparaison entre les anciennes et nouvelles amenities
             existing_ids = set(a.id for a in place.amenities)
@@ -427,23 +675,10 @@ class PlaceResource(Resource):
 
         # - Mise à jour finale via la facade
         try:
-            facade.update_place(place_id, data)
-            updated_place = facade.get_place(place_id)  # Rafraîchir les données
+            updated_place = facade.update_place(place_id, data)
 
-            return {
-                'id': updated_place.id,
-                'title': updated_place.title,
-                'description': updated_place.description,
-                'price': updated_place.price,
-                "picture": place.picture,
-                'latitude': updated_place.latitude,
-                'longitude': updated_place.longitude,
-                'owner_id': updated_place.owner.id,
-                'amenities': [
-                    {'id': amenity.id, 'name': amenity.name}
-                    for amenity in updated_place.amenities
-                ]
-            }, 200
+            serialize = get_place_serializer(UPDATED_PLACE_FIELDS, ('amenities',))
+            return serialize(updated_place), 200
 
         except (ValueError, TypeError) as e:
             error_msg = str(e)
@@ -2,6 +2,10 @@ from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from flask import request
 from app.services import facade
+from app.persistence.repository import unit_of_work_per_request
+from app.schemas import REVIEW_SCHEMA, REVIEW_UPDATE_SCHEMA
+from app.extensions import response_cache
+from app.cache import conditional
 
 api = Namespace('reviews', description='Review operations')
 
@@ -29,15 +33,17 @@ message_model = api.model('Message', {
 @api.route('/')
 class ReviewList(Resource):
     @jwt_required()
-    @api.expect(review_model, validate=True)
+    @api.expect(review_model)
     @api.response(201, 'Review successfully created')
     @api.response(400, 'Invalid input data')
     @api.marshal_with(review_output_model)
+    @unit_of_work_per_request
     def post(self):
         """Register a new review"""
-        data = api.payload
         current_user_id = get_jwt_identity()
-        data['user_id'] = current_user_id
+        # Validation de la requête en un passage (ValidationError : 400) ;
+        # l'auteur est celui du jeton
+        data = REVIEW_SCHEMA.decode(request.get_json(silent=True), user_id=current_user_id)
 
         place = facade.get_place(data['place_id'])
         if not place:
@@ -45,16 +51,18 @@ class ReviewList(Resource):
         if place.owner.id == current_user_id:
             api.abort(403, 'You cannot review your own place')
 
-        existing_reviews = facade.get_reviews_by_user(current_user_id)
-        if any(r.place_id == data['place_id'] for r in existing_reviews):
+        if facade.has_reviewed_place(current_user_id, data['place_id']):
             api.abort(409, 'You have already reviewed this place')
 
         try:
             review = facade.create_review(data)
             return review, 201
         except ValueError as e:
+            if 'already reviewed' in str(e):
+                api.abort(409, 'You have already reviewed this place')
             api.abort(400, str(e))
 
+    @response_cache.cached("reviews")
     @api.response(200, 'List of reviews retrieved successfully')
     @api.marshal_list_with(review_output_model)
     def get(self):
@@ -65,7 +73,10 @@ class ReviewList(Resource):
 
 @api.route('/<review_id>')
 class ReviewResource(Resource):
+    @response_cache.cached("review:{review_id}")
+    @conditional(facade.get_review_version)
     @api.response(200, 'Review details retrieved successfully')
+    @api.response(304, 'Review not modified since the ETag sent in If-None-Match')
     @api.response(404, 'Review not found')
     @api.marshal_with(review_output_model)
     def get(self, review_id):
@@ -76,19 +87,20 @@ class ReviewResource(Resource):
         return review, 200
 
     @jwt_required()
-    @api.expect(review_model, validate=True)
+    @api.expect(review_model)
     @api.response(200, 'Review updated successfully')
     @api.response(404, 'Review not found')
     @api.response(400, 'Invalid input data')
     @api.marshal_with(review_output_model)
+    @unit_of_work_per_request
     def put(self, review_id):
         """Update a review's information"""
 
         # Récupération de l'identité de l'utilisateur via le JWT
         user_id = get_jwt_identity()
 
-        # Récupération de l'objet User correspondant
-        user = facade.get_user(user_id)
+        # Informations d'authentification de l'utilisateur (cache à TTL court)
+        user = facade.get_user_auth(user_id)
         if not user:
             api.abort(401, "Unauthorized")
 
@@ -103,8 +115,7 @@ class ReviewResource(Resource):
 
         # Mise à jour de la review
         try:
-            data = api.payload
-            data['user_id'] = user_id  # Injection explicite
+            data = REVIEW_UPDATE_SCHEMA.decode(request.get_json(silent=True))
             updated = facade.update_review(review_id, data)
             return updated
         except ValueError as e:
@@ -117,10 +128,11 @@ class ReviewResource(Resource):
     @api.response(200, 'Review deleted successfully')
     @api.response(404, 'Review not found')
     @api.response(403, 'Unauthorized')
+    @unit_of_work_per_request
     def delete(self, review_id):
         """Delete a review"""
         user_id = get_jwt_identity()
-        user = facade.get_user(user_id)
+        user = facade.get_user_auth(user_id)
         if not user:
             api.abort(401, "Unauthorized")
 
@@ -143,7 +155,10 @@ class ReviewResource(Resource):
 
 @api.route('/places/<place_id>/reviews')
 class PlaceReviewList(Resource):
+    @response_cache.cached("reviews:place:{place_id}")
+    @conditional(facade.get_place_version)
     @api.response(200, 'List of reviews for the place retrieved successfully')
+    @api.response(304, 'Reviews not modified since the ETag sent in If-None-Match')
     @api.response(404, 'Place not found')
     @api.marshal_list_with(review_output_model)
     def get(self, place_id):
@@ -157,6 +172,7 @@ class PlaceReviewList(Resource):
 
 @api.route('/users/<string:user_id>/reviews')
 class UserReviewList(Resource):
+    @response_cache.cached("reviews:user:{user_id}")
     @api.response(200, 'List of reviews for the user retrieved successfully')
     @api.response(404, 'User not found or no reviews found')
     @api.marshal_list_with(review_output_model)
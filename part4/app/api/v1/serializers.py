@@ -0,0 +1,91 @@
+"""
+api/v1/serializers.py
+
+Sérialisation JSON des lieux (Place), partagée par tous les endpoints
+de places.py.
+
+Pour chaque combinaison de champs et de relations demandée, le sérialiseur
+est construit une seule fois : ses accesseurs (un operator.attrgetter par
+champ, une fonction par relation) sont figés, et sérialiser un
+lieu ne fait plus que les appeler, sans retester à chaque objet les champs
+et relations demandés. Les attributs non chargés (expirés, relations
+paresseuses) sont chargés par l'accès normal de SQLAlchemy.
+"""
+
+from functools import lru_cache
+from operator import attrgetter
+
+# Champs d'un lieu pouvant être renvoyés par l'API (paramètre fields=)
+PLACE_FIELDS = ('id', 'title', 'description', 'price', 'picture', 'latitude', 'longitude',
+                'review_count', 'average_rating', 'rating_histogram')
+
+# Relations pouvant être embarquées dans un lieu (paramètre include=)
+PLACE_RELATIONS = ('owner', 'amenities', 'reviews')
+
+USER_FIELDS = ('id', 'first_name', 'last_name', 'email')
+AMENITY_FIELDS = ('id', 'name')
+REVIEW_FIELDS = ('id', 'text', 'rating')
+
+
+def make_serializer(fields, extra=()):
+    """
+    Construit une fonction obj -> {champ: valeur} pour les champs donnés.
+
+    Paramètres :
+    - fields (tuple) : attributs copiés tels quels
+    - extra (list) : couples (clé, fonction obj -> valeur) ajoutés après les champs
+    """
+    getters = tuple((field, attrgetter(field)) for field in fields) + tuple(extra)
+
+    def serialize(obj):
+        return {key: get(obj) for key, get in getters}
+    return serialize
+
+
+serialize_user = make_serializer(USER_FIELDS)
+serialize_amenity = make_serializer(AMENITY_FIELDS)
+serialize_review = make_serializer(
+    REVIEW_FIELDS, extra=[("user", lambda review: serialize_user(review.author))]
+)
+
+# Valeur de chaque relation embarquée dans un lieu
+_RELATION_GETTERS = {
+    'owner': lambda place: serialize_user(place.owner),
+    'amenities': lambda place: [serialize_amenity(amenity) for amenity in place.amenities],
+    'reviews': lambda place: [serialize_review(review) for review in place.reviews],
+}
+
+
+class PlaceSerializer:
+    """
+    Sérialiseur de lieux construit pour un ensemble de champs et de relations.
+
+    Paramètres :
+    - fields (tuple) : attributs du lieu à renvoyer
+    - include (tuple) : relations à embarquer parmi owner, amenities, reviews
+    """
+
+    def __init__(self, fields=PLACE_FIELDS, include=PLACE_RELATIONS):
+        self.fields = tuple(fields)
+        self.include = tuple(relation for relation in PLACE_RELATIONS if relation in include)
+        self._serialize = make_serializer(
+            self.fields, extra=[(relation, _RELATION_GETTERS[relation]) for relation in self.include]
+        )
+
+    def __call__(self, place):
+        return self._serialize(place)
+
+    def many(self, places):
+        """Sérialise une liste de lieux."""
+        serialize = self._serialize
+        return [serialize(place) for place in places]
+
+
+@lru_cache(maxsize=128)
+def get_place_serializer(fields=PLACE_FIELDS, include=PLACE_RELATIONS):
+    """
+    Retourne le sérialiseur pour (fields, include), créé au premier appel.
+    fields et include doivent être des tuples.
+    """
+    return PlaceSerializer(fields, include)
+
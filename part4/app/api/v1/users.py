@@ -1,5 +1,7 @@
 from flask_restx import Namespace, Resource, fields
 from app.services import facade
+from app.persistence.repository import unit_of_work_per_request
+from app.schemas import USER_SCHEMA, USER_UPDATE_SCHEMA
 from flask import request
 from flask_jwt_extended import (
     jwt_required,
@@ -30,18 +32,20 @@ user_output_model = api.model('UserOutput', {
 @api.route('/')
 class UserList(Resource):
     @jwt_required()
-    @api.expect(user_input_model, validate=True)
+    @api.expect(user_input_model)
     @api.response(201, 'User successfully created')
     @api.response(400, 'Email already registered')
     @api.response(400, 'Invalid input data')
     @api.marshal_with(user_output_model)
+    @unit_of_work_per_request
     def post(self):
         """Create a new user (admin only)"""
         claims = get_jwt()
         if not claims.get('is_admin'):
             return {'error': 'Admin privileges required'}, 403
 
-        user_data = api.payload
+        # Validation de la requête en un passage (ValidationError : 400)
+        user_data = USER_SCHEMA.decode(request.get_json(silent=True))
 
         # Vérifie l'unicité de l'email
         existing_user = facade.get_user_by_email(user_data['email'])
@@ -94,12 +98,13 @@ class UserResource(Resource):
         return user, 200
 
     @jwt_required()
-    @api.expect(user_input_model, validate=False)
+    @api.expect(user_input_model)
     @api.marshal_with(user_output_model)
     @api.response(200, 'User successfully updated')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Forbidden')
     @api.response(404, 'User not found')
+    @unit_of_work_per_request
     def put(self, user_id):
         """Update a user (admin or self)"""
         identity = get_jwt_identity()  # str(user.id)
@@ -114,7 +119,7 @@ class UserResource(Resource):
         if not is_admin and user.id != current_user_id:
             api.abort(403, "Unauthorized action")
 
-        user_data = api.payload
+        user_data = USER_UPDATE_SCHEMA.decode(request.get_json(silent=True))
 
         # Gestion de la modification de l'email
         if 'email' in user_data:
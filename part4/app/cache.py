@@ -0,0 +1,226 @@
+"""app/cache.py
+
+Cache des réponses des endpoints de lecture.
+
+Les réponses sont indexées par route et paramètres de requête normalisés,
+évincées par ancienneté d'utilisation (LRU) au-delà d'un nombre maximum
+d'entrées, et expirées après une durée de vie (TTL).
+
+Chaque réponse porte des étiquettes (ex. "places", "place:<id>") : les
+mutations de HBnBFacade invalident uniquement les étiquettes concernées.
+Les invalidations ne touchent que le cache du processus qui a fait la
+mutation : une réponse mise en cache ailleurs avant la mutation y reste
+servie jusqu'à son expiration, au plus RESPONSE_CACHE_TTL secondes après
+avoir été calculée.
+
+Le module fournit aussi les requêtes conditionnelles (ETag / If-None-Match) :
+le client qui possède déjà la version courante d'une ressource reçoit une
+réponse 304 sans corps, calculée avant tout chargement de la ressource.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from urllib.parse import urlencode
+
+from flask import current_app, request
+from werkzeug.http import quote_etag
+
+# Nombre maximum de réponses gardées en cache
+DEFAULT_MAX_ENTRIES = 1024
+
+# Durée de vie d'une réponse en cache, en secondes
+DEFAULT_TTL = 30
+
+
+class ResponseCache:
+    """
+    Cache LRU + TTL de réponses, avec invalidation par étiquettes.
+    Une taille maximale ou un TTL nul désactive le cache.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # clé -> (expiration, réponse, étiquettes)
+        self._tags = {}                # étiquette -> ensemble de clés
+
+    def init_app(self, app):
+        """Lit la configuration de l'application et vide le cache."""
+        self.max_entries = app.config.get("RESPONSE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        self.ttl = app.config.get("RESPONSE_CACHE_TTL", DEFAULT_TTL)
+        self.clear()
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0 and self.ttl > 0
+
+    # ========== LECTURE ET ÉCRITURE ==========
+
+    def get(self, key):
+        """Retourne la réponse en cache pour key, ou None (absente ou expirée)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key, response, tags=()):
+        """
+        Met une réponse en cache sous key, avec ses étiquettes d'invalidation.
+        Évince les réponses les moins récemment utilisées au-delà de max_entries.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._remove(key)
+            tags = frozenset(tags)
+            self._entries[key] = (time.monotonic() + self.ttl, response, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, *tags):
+        """Supprime toutes les réponses portant l'une des étiquettes données."""
+        with self._lock:
+            for tag in tags:
+                for key in self._tags.pop(tag, ()):
+                    self._remove(key)
+
+    def clear(self):
+        """Vide entièrement le cache."""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ========== DÉCORATEUR D'ENDPOINT ==========
+
+    @staticmethod
+    def make_key():
+        """
+        Clé de la requête courante : route + paramètres triés
+        (l'ordre des paramètres dans l'URL n'a pas d'influence).
+        """
+        return request.path + "?" + urlencode(sorted(request.args.items(multi=True)))
+
+    def cached(self, *tags):
+        """
+        Décorateur mettant en cache les réponses 200 d'une méthode de Resource.
+
+        Les étiquettes peuvent référencer les paramètres de la route,
+        ex. "place:{place_id}". Le décorateur doit être placé au-dessus de
+        marshal_with, afin de mettre en cache la réponse déjà sérialisée.
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return view(*args, **kwargs)
+
+                key = self.make_key()
+                response = self.get(key)
+                if response is not None:
+                    etag = _response_etag(response)
+                    if etag is not None and etag in request.if_none_match:
+                        return not_modified(etag)
+                    return response
+
+                response = view(*args, **kwargs)
+                if _is_success(response):
+                    self.set(key, response, (tag.format(**kwargs) for tag in tags))
+                return response
+            return wrapper
+        return decorator
+
+
+def _is_success(response):
+    """Seules les réponses (données, 200) ou données seules sont mises en cache."""
+    if isinstance(response, tuple):
+        return len(response) >= 2 and response[1] == 200
+    return isinstance(response, (dict, list))
+
+
+# ========== REQUÊTES CONDITIONNELLES ==========
+
+def make_etag(*parts):
+    """ETag fort (non entouré de guillemets) calculé à partir des parts données."""
+    return hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+def etag_headers(etag):
+    """
+    En-têtes d'une réponse portant un ETag : no-cache impose au client de
+    revalider (If-None-Match) à chaque affichage, sans retélécharger le corps.
+    """
+    return {"ETag": quote_etag(etag), "Cache-Control": "no-cache"}
+
+
+def not_modified(etag):
+    """Réponse 304 sans corps pour l'ETag donné."""
+    return current_app.response_class(status=304, headers=etag_headers(etag))
+
+
+def _response_etag(response):
+    if isinstance(response, tuple) and len(response) == 3 and response[2]:
+        etag = response[2].get("ETag")
+        if etag:
+            return etag.strip('"')
+    return None
+
+
+def conditional(get_version):
+    """
+    Décorateur de méthode de Resource gérant ETag / If-None-Match.
+
+    get_version(**paramètres de la route) retourne l'état de version de la
+    ressource (ex. (updated_at, version)) ou None si elle n'existe pas.
+    L'ETag combine cet état et la requête (route + paramètres triés) : deux
+    projections d'une même ressource ont des ETag différents.
+    Si le client possède déjà cet ETag, une réponse 304 est renvoyée sans
+    appeler la vue. Doit être placé au-dessus de marshal_with.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            version = get_version(**kwargs)
+            if version is None:
+                return view(*args, **kwargs)
+
+            etag = make_etag(ResponseCache.make_key(), *version)
+            if etag in request.if_none_match:
+                return not_modified(etag)
+
+            response = view(*args, **kwargs)
+            if not isinstance(response, tuple):
+                response = (response, 200)
+            data, code = response[0], response[1]
+            if code != 200:
+                return response
+            headers = dict(response[2]) if len(response) > 2 and response[2] else {}
+            headers.update(etag_headers(etag))
+            return data, code, headers
+        return wrapper
+    return decorator
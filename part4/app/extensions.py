@@ -1,8 +1,10 @@
-from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 from flask_sqlalchemy import SQLAlchemy
+from app.cache import ResponseCache
+from app.passwords import PasswordHasher
 
 # Initialize extensions
 db = SQLAlchemy()
-bcrypt = Bcrypt()
 jwt = JWTManager()
+response_cache = ResponseCache()
+password_hasher = PasswordHasher()
@@ -0,0 +1,118 @@
+"""
+app/json_provider.py
+
+Fournisseur JSON de l'application, choisi par JSON_PROVIDER (config.py) :
+- "orjson" : encodage et décodage par orjson (dépendance optionnelle),
+  nettement plus rapides que le module json sur les listes de lieux ;
+- "json" : module json de la bibliothèque standard ;
+- "auto" : orjson s'il est installé, json sinon.
+
+Le fournisseur (app.json) sert à Flask pour lire le corps des requêtes
+(request.get_json) et à toutes les réponses de flask-restx, dont la
+représentation application/json est remplacée par output_json.
+
+Dans les deux cas, les clés sont écrites dans l'ordre des dictionnaires
+(comme l'encodage d'origine de flask-restx) et les dates au format HTTP de
+DefaultJSONProvider (orjson écrirait sinon de l'ISO 8601) : changer de
+fournisseur ne change pas le contenu des réponses, seulement leur encodage
+(orjson écrit l'UTF-8 sans échappement \\uXXXX).
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+from werkzeug.http import http_date
+
+try:
+    import orjson
+except ImportError:  # dépendance optionnelle
+    orjson = None
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """Module json de la bibliothèque standard, sans tri des clés."""
+
+    sort_keys = False
+
+
+def _default(obj):
+    """
+    Types non gérés nativement par orjson, ou dont l'encodage natif diffère
+    de celui de DefaultJSONProvider (dates).
+    """
+    if isinstance(obj, date):
+        return http_date(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Fournisseur JSON basé sur orjson.
+
+    Les réponses sont indentées en mode debug (ou si compact vaut False),
+    comme avec DefaultJSONProvider.
+    """
+
+    compact = None
+    mimetype = "application/json"
+
+    def encode(self, obj, indent=False, sort_keys=False):
+        """Encode obj en bytes UTF-8 (sans passer par une chaîne Python)."""
+        # Dates confiées à _default, comme avec DefaultJSONProvider
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self.encode(obj, bool(kwargs.get("indent")), kwargs.get("sort_keys", False)).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self.encode(obj, indent) + b"\n", mimetype=self.mimetype)
+
+
+JSON_PROVIDERS = {
+    "json": StdlibJSONProvider,
+    "orjson": OrjsonProvider,
+}
+
+
+def make_json_provider(app):
+    """
+    Construit le fournisseur JSON désigné par app.config["JSON_PROVIDER"].
+    Lève une ValueError si le nom est inconnu ou si orjson est demandé
+    sans être installé.
+    """
+    name = app.config.get("JSON_PROVIDER", "auto")
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    if name not in JSON_PROVIDERS:
+        raise ValueError(f"Unknown JSON provider: {name!r} (expected one of: auto, {', '.join(JSON_PROVIDERS)})")
+    if name == "orjson" and orjson is None:
+        raise ValueError("JSON_PROVIDER 'orjson' requires the orjson package")
+    return JSON_PROVIDERS[name](app)
+
+
+def output_json(data, code, headers=None):
+    """
+    Représentation application/json de flask-restx, encodée par le
+    fournisseur JSON de l'application (remplace celle de flask-restx,
+    fondée sur le module json).
+    """
+    response = current_app.json.response(data)
+    response.status_code = code
+    response.headers.extend(headers or {})
+    return response
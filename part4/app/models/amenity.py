@@ -32,11 +32,13 @@ class Amenity(BaseModel):
     name = db.Column(db.String(50), nullable=False)
 
     # Relation vers Place (many-to-many, via table d'association)
+    # Chargée seulement à l'accès ; préchargement sur demande dans les
+    # repositories (load=("places",))
     places = db.relationship(
         "Place",
         secondary=place_amenity,
         back_populates="amenities",
-        lazy="subquery"
+        lazy="select"
     )
 
     def validate_name(self, value, field_name):
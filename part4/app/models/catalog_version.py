@@ -0,0 +1,29 @@
+"""models/catalog_version.py
+
+Compteurs de version des catalogues tenus en mémoire par chaque processus
+(ex. le catalogue des commodités).
+
+Chaque écriture d'un catalogue incrémente son compteur dans la même
+transaction ; un processus qui lit une version différente de celle de sa
+copie en mémoire sait qu'il doit la recharger.
+"""
+
+from app.extensions import db
+
+
+class CatalogVersion(db.Model):
+    """
+    Version d'un catalogue.
+
+    Attributs :
+    - name (str) : nom du catalogue (clé primaire, ex. "amenities")
+    - version (int) : incrémenté à chaque modification du catalogue
+    """
+
+    __tablename__ = "catalog_versions"
+
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<CatalogVersion {self.name}={self.version}>"
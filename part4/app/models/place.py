@@ -6,6 +6,7 @@ Hérite de BaseModel qui fournit id, created_at, updated_at.
 
 from app import db
 from app.models.base import BaseModel
+from app.schemas import PLACE_UPDATE_SCHEMA
 # Import requis pour les ForeignKey vers User et la table d'association Place-Amenity
 from app.models.amenity import place_amenity
 
@@ -20,9 +21,29 @@ class Place(BaseModel):
     - price (float) : prix par nuit (obligatoire)
     - latitude (float) : latitude géographique (facultatif)
     - longitude (float) : longitude géographique (facultatif)
+    - geohash (str) : cellule géographique de la position (index spatial)
+    - review_count (int) : nombre d'avis sur le lieu
+    - rating_sum (int) : somme des notes des avis
+    - rating_1 ... rating_5 (int) : nombre d'avis par note (histogramme)
+    - version (int) : compteur incrémenté quand un contenu embarqué change
+      (avis, commodités, propriétaire), utilisé pour les ETag
     """
 
     __tablename__ = "places"
+    __table_args__ = (
+        # Pagination par curseur : tri par date de création puis par prix
+        db.Index("idx_places_created_at", "created_at", "id"),
+        db.Index("idx_places_price", "price", "id"),
+        # Recherche géographique par préfixe de geohash
+        db.Index("idx_places_geohash", "geohash"),
+        # Lieux d'un propriétaire, dans l'ordre de la pagination par curseur
+        db.Index("idx_places_owner", "owner_id", "created_at", "id"),
+        # Recherche par titre et unicité du titre pour un même propriétaire
+        db.Index("idx_places_title", "title"),
+        # Relecture des lieux modifiés par les structures en mémoire des processus
+        db.Index("idx_places_updated_at", "updated_at"),
+        db.UniqueConstraint("owner_id", "title", name="unique_owner_place_title"),
+    )
 
     # Colonnes de base
     title = db.Column(db.String(100), nullable=False)
@@ -31,6 +52,22 @@ class Place(BaseModel):
     picture = db.Column(db.String(1024), nullable=True)
     latitude = db.Column(db.Float, nullable=True)
     longitude = db.Column(db.Float, nullable=True)
+    # Geohash de (latitude, longitude), tenu à jour par HBnBFacade
+    geohash = db.Column(db.String(12), nullable=True)
+
+    # Agrégats des avis, tenus à jour par HBnBFacade dans la même transaction
+    # que l'avis créé, modifié ou supprimé
+    review_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    rating_1 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    rating_2 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    rating_3 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    rating_4 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    rating_5 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    # Version des contenus embarqués dans la représentation du lieu,
+    # incrémentée par HBnBFacade (voir bump_version)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     # Clé étrangère vers User (relation User → Place)
     owner_id = db.Column(db.String(60), db.ForeignKey('users.id'), nullable=False)
@@ -41,81 +78,82 @@ class Place(BaseModel):
     )
 
     # Relation Place ↔ Amenity (plusieurs-à-plusieurs)
+    # Chargée seulement à l'accès ; préchargement sur demande dans les
+    # repositories (load=("amenities",), listing_options)
     amenities = db.relationship(
         "Amenity",
         secondary=place_amenity,
         back_populates="places",
-        lazy="subquery"
+        lazy="select"
     )
 
-    # ========== MÉTHODES DE VALIDATION ==========
-
-    def validate_title(self, value, field_name):
-        if not isinstance(value, str):
-            raise TypeError(f"{field_name} must be a string")
-        value = value.strip()
-        if not value:
-            raise ValueError(f"{field_name} is required")
-        if len(value) > 100:
-            raise ValueError(f"{field_name} must be at most 100 characters")
-        return value
-
-    def validate_description(self, value, field_name):
-        if not isinstance(value, str):
-            raise TypeError(f"{field_name} must be a string")
-        value = value.strip()
-        if not value:
-            raise ValueError(f"{field_name} is required")
-        return value
-
-    def validate_price(self, value, field_name):
-        if isinstance(value, bool) or not isinstance(value, (float, int)):
-            raise TypeError(f"{field_name} must be a float or int")
-        if value <= 0:
-            raise ValueError(f"{field_name} must be greater than 0")
-        return float(value)
-
-    def validate_picture(self, value, field_name):
-        if not isinstance(value, str):
-            raise TypeError(f"{field_name} must be a string")
-        value = value.strip()
-        if not value:
-            raise ValueError(f"{field_name} is required")
-        return value
-
-    def validate_latitude(self, value, field_name):
-        if value is None:
-            return None
-        if not isinstance(value, float):
-            raise TypeError(f"{field_name} must be a float")
-        if not (-90.0 <= value <= 90.0):
-            raise ValueError(f"{field_name} must be between -90.0 and 90.0")
-        return value
-
-    def validate_longitude(self, value, field_name):
-        if value is None:
-            return None
-        if not isinstance(value, float):
-            raise TypeError(f"{field_name} must be a float")
-        if not (-180.0 <= value <= 180.0):
-            raise ValueError(f"{field_name} must be between -180.0 and 180.0")
-        return value
-
     # ========== MÉTHODES MÉTIER ==========
 
-    def update(self, **kwargs):
-        """Met à jour les champs du modèle avec validation"""
-        for key, value in kwargs.items():
-            if key == "title":
-                self.title = self.validate_title(value, "Title")
-            elif key == "description":
-                self.description = self.validate_description(value, "Description")
-            elif key == "price":
-                self.price = self.validate_price(value, "Price")
-            elif key == "latitude":
-                self.latitude = self.validate_latitude(value, "Latitude")
-            elif key == "longitude":
-                self.longitude = self.validate_longitude(value, "Longitude")
+    def update(self, data):
+        """Met à jour les champs du modèle, validés par PLACE_UPDATE_SCHEMA"""
+        for key, value in PLACE_UPDATE_SCHEMA.decode(data).items():
+            setattr(self, key, value)
+
+    def add_amenity(self, amenity):
+        """Ajoute une commodité au lieu, si elle n'y est pas déjà"""
+        if amenity not in self.amenities:
+            self.amenities.append(amenity)
+
+    def bump_version(self):
+        """
+        Signale un changement d'un contenu embarqué (avis, commodités).
+        L'incrément est fait en SQL (SET version = version + 1).
+        """
+        self.version = Place.version + 1
+
+    def add_rating(self, rating):
+        """Compte une nouvelle note dans les agrégats du lieu"""
+        self._apply_rating_deltas({f"rating_{rating}": 1, "review_count": 1, "rating_sum": rating}, rating)
+
+    def remove_rating(self, rating):
+        """Retire une note des agrégats du lieu"""
+        self._apply_rating_deltas({f"rating_{rating}": -1, "review_count": -1, "rating_sum": -rating}, rating)
+
+    def replace_rating(self, old_rating, new_rating):
+        """Remplace une note par une autre dans les agrégats du lieu"""
+        if old_rating == new_rating:
+            return
+        self._apply_rating_deltas({
+            f"rating_{old_rating}": -1,
+            f"rating_{new_rating}": 1,
+            "rating_sum": new_rating - old_rating,
+        }, old_rating, new_rating)
+
+    def _apply_rating_deltas(self, deltas, *ratings):
+        """
+        Applique les variations sous forme d'expressions SQL
+        (SET review_count = review_count + 1, ...) : deux avis enregistrés
+        en même temps ne peuvent pas écraser la mise à jour l'un de l'autre.
+        Une seule variation par lieu doit être appliquée avant le flush.
+        """
+        for rating in ratings:
+            if not (1 <= rating <= 5):
+                raise ValueError("Rating must be between 1 and 5")
+        for column, delta in deltas.items():
+            setattr(self, column, getattr(Place, column) + delta)
+
+    @property
+    def average_rating(self):
+        """Note moyenne du lieu, ou None s'il n'a aucun avis"""
+        if not self.review_count:
+            return None
+        return round(self.rating_sum / self.review_count, 2)
+
+    @property
+    def rating_histogram(self):
+        """Nombre d'avis par note, indexé de '1' à '5'"""
+        return {
+            "1": self.rating_1 or 0,
+            "2": self.rating_2 or 0,
+            "3": self.rating_3 or 0,
+            "4": self.rating_4 or 0,
+            "5": self.rating_5 or 0,
+        }
 
     def __repr__(self):
         return f"<Place {self.id}: {self.title}>"
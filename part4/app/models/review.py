@@ -6,6 +6,7 @@ Hérite de BaseModel. Cette version mappe les relations avec User et Place.
 
 from app import db
 from app.models.base import BaseModel
+from app.schemas import REVIEW_UPDATE_SCHEMA
 
 
 class Review(BaseModel):
@@ -25,6 +26,12 @@ class Review(BaseModel):
     """
 
     __tablename__ = "reviews"
+    __table_args__ = (
+        # Un seul avis par utilisateur et par lieu ; sert aussi d'index pour user_id
+        db.UniqueConstraint("user_id", "place_id", name="unique_user_place_review"),
+        # Avis d'un lieu
+        db.Index("idx_reviews_place", "place_id"),
+    )
 
     text = db.Column(db.String(500), nullable=False)
     rating = db.Column(db.Integer, nullable=False)
@@ -36,23 +43,6 @@ class Review(BaseModel):
 
     # ========== VALIDATIONS ==========
 
-    def validate_text(self, value, field_name):
-        if not isinstance(value, str):
-            raise TypeError(f"{field_name} must be a string")
-        value = value.strip()
-        if not value:
-            raise ValueError(f"{field_name} is required")
-        if len(value) > 500:
-            raise ValueError(f"{field_name} must be at most 500 characters")
-        return value
-
-    def validate_rating(self, value, field_name):
-        if not isinstance(value, int):
-            raise TypeError(f"{field_name} must be an integer")
-        if not (1 <= value <= 5):
-            raise ValueError(f"{field_name} must be between 1 and 5")
-        return value
-
     def validate_author(self, value, field_name):
         from app.models.user import User
         if not isinstance(value, User):
@@ -68,12 +58,11 @@ class Review(BaseModel):
     # ========== MÉTHODES MÉTIER ==========
 
     def update(self, **kwargs):
+        # Texte et note validés par REVIEW_UPDATE_SCHEMA
+        for key, value in REVIEW_UPDATE_SCHEMA.decode(kwargs).items():
+            setattr(self, key, value)
         for key, value in kwargs.items():
-            if key == "text":
-                self.text = self.validate_text(value, "Text")
-            elif key == "rating":
-                self.rating = self.validate_rating(value, "Rating")
-            elif key == "author":
+            if key == "author":
                 self.user_id = self.validate_author(value, "Author").id
             elif key == "place":
                 self.place_id = self.validate_place(value, "Place").id
@@ -0,0 +1,37 @@
+"""models/revoked_token.py
+
+Modèle SQLAlchemy des jetons JWT révoqués (jetons de rafraîchissement
+déjà utilisés lors d'une rotation).
+Hérite de BaseModel qui fournit id, created_at, updated_at.
+"""
+
+from app import db
+from app.models.base import BaseModel
+
+
+class RevokedToken(BaseModel):
+    """
+    Jeton JWT révoqué, identifié par son jti.
+
+    Attributs :
+    - jti (str) : identifiant unique du jeton (unique : un jeton ne peut
+      être révoqué, donc consommé, qu'une seule fois)
+    - user_id (str) : identité portée par le jeton
+    - expires_at (datetime) : expiration du jeton ; au-delà, il est refusé
+      de toute façon et n'a plus besoin d'être chargé en mémoire.
+      None pour un jeton sans expiration (JWT_REFRESH_TOKEN_EXPIRES = False) :
+      sa révocation est gardée indéfiniment
+    """
+
+    __tablename__ = "revoked_tokens"
+    __table_args__ = (
+        # Chargement des révocations encore utiles au démarrage
+        db.Index("idx_revoked_tokens_expires_at", "expires_at"),
+    )
+
+    jti = db.Column(db.String(36), nullable=False, unique=True)
+    user_id = db.Column(db.String(60), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<RevokedToken {self.jti}>"
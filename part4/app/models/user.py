@@ -7,10 +7,9 @@ liés à l'identité de l'utilisateur.
 
 # Imports nécessaires
 import re
-from app.extensions import db
+from app.extensions import db, password_hasher
 from app.models.base import BaseModel
-from flask_bcrypt import Bcrypt  # Import nécessaire pour les méthodes de hachage
-bcrypt = Bcrypt()
+from app.schemas import USER_UPDATE_SCHEMA
 
 
 class User(BaseModel):
@@ -45,45 +44,15 @@ class User(BaseModel):
         "Review", backref="author", lazy=True, cascade="all, delete-orphan"
     )
 
-    def validate_name(self, value, field_name):
-        """Valide un nom (prénom ou nom) : type str, non vide, max 50 caractères."""
-        if not isinstance(value, str):
-            raise TypeError(f"{field_name} must be a string")
-        value = value.strip()
-        if not value:
-            raise ValueError(f"{field_name} is required")
-        if len(value) > 50:
-            raise ValueError(f"{field_name} must be at most 50 characters")
-        return value
-
-    def validate_email(self, value):
-        """Valide une adresse email : type str, non vide, format standard."""
-        if not isinstance(value, str):
-            raise TypeError("Email must be a string")
-        value = value.strip().lower()
-        if not value:
-            raise ValueError("Email is required")
-        if value.count("@") != 1:
-            raise ValueError("Email must contain exactly one '@'")
-        if not re.match(r"^[^@]+@[^@]+\.[^@]+$", value):
-            raise ValueError("Invalid email format")
-        return value
-
     def update(self, data):
         """
         Met à jour les champs autorisés de l'utilisateur à partir d'un dictionnaire,
         en appliquant les règles de validation métier si nécessaire.
         """
-        for key, value in data.items():
-            if key == "email":
-                self.email = self.validate_email(value)
-            elif key == "first_name":
-                self.first_name = self.validate_name(value, "First name")
-            elif key == "last_name":
-                self.last_name = self.validate_name(value, "Last name")
-            elif key == "is_admin":
-                self.is_admin = bool(value)
-            elif hasattr(self, key):
+        for key, value in USER_UPDATE_SCHEMA.decode(data).items():
+            if key == "password":
+                self.hash_password(value)
+            else:
                 setattr(self, key, value)
 
         self.save()
@@ -92,6 +61,8 @@ class User(BaseModel):
         """
         Hash le mot de passe avec bcrypt après avoir appliqué
         une politique de sécurité stricte.
+        Le calcul est confié au pool de hachage (voir app/passwords.py) ;
+        lève PasswordHasherBusy si celui-ci est saturé.
         """
         if not isinstance(password, str):
             raise TypeError("Password must be a string")
@@ -111,18 +82,19 @@ class User(BaseModel):
         if not re.search(r"[^\w\s]", password):
             raise ValueError("Password must contain at least one special character")
 
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+        self.password = password_hasher.hash(password)
         self.save()
 
     def verify_password(self, password):
         """
         Vérifie si le mot de passe en clair correspond au hash stocké.
+        Lève PasswordHasherBusy si le pool de hachage est saturé.
         """
         if not self.password:
             raise ValueError("Password is not set")
         if not isinstance(password, str):
             raise TypeError("Password must be a string")
-        return bcrypt.check_password_hash(self.password, password)
+        return password_hasher.verify(password, self.password)
 
     def __repr__(self):
         """Représentation technique de l'utilisateur (debug)."""
@@ -0,0 +1,113 @@
+"""app/passwords.py
+
+Hachage et vérification des mots de passe avec bcrypt.
+
+bcrypt est volontairement coûteux (plusieurs centaines de millisecondes au
+facteur de coût 12) : exécuté dans le thread de la requête, une rafale de
+connexions occupe tous les workers et bloque les requêtes rapides.
+
+Les calculs sont donc confiés à un pool de processus de taille limitée.
+Le nombre d'opérations en cours ou en attente est lui aussi limité : au-delà,
+PasswordHasherBusy est levée immédiatement (réponse 503) plutôt que de
+laisser s'accumuler les requêtes.
+
+Sans pool (taille 0, ou hors application Flask), le calcul est fait dans
+le thread appelant.
+"""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import bcrypt
+
+# Facteur de coût bcrypt (2^rounds itérations)
+DEFAULT_LOG_ROUNDS = 12
+
+# Nombre de processus du pool (0 : calcul dans le thread appelant)
+DEFAULT_POOL_SIZE = 0
+
+# Nombre maximal d'opérations en cours ou en attente dans le pool
+DEFAULT_MAX_PENDING = 32
+
+
+class PasswordHasherBusy(Exception):
+    """Levée lorsque la file d'attente du pool de hachage est pleine."""
+
+    def __init__(self, message="Too many concurrent password operations, retry later"):
+        super().__init__(message)
+
+
+def _hash_password(password, log_rounds):
+    """Hache un mot de passe (exécuté dans un processus du pool)."""
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(log_rounds)).decode("utf-8")
+
+
+def _check_password(password, hashed):
+    """Compare un mot de passe à son hash (exécuté dans un processus du pool)."""
+    return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+
+
+class PasswordHasher:
+    """
+    Hachage bcrypt exécuté dans un pool de processus borné.
+
+    Paramètres :
+    - log_rounds (int) : facteur de coût bcrypt
+    - pool_size (int) : nombre de processus (0 : pas de pool)
+    - max_pending (int) : nombre maximal d'opérations en cours ou en attente
+    """
+
+    def __init__(self, log_rounds=DEFAULT_LOG_ROUNDS, pool_size=DEFAULT_POOL_SIZE,
+                 max_pending=DEFAULT_MAX_PENDING):
+        self._lock = threading.Lock()
+        self._pool = None
+        self.configure(log_rounds, pool_size, max_pending)
+
+    def init_app(self, app):
+        """Lit la configuration de l'application ; le pool est créé au premier usage."""
+        self.configure(
+            app.config.get("BCRYPT_LOG_ROUNDS", DEFAULT_LOG_ROUNDS),
+            app.config.get("PASSWORD_HASH_POOL_SIZE", DEFAULT_POOL_SIZE),
+            app.config.get("PASSWORD_HASH_MAX_PENDING", DEFAULT_MAX_PENDING)
+        )
+
+    def configure(self, log_rounds, pool_size, max_pending):
+        """Applique une configuration, en arrêtant le pool précédent."""
+        self.shutdown()
+        self.log_rounds = log_rounds
+        self.pool_size = pool_size
+        self.max_pending = max(max_pending, pool_size)
+        self._slots = threading.BoundedSemaphore(self.max_pending) if pool_size > 0 else None
+
+    def shutdown(self):
+        """Arrête le pool de processus, s'il existe."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    # ========== OPÉRATIONS ==========
+
+    def hash(self, password):
+        """Retourne le hash bcrypt ($2b$...) d'un mot de passe."""
+        return self._run(_hash_password, password, self.log_rounds)
+
+    def verify(self, password, hashed):
+        """Indique si le mot de passe correspond au hash bcrypt donné."""
+        return self._run(_check_password, password, hashed)
+
+    def _run(self, func, *args):
+        if self._slots is None:
+            return func(*args)
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy()
+        try:
+            return self._get_pool().submit(func, *args).result()
+        finally:
+            self._slots.release()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.pool_size)
+            return self._pool
@@ -0,0 +1,162 @@
+"""persistence/geo.py
+
+Outils géographiques pour l'index spatial des lieux (Place).
+
+Chaque lieu stocke le geohash de sa position (colonne places.geohash, indexée).
+Un geohash découpe la Terre en cellules imbriquées : tous les points d'une
+cellule partagent le même préfixe. Une zone de recherche est donc couverte
+par quelques préfixes, chacun lu par un simple parcours d'intervalle sur
+l'index, sans jamais parcourir toute la table.
+"""
+
+import math
+
+# Alphabet base 32 utilisé par les geohash
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Précision stockée en base (~4,8 m x 4,8 m)
+GEOHASH_PRECISION = 9
+
+# Nombre maximum de cellules utilisées pour couvrir une zone de recherche
+MAX_COVERING_CELLS = 16
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """
+    Calcule le geohash d'une position.
+    Retourne None si la latitude ou la longitude est absente.
+    """
+    if latitude is None or longitude is None:
+        return None
+
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    geohash = []
+    bits = 0
+    bit_count = 0
+    even = True  # les bits pairs codent la longitude
+
+    while len(geohash) < precision:
+        value, value_range = (longitude, lon_range) if even else (latitude, lat_range)
+        middle = (value_range[0] + value_range[1]) / 2
+        if value >= middle:
+            bits = (bits << 1) | 1
+            value_range[0] = middle
+        else:
+            bits = bits << 1
+            value_range[1] = middle
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(geohash)
+
+
+def cell_size(precision):
+    """
+    Retourne (hauteur en latitude, largeur en longitude) en degrés
+    d'une cellule geohash de la précision donnée.
+    """
+    total_bits = 5 * precision
+    lon_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def split_bbox(bbox):
+    """
+    Découpe une bbox (min_lon, min_lat, max_lon, max_lat) qui traverse
+    l'antiméridien (min_lon > max_lon) en deux bbox ordinaires.
+    """
+    min_lon, min_lat, max_lon, max_lat = bbox
+    if min_lon <= max_lon:
+        return [bbox]
+    return [(min_lon, min_lat, 180.0, max_lat), (-180.0, min_lat, max_lon, max_lat)]
+
+
+def _cell_range(low, high, origin, step, count):
+    first = min(int((low - origin) // step), count - 1)
+    last = min(int((high - origin) // step), count - 1)
+    return range(max(first, 0), max(last, 0) + 1)
+
+
+def covering_prefixes(bbox, max_cells=MAX_COVERING_CELLS):
+    """
+    Retourne la liste des préfixes geohash couvrant une bbox
+    (min_lon, min_lat, max_lon, max_lat).
+
+    La précision la plus fine donnant au plus max_cells cellules est choisie :
+    les lieux candidats sont ceux dont le geohash commence par l'un des préfixes.
+    """
+    boxes = split_bbox(bbox)
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_step, lon_step = cell_size(precision)
+        lat_cells = round(180.0 / lat_step)
+        lon_cells = round(360.0 / lon_step)
+
+        ranges = [
+            (_cell_range(min_lat, max_lat, -90.0, lat_step, lat_cells),
+             _cell_range(min_lon, max_lon, -180.0, lon_step, lon_cells))
+            for min_lon, min_lat, max_lon, max_lat in boxes
+        ]
+        if sum(len(lat_r) * len(lon_r) for lat_r, lon_r in ranges) > max_cells:
+            continue
+
+        prefixes = set()
+        for lat_r, lon_r in ranges:
+            for i in lat_r:
+                for j in lon_r:
+                    center_lat = -90.0 + (i + 0.5) * lat_step
+                    center_lon = -180.0 + (j + 0.5) * lon_step
+                    prefixes.add(encode_geohash(center_lat, center_lon, precision))
+        return sorted(prefixes)
+
+    # Zone plus grande que les cellules de précision 1 : toute la Terre
+    return sorted(GEOHASH_ALPHABET)
+
+
+def bbox_around(latitude, longitude, radius_km):
+    """
+    Retourne la bbox (min_lon, min_lat, max_lon, max_lat) englobant
+    le cercle de rayon radius_km autour d'une position.
+    La bbox peut traverser l'antiméridien (min_lon > max_lon).
+    """
+    angular_radius = radius_km / EARTH_RADIUS_KM
+    delta_lat = math.degrees(angular_radius)
+    min_lat = latitude - delta_lat
+    max_lat = latitude + delta_lat
+
+    # Cercle contenant un pôle : toutes les longitudes sont concernées
+    if min_lat <= -90.0 or max_lat >= 90.0:
+        return (-180.0, max(min_lat, -90.0), 180.0, min(max_lat, 90.0))
+
+    ratio = math.sin(angular_radius) / math.cos(math.radians(latitude))
+    if ratio >= 1.0:
+        return (-180.0, min_lat, 180.0, max_lat)
+    delta_lon = math.degrees(math.asin(ratio))
+
+    min_lon = longitude - delta_lon
+    max_lon = longitude + delta_lon
+    if min_lon < -180.0:
+        min_lon += 360.0
+    if max_lon > 180.0:
+        max_lon -= 360.0
+    return (min_lon, min_lat, max_lon, max_lat)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """
+    Distance orthodromique en kilomètres entre deux positions.
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
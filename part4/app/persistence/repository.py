@@ -1,9 +1,147 @@
+import base64
+import json
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import wraps
+from sqlalchemy import and_, cast, delete, func, insert, or_, select, type_coerce
+from sqlalchemy.orm import joinedload, lazyload, selectinload
 from app.extensions import db
+from app.persistence import geo
 from app.models.user import User
 from app.models.place import Place
 from app.models.review import Review
-from app.models.amenity import Amenity
+from app.models.amenity import Amenity, place_amenity
+from app.models.revoked_token import RevokedToken
+from app.models.catalog_version import CatalogVersion
+
+
+def encode_cursor(sort_value, obj_id):
+    """
+    Encode la position (clé de tri, id) du dernier élément d'une page
+    en un curseur opaque transmissible dans une URL.
+    """
+    raw = json.dumps([sort_value, obj_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """
+    Décode un curseur produit par encode_cursor().
+    Lève une ValueError si le curseur est malformé.
+    """
+    try:
+        sort_value, obj_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(sort_value, str) or not isinstance(obj_id, str):
+        raise ValueError("Invalid cursor")
+    return sort_value, obj_id
+
+
+# ========== UNITÉ DE TRAVAIL ==========
+
+# Clés de session.info : profondeur des unités de travail imbriquées
+# et fonctions à exécuter après le commit
+_UOW_DEPTH = "unit_of_work_depth"
+_UOW_AFTER_COMMIT = "unit_of_work_after_commit"
+
+
+@contextmanager
+def unit_of_work():
+    """
+    Regroupe les écritures des repositories en une seule transaction.
+
+    Dans le bloc, add(), update() et delete() ne font qu'enregistrer les
+    changements dans la session : le commit a lieu une seule fois, à la
+    sortie du bloc le plus externe. Un bloc imbriqué rejoint le bloc
+    externe ; à sa sortie, les changements sont seulement envoyés à la base
+    (flush), afin que les violations de contrainte remontent à l'opération
+    qui les a causées. En cas d'exception, la transaction est annulée par
+    le bloc le plus externe.
+
+    Utilisable aussi comme décorateur : @unit_of_work()
+    """
+    session = db.session()
+    depth = session.info.get(_UOW_DEPTH, 0)
+    session.info[_UOW_DEPTH] = depth + 1
+    try:
+        yield session
+        if depth:
+            session.flush()
+    except BaseException:
+        if not depth:
+            session.rollback()
+            session.info.pop(_UOW_AFTER_COMMIT, None)
+        raise
+    finally:
+        session.info[_UOW_DEPTH] = depth
+
+    if not depth:
+        try:
+            session.commit()
+        except BaseException:
+            session.rollback()
+            session.info.pop(_UOW_AFTER_COMMIT, None)
+            raise
+        for callback in session.info.pop(_UOW_AFTER_COMMIT, ()):
+            callback()
+
+
+def in_unit_of_work():
+    """Indique si une unité de travail est en cours."""
+    return bool(db.session().info.get(_UOW_DEPTH))
+
+
+def commit():
+    """
+    Valide la transaction en cours, sauf dans une unité de travail :
+    le commit est alors reporté à la sortie de son bloc le plus externe.
+    """
+    if not in_unit_of_work():
+        db.session.commit()
+
+
+def after_commit(callback):
+    """
+    Exécute callback après le commit de l'unité de travail en cours
+    (jamais si elle est annulée), ou immédiatement hors unité de travail.
+    Sert aux effets hors base : caches, index et classements en mémoire.
+    """
+    if in_unit_of_work():
+        db.session().info.setdefault(_UOW_AFTER_COMMIT, []).append(callback)
+    else:
+        callback()
+
+
+def unit_of_work_per_request(view):
+    """
+    Décorateur de méthode de Resource : toutes les écritures de la requête
+    sont validées par un seul commit, après le succès du handler.
+    La transaction est annulée si le handler lève une exception (y compris
+    api.abort) ou renvoie un code d'erreur (>= 400).
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        response = None
+        try:
+            with unit_of_work():
+                response = view(*args, **kwargs)
+                if _status_code(response) >= 400:
+                    raise _Rollback()
+        except _Rollback:
+            pass
+        return response
+    return wrapper
+
+
+class _Rollback(Exception):
+    """Annule l'unité de travail d'une requête dont la réponse est une erreur."""
+
+
+def _status_code(response):
+    if isinstance(response, tuple):
+        return response[1] if len(response) > 1 and isinstance(response[1], int) else 200
+    return getattr(response, "status_code", 200)
 
 
 class Repository(ABC):
@@ -36,19 +174,110 @@ class SQLAlchemyRepository(Repository):
     """
     Implémentation générique d’un repository basé sur SQLAlchemy.
     Gère les opérations CRUD standard pour n’importe quel modèle SQLAlchemy.
+
+    Les lectures ne chargent aucune relation par défaut ; le paramètre load
+    de get() et get_all() précharge explicitement les relations demandées,
+    parmi EAGER_LOADS, en une requête IN groupée par relation.
     """
+    # Relations pouvant être préchargées sur demande
+    EAGER_LOADS = ()
+
     def __init__(self, model):
         self.model = model
 
+    def load_options(self, load=()):
+        """
+        Options SQLAlchemy préchargeant les relations nommées dans load.
+        Lève une ValueError pour une relation inconnue.
+        """
+        options = []
+        for name in load:
+            if name not in self.EAGER_LOADS:
+                raise ValueError(f"Unknown relation for {self.model.__name__}: {name}")
+            options.append(selectinload(getattr(self.model, name)))
+        return options
+
     def add(self, obj):
         db.session.add(obj)
-        db.session.commit()
+        commit()
 
-    def get(self, obj_id):
-        return self.model.query.get(obj_id)
+    def get(self, obj_id, options=None, load=()):
+        if load:
+            options = list(options or ()) + self.load_options(load)
+        return db.session.get(self.model, obj_id, options=options)
 
-    def get_all(self):
-        return self.model.query.all()
+    def get_version(self, obj_id):
+        """
+        Retourne l'état de version d'un objet (updated_at,) sans le charger,
+        ou None s'il n'existe pas. Sert à calculer les ETag.
+        """
+        return db.session.query(self.model.updated_at).filter_by(id=obj_id).first()
+
+    def get_all(self, options=None, load=()):
+        query = self.model.query
+        if load:
+            options = list(options or ()) + self.load_options(load)
+        if options:
+            query = query.options(*options)
+        return query.all()
+
+    def get_page(self, limit, after=None, options=None, filters=None,
+                 order_by="created_at", descending=False):
+        """
+        Récupère une page d'objets triés par (order_by, id), par curseur (keyset).
+
+        Le coût d'une page ne dépend pas de sa position : la base reprend
+        directement après le dernier élément vu au lieu de sauter N lignes.
+        La valeur brute de la clé de tri (telle que stockée) est conservée dans
+        le curseur, afin que la comparaison reste cohérente avec l'ordre de tri.
+
+        Paramètres :
+        - limit (int) : nombre maximum d'objets retournés
+        - after (str) : curseur renvoyé par la page précédente (optionnel)
+        - options (list) : options de chargement SQLAlchemy (optionnel)
+        - filters (list) : critères SQLAlchemy supplémentaires (optionnel)
+        - order_by (str) : colonne de tri (created_at par défaut)
+        - descending (bool) : tri décroissant
+
+        Retour :
+        - (liste d'objets, curseur de la page suivante ou None)
+        """
+        column = getattr(self.model, order_by)
+        sort_key = cast(column, db.String)
+        query = self.model.query.add_columns(sort_key)
+        if options:
+            query = query.options(*options)
+        if filters:
+            query = query.filter(*filters)
+
+        if after:
+            last_key, last_id = decode_cursor(after)
+            last_key = type_coerce(last_key, db.String)
+            if descending:
+                query = query.filter(or_(
+                    column < last_key,
+                    and_(column == last_key, self.model.id < last_id)
+                ))
+            else:
+                query = query.filter(or_(
+                    column > last_key,
+                    and_(column == last_key, self.model.id > last_id)
+                ))
+
+        if descending:
+            query = query.order_by(column.desc(), self.model.id.desc())
+        else:
+            query = query.order_by(column, self.model.id)
+
+        # Une ligne de plus que demandé pour savoir s'il existe une page suivante
+        rows = query.limit(limit + 1).all()
+
+        items = [obj for obj, _ in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last_obj, last_key = rows[limit - 1]
+            next_cursor = encode_cursor(last_key, last_obj.id)
+        return items, next_cursor
 
     def update(self, obj_id, data):
         obj = self.get(obj_id)
@@ -56,14 +285,14 @@ class SQLAlchemyRepository(Repository):
             return None
         for key, value in data.items():
             setattr(obj, key, value)
-        db.session.commit()
+        commit()
         return obj
 
     def delete(self, obj_id):
         obj = self.get(obj_id)
         if obj:
             db.session.delete(obj)
-            db.session.commit()
+            commit()
 
     def get_by_attribute(self, attr_name, attr_value):
         return self.model.query.filter(getattr(self.model, attr_name) == attr_value).first()
@@ -74,6 +303,8 @@ class UserRepository(SQLAlchemyRepository):
     Repository spécifique pour les objets User.
     Permet des requêtes personnalisées sur les utilisateurs.
     """
+    EAGER_LOADS = ("places", "reviews")
+
     def __init__(self):
         super().__init__(User)
 
@@ -91,15 +322,437 @@ class UserRepository(SQLAlchemyRepository):
 
 
 class PlaceRepository(SQLAlchemyRepository):
+    """
+    Repository spécifique pour les objets Place.
+    Fournit un chemin de lecture "listing" qui charge en un nombre fixe
+    de requêtes uniquement les relations demandées par l'API.
+    """
+    # Relations pouvant être embarquées dans les réponses de l'API
+    RELATIONS = ("owner", "amenities", "reviews")
+    EAGER_LOADS = RELATIONS
+
+    # Tris disponibles : nom -> (colonne, décroissant)
+    # Chaque tri s'appuie sur un index (colonne, id) de la table places
+    SORTS = {
+        "price": ("price", False),
+        "-price": ("price", True),
+        "newest": ("created_at", True),
+    }
+
     def __init__(self):
         super().__init__(Place)
 
+    def listing_options(self, include=None):
+        """
+        Options de chargement pour sérialiser des lieux sans requêtes N+1 :
+        - owner : jointure dans la requête principale
+        - amenities : une requête IN groupée
+        - reviews + auteur de chaque avis : une requête IN groupée avec jointure
+
+        Les relations absentes de include ne sont pas chargées du tout.
+        include=None charge toutes les relations.
+        """
+        if include is None:
+            include = self.RELATIONS
+
+        options = []
+        if "owner" in include:
+            options.append(joinedload(Place.owner))
+        else:
+            options.append(lazyload(Place.owner))
+        if "amenities" in include:
+            options.append(selectinload(Place.amenities))
+        else:
+            options.append(lazyload(Place.amenities))
+        if "reviews" in include:
+            options.append(selectinload(Place.reviews).joinedload(Review.author))
+        else:
+            options.append(lazyload(Place.reviews))
+        return options
+
+    def get_listing(self, place_id, include=None):
+        """
+        Retourne un lieu avec les relations demandées préchargées.
+        """
+        return self.get(place_id, options=self.listing_options(include))
+
+    def get_listing_page(self, limit, after=None, include=None,
+                         min_price=None, max_price=None, sort=None, bbox=None,
+                         place_ids=None, amenity_ids=None, match_all=True):
+        """
+        Retourne une page de lieux avec les relations demandées préchargées.
+
+        Le filtrage par prix et le tri sont faits par la base, via les index
+        idx_places_price (price, id) et idx_places_created_at (created_at, id).
+        Sans tri explicite, les lieux sont triés du plus ancien au plus récent.
+
+        place_ids restreint la page à des lieux déjà sélectionnés (index bitmap
+        des commodités) ; amenity_ids fait la même sélection en SQL.
+
+        Retour : (liste de Place, curseur de la page suivante ou None)
+        Lève une ValueError si le tri demandé est inconnu.
+        """
+        if sort is None:
+            order_by, descending = "created_at", False
+        elif sort in self.SORTS:
+            order_by, descending = self.SORTS[sort]
+        else:
+            raise ValueError(f"Invalid sort '{sort}', expected one of: {', '.join(self.SORTS)}")
+
+        filters = []
+        if min_price is not None:
+            filters.append(Place.price >= min_price)
+        if max_price is not None:
+            filters.append(Place.price <= max_price)
+        if bbox is not None:
+            filters.extend(self.bbox_filters(bbox))
+        if place_ids is not None:
+            filters.append(Place.id.in_(place_ids))
+        if amenity_ids:
+            filters.append(self.amenity_filter(amenity_ids, match_all))
+
+        return self.get_page(
+            limit, after,
+            options=self.listing_options(include),
+            filters=filters,
+            order_by=order_by,
+            descending=descending
+        )
+
+    def iter_listing(self, include=None, batch_size=500):
+        """
+        Parcourt tous les lieux, du plus ancien au plus récent, par lots de
+        batch_size lignes lues au fil de l'eau (yield_per) : la mémoire utilisée
+        ne dépend pas du nombre de lieux. Les relations demandées sont
+        préchargées lot par lot.
+
+        Retour : itérateur de Place, à consommer dans la session courante
+        """
+        query = (
+            select(Place)
+            .options(*self.listing_options(include))
+            .order_by(Place.created_at, Place.id)
+            .execution_options(yield_per=batch_size)
+        )
+        return db.session.scalars(query)
+
+    def find_by_title(self, title, include=None):
+        """
+        Recherche un lieu par son titre exact via l'index idx_places_title.
+        Si plusieurs propriétaires utilisent ce titre, le plus ancien lieu est retourné.
+        """
+        return (
+            self.model.query
+            .options(*self.listing_options(include))
+            .filter_by(title=title)
+            .order_by(Place.created_at, Place.id)
+            .first()
+        )
+
+    def find_by_owner_and_title(self, owner_id, title):
+        """
+        Recherche le lieu d'un propriétaire portant un titre donné,
+        via l'index unique unique_owner_place_title (owner_id, title).
+        """
+        return self.model.query.filter_by(owner_id=owner_id, title=title).first()
+
+    def find_titles_by_owner(self, owner_id, titles):
+        """
+        Retourne, parmi les titres donnés, ceux déjà utilisés par un
+        propriétaire, en une requête sur l'index unique_owner_place_title.
+        """
+        if not titles:
+            return set()
+        return set(db.session.scalars(
+            select(Place.title).where(Place.owner_id == owner_id, Place.title.in_(titles))
+        ))
+
+    def bulk_insert(self, rows, amenity_links=(), chunk_size=500):
+        """
+        Insère des lieux et leurs liens vers les commodités par lots de
+        chunk_size lignes (executemany), dans une seule transaction.
+
+        Paramètres :
+        - rows (list) : dictionnaires de colonnes des lieux, tous avec les mêmes clés
+        - amenity_links (list) : dictionnaires {place_id, amenity_id}
+        - chunk_size (int) : nombre de lignes par INSERT
+
+        En cas d'erreur, la transaction est annulée et l'exception relevée.
+        """
+        with unit_of_work():
+            for start in range(0, len(rows), chunk_size):
+                db.session.execute(insert(Place), rows[start:start + chunk_size])
+            for start in range(0, len(amenity_links), chunk_size):
+                db.session.execute(insert(place_amenity), amenity_links[start:start + chunk_size])
+
+    def find_by_owner(self, owner_id, limit, cursor=None, include=None):
+        """
+        Retourne une page des lieux d'un propriétaire, triés par date de création,
+        via l'index idx_places_owner (owner_id, created_at, id).
+        Retour : (liste de Place, curseur de la page suivante ou None)
+        """
+        return self.get_page(
+            limit, cursor,
+            options=self.listing_options(include),
+            filters=[Place.owner_id == owner_id]
+        )
+
+    def find_all_by_owner(self, owner_id):
+        """
+        Retourne tous les lieux d'un propriétaire via l'index idx_places_owner.
+        """
+        return (
+            self.model.query
+            .filter_by(owner_id=owner_id)
+            .order_by(Place.created_at, Place.id)
+            .all()
+        )
+
+    def bbox_filters(self, bbox):
+        """
+        Critères SQL limitant les lieux à une bbox (min_lon, min_lat, max_lon, max_lat).
+
+        Les préfixes geohash couvrant la zone sont lus comme des intervalles
+        sur l'index idx_places_geohash ; les bornes exactes de latitude et
+        de longitude écartent ensuite les lieux des bords des cellules.
+        """
+        min_lon, min_lat, max_lon, max_lat = bbox
+        prefixes = geo.covering_prefixes(bbox)
+
+        # "{" suit "z", dernier caractère de l'alphabet geohash
+        in_cells = or_(*[
+            and_(Place.geohash >= prefix, Place.geohash < prefix + "{")
+            for prefix in prefixes
+        ])
+        if min_lon <= max_lon:
+            in_longitudes = Place.longitude.between(min_lon, max_lon)
+        else:
+            in_longitudes = or_(Place.longitude >= min_lon, Place.longitude <= max_lon)
+
+        return [in_cells, Place.latitude.between(min_lat, max_lat), in_longitudes]
+
+    def find_positions_in_bbox(self, bbox):
+        """
+        Retourne les positions (id, latitude, longitude) des lieux d'une bbox,
+        sans charger les objets Place.
+        """
+        return (
+            db.session.query(Place.id, Place.latitude, Place.longitude)
+            .filter(*self.bbox_filters(bbox))
+            .all()
+        )
+
+    def amenity_filter(self, amenity_ids, match_all=True):
+        """
+        Critère SQL limitant les lieux à ceux proposant toutes les commodités
+        demandées (match_all=True) ou au moins l'une d'entre elles.
+        """
+        matching = select(place_amenity.c.place_id).where(place_amenity.c.amenity_id.in_(amenity_ids))
+        if match_all:
+            matching = (
+                matching
+                .group_by(place_amenity.c.place_id)
+                .having(func.count() == len(set(amenity_ids)))
+            )
+        return Place.id.in_(matching)
+
+    def find_ids_by_amenity(self, amenity_id):
+        """
+        Retourne les identifiants des lieux proposant une commodité,
+        lus dans la table place_amenity sans charger les lieux.
+        """
+        return db.session.scalars(
+            select(place_amenity.c.place_id).where(place_amenity.c.amenity_id == amenity_id)
+        ).all()
+
+    def get_amenity_links(self, since=None):
+        """
+        Retourne tous les couples (place_id, amenity_id) de la table place_amenity.
+
+        Avec since, retourne ceux des seuls lieux modifiés depuis since (via
+        l'index idx_places_updated_at), avec amenity_id None pour un lieu
+        sans commodité.
+        """
+        if since is None:
+            return db.session.query(place_amenity.c.place_id, place_amenity.c.amenity_id).all()
+        return (
+            db.session.query(Place.id, place_amenity.c.amenity_id)
+            .outerjoin(place_amenity, place_amenity.c.place_id == Place.id)
+            .filter(Place.updated_at >= since)
+            .all()
+        )
+
+    def get_version(self, place_id):
+        """
+        Retourne (updated_at, version) d'un lieu sans le charger, ou None.
+        """
+        return db.session.query(Place.updated_at, Place.version).filter_by(id=place_id).first()
+
+    def bump_versions(self, place_ids):
+        """
+        Incrémente en une requête la version des lieux donnés, dans la
+        transaction en cours (le commit est laissé à l'appelant).
+        """
+        if not place_ids:
+            return
+        (
+            self.model.query
+            .filter(Place.id.in_(place_ids))
+            .update({Place.version: Place.version + 1}, synchronize_session=False)
+        )
+
+    def get_rating_stats(self, since=None):
+        """
+        Retourne les agrégats d'avis (id, review_count, rating_sum) de tous
+        les lieux, ou des seuls lieux modifiés depuis since (via l'index
+        idx_places_updated_at), sans charger les objets Place.
+        """
+        query = db.session.query(Place.id, Place.review_count, Place.rating_sum)
+        if since is not None:
+            query = query.filter(Place.updated_at >= since)
+        return query.all()
+
+    def get_listing_many(self, place_ids, include=None):
+        """
+        Retourne les lieux correspondant aux identifiants donnés, dans le même
+        ordre, avec les relations demandées préchargées.
+        """
+        if not place_ids:
+            return []
+        places = (
+            self.model.query
+            .options(*self.listing_options(include))
+            .filter(Place.id.in_(place_ids))
+            .all()
+        )
+        by_id = {place.id: place for place in places}
+        return [by_id[place_id] for place_id in place_ids if place_id in by_id]
+
 
 class ReviewRepository(SQLAlchemyRepository):
+    """
+    Repository spécifique pour les objets Review.
+    Les recherches par lieu et par auteur passent par les index de la table reviews.
+    """
+    EAGER_LOADS = ("author", "place")
+
     def __init__(self):
         super().__init__(Review)
 
+    def find_by_place(self, place_id):
+        """
+        Retourne les avis d'un lieu via l'index idx_reviews_place.
+        """
+        return self.model.query.filter_by(place_id=place_id).all()
+
+    def find_by_user(self, user_id):
+        """
+        Retourne les avis d'un utilisateur via l'index unique_user_place_review
+        (dont user_id est la première colonne).
+        """
+        return self.model.query.filter_by(user_id=user_id).all()
+
+    def find_by_user_and_place(self, user_id, place_id):
+        """
+        Retourne l'avis d'un utilisateur sur un lieu, ou None.
+        Une seule lecture de l'index unique_user_place_review.
+        """
+        return self.model.query.filter_by(user_id=user_id, place_id=place_id).first()
+
 
 class AmenityRepository(SQLAlchemyRepository):
+    """
+    Repository spécifique pour les objets Amenity.
+    Les lieux d'une commodité ne sont chargés que sur demande (load=("places",)).
+    """
+    EAGER_LOADS = ("places",)
+
     def __init__(self):
         super().__init__(Amenity)
+
+    def get_many(self, amenity_ids):
+        """
+        Charge plusieurs commodités en une seule requête IN.
+
+        Paramètres :
+        - amenity_ids (list) : identifiants recherchés (les doublons sont ignorés)
+
+        Retour :
+        - (commodités trouvées, identifiants introuvables), chacune des deux
+          listes dans l'ordre de amenity_ids
+        """
+        amenity_ids = list(dict.fromkeys(amenity_ids))
+        if not amenity_ids:
+            return [], []
+        found = {
+            amenity.id: amenity
+            for amenity in db.session.scalars(select(Amenity).where(Amenity.id.in_(amenity_ids)))
+        }
+        return (
+            [found[amenity_id] for amenity_id in amenity_ids if amenity_id in found],
+            [amenity_id for amenity_id in amenity_ids if amenity_id not in found]
+        )
+
+    def get_catalog(self):
+        """
+        Retourne les couples (id, name) de toutes les commodités, sans
+        construire d'objets Amenity.
+        """
+        return db.session.execute(select(Amenity.id, Amenity.name)).all()
+
+
+class RevokedTokenRepository(SQLAlchemyRepository):
+    """
+    Repository des jetons JWT révoqués.
+    """
+    def __init__(self):
+        super().__init__(RevokedToken)
+
+    def get_active_jtis(self, now):
+        """
+        Retourne les jti des jetons révoqués non encore expirés (ou sans
+        expiration), via l'index idx_revoked_tokens_expires_at.
+        """
+        return db.session.scalars(
+            select(RevokedToken.jti)
+            .where(or_(RevokedToken.expires_at.is_(None), RevokedToken.expires_at > now))
+        ).all()
+
+    def delete_expired(self, now):
+        """
+        Supprime en SQL les révocations des jetons expirés, via l'index
+        idx_revoked_tokens_expires_at (le commit est laissé à l'appelant).
+        Les jetons sans expiration (expires_at NULL) sont conservés.
+        Retourne le nombre de lignes supprimées.
+        """
+        return db.session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now)).rowcount
+
+
+class CatalogVersionRepository(SQLAlchemyRepository):
+    """
+    Repository des compteurs de version des catalogues en mémoire.
+    """
+    def __init__(self):
+        super().__init__(CatalogVersion)
+
+    def get_version(self, name):
+        """
+        Retourne la version d'un catalogue (0 s'il n'a jamais été modifié),
+        par une lecture sur la clé primaire.
+        """
+        return db.session.scalar(select(CatalogVersion.version).where(CatalogVersion.name == name)) or 0
+
+    def bump(self, name):
+        """
+        Incrémente en SQL la version d'un catalogue, dans la transaction en
+        cours (le commit est laissé à l'appelant). La ligne est créée au
+        premier incrément si elle n'existe pas encore.
+        """
+        updated = (
+            self.model.query
+            .filter_by(name=name)
+            .update({CatalogVersion.version: CatalogVersion.version + 1}, synchronize_session=False)
+        )
+        if not updated:
+            db.session.add(CatalogVersion(name=name, version=1))
+            db.session.flush()
@@ -0,0 +1,268 @@
+"""
+app/schemas.py
+
+Schémas de validation des données reçues (utilisateurs, lieux, avis).
+
+Un schéma décode une requête en un seul passage : il vérifie la présence
+des champs obligatoires, puis chaque champ vérifie son type et ses
+contraintes et normalise sa valeur (espaces, casse de l'e-mail, prix en
+float). Valider une requête ne coûte ainsi qu'un appel de méthode par
+champ, sans validateur JSON Schema (flask-restx validate=True) ni instance
+de modèle jetable.
+
+Les champs inconnus sont ignorés. Un dictionnaire déjà décodé par un schéma
+(ValidatedData) est renvoyé tel quel par ce même schéma : l'API peut décoder
+la requête avant d'appeler la facade, qui ne le refait pas.
+"""
+
+import re
+
+# Format d'une adresse e-mail (un seul '@', un point dans le domaine)
+EMAIL_PATTERN = re.compile(r"^[^@]+@[^@]+\.[^@]+$")
+
+
+class ValidationError(ValueError):
+    """Donnée invalide ; le message est renvoyé au client (400)."""
+
+
+class ValidatedData(dict):
+    """Dictionnaire produit par Schema.decode."""
+
+    __slots__ = ("schema",)
+
+
+# ========== CHAMPS ==========
+
+class Field:
+    """
+    Champ d'un schéma.
+
+    Paramètres :
+    - label (str) : nom du champ dans les messages d'erreur
+    - required (bool) : champ obligatoire (sinon absent ou None : default)
+    - default : valeur d'un champ facultatif absent
+    """
+
+    def __init__(self, label, required=True, default=None):
+        self.label = label
+        self.required = required
+        self.default = default
+
+    def error(self, message):
+        """ValidationError préfixée par le nom du champ."""
+        return ValidationError(f"{self.label} {message}")
+
+    def validate(self, value):
+        """Vérifie value et retourne sa forme normalisée (ici inchangée)."""
+        return value
+
+
+class String(Field):
+    """Chaîne sans espaces en bordure, non vide, éventuellement bornée."""
+
+    def __init__(self, label, max_length=None, strip=True, **kwargs):
+        super().__init__(label, **kwargs)
+        self.max_length = max_length
+        self.strip = strip
+
+    def validate(self, value):
+        if not isinstance(value, str):
+            raise self.error("must be a string")
+        if self.strip:
+            value = value.strip()
+        if not value:
+            raise self.error("is required")
+        if self.max_length is not None and len(value) > self.max_length:
+            raise self.error(f"must be at most {self.max_length} characters")
+        return value
+
+
+class Email(String):
+    """Adresse e-mail, mise en minuscules."""
+
+    def validate(self, value):
+        value = super().validate(value).lower()
+        if value.count("@") != 1:
+            raise ValidationError("Email must contain exactly one '@'")
+        if not EMAIL_PATTERN.match(value):
+            raise ValidationError("Invalid email format")
+        return value
+
+
+class Price(Field):
+    """Nombre strictement positif, converti en float."""
+
+    def validate(self, value):
+        if isinstance(value, bool) or not isinstance(value, (float, int)):
+            raise self.error("must be a float or int")
+        if value <= 0:
+            raise self.error("must be greater than 0")
+        return float(value)
+
+
+class Coordinate(Field):
+    """Nombre compris entre -limit et limit, converti en float, ou None."""
+
+    def __init__(self, label, limit, **kwargs):
+        super().__init__(label, **kwargs)
+        self.limit = float(limit)
+
+    def validate(self, value):
+        if value is not None:
+            if isinstance(value, bool) or not isinstance(value, (float, int)):
+                raise self.error("must be a float")
+            if not -self.limit <= value <= self.limit:
+                raise self.error(f"must be between {-self.limit} and {self.limit}")
+            value = float(value)
+        return value
+
+
+class Stripped(Field):
+    """Valeur reçue telle quelle ; une chaîne perd ses espaces en bordure."""
+
+    def validate(self, value):
+        return value.strip() if isinstance(value, str) else value
+
+
+class Integer(Field):
+    """Entier (booléens exclus) compris entre minimum et maximum."""
+
+    def __init__(self, label, minimum, maximum, **kwargs):
+        super().__init__(label, **kwargs)
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def validate(self, value):
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise self.error("must be an integer")
+        if not self.minimum <= value <= self.maximum:
+            raise self.error(f"must be between {self.minimum} and {self.maximum}")
+        return value
+
+
+class Boolean(Field):
+    """
+    Booléen JSON. Avec coerce=True, toute valeur est convertie par bool()
+    (comportement historique de la mise à jour d'un utilisateur).
+    """
+
+    def __init__(self, label, coerce=False, **kwargs):
+        super().__init__(label, **kwargs)
+        self.coerce = coerce
+
+    def validate(self, value):
+        if self.coerce:
+            return bool(value)
+        if not isinstance(value, bool):
+            raise self.error("must be a boolean")
+        return value
+
+
+# ========== SCHÉMAS ==========
+
+class Schema:
+    """
+    Schéma de validation.
+
+    Paramètres :
+    - name (str) : nom de l'objet dans les messages d'erreur
+    - fields (dict) : champ de la requête -> Field
+    - partial (bool) : mise à jour partielle ; seuls les champs présents
+      sont décodés, aucun n'est obligatoire
+    """
+
+    def __init__(self, name, fields, partial=False):
+        self.name = name
+        self.fields = dict(fields)
+        self.partial = partial
+        self._required = [key for key, field in self.fields.items() if field.required]
+
+    def decode(self, data, **overrides):
+        """
+        Valide et normalise data en un seul passage.
+
+        Paramètres :
+        - data : objet JSON reçu (dict attendu)
+        - overrides : valeurs fixées par le serveur (ex. user_id issu du
+          jeton), prioritaires sur celles de data
+
+        Retour :
+        - ValidatedData avec les seuls champs du schéma
+
+        Lève une ValidationError (sous-classe de ValueError) au premier champ invalide.
+        """
+        if data.__class__ is ValidatedData and data.schema is self and not overrides:
+            return data
+        if not isinstance(data, dict):
+            raise ValidationError(f"{self.name} must be a JSON object")
+        if overrides:
+            data = {**data, **overrides}
+
+        if not self.partial:
+            missing = [key for key in self._required if key not in data]
+            if missing:
+                raise ValidationError(f"Missing required field(s): {', '.join(missing)}")
+
+        decoded = ValidatedData()
+        for key, field in self.fields.items():
+            if key in data:
+                value = data[key]
+            elif self.partial:
+                continue
+            else:
+                value = None
+            if value is None and not field.required:
+                decoded[key] = field.default
+            else:
+                decoded[key] = field.validate(value)
+        decoded.schema = self
+        return decoded
+
+
+USER_FIELDS = {
+    "first_name": String("First name", max_length=50),
+    "last_name": String("Last name", max_length=50),
+    "email": Email("Email"),
+    # La politique de mot de passe est appliquée par User.hash_password
+    "password": String("Password", strip=False),
+    "is_admin": Boolean("Is admin", required=False, default=False),
+}
+
+PLACE_FIELDS = {
+    "title": String("Title", max_length=100),
+    "description": String("Description"),
+    "price": Price("Price"),
+    "latitude": Coordinate("Latitude", 90),
+    "longitude": Coordinate("Longitude", 180),
+    "picture": String("Picture", required=False),
+}
+
+REVIEW_FIELDS = {
+    "text": String("Text", max_length=500),
+    "rating": Integer("Rating", 1, 5),
+    "user_id": String("User id"),
+    "place_id": String("Place id"),
+}
+
+USER_SCHEMA = Schema("User", USER_FIELDS)
+# Mise à jour : is_admin reste converti par bool(), comme avant les schémas
+USER_UPDATE_SCHEMA = Schema("User", {
+    **USER_FIELDS, "is_admin": Boolean("Is admin", coerce=True, required=False, default=False)
+}, partial=True)
+PLACE_SCHEMA = Schema("Place", PLACE_FIELDS)
+# Création unitaire (POST /places) : seule la présence des champs est
+# exigée, comme avant les schémas ; le titre est normalisé pour la
+# vérification de conflit
+PLACE_CREATE_SCHEMA = Schema("Place", {
+    "title": Stripped("Title"),
+    "description": Field("Description"),
+    "price": Field("Price"),
+    "latitude": Field("Latitude"),
+    "longitude": Field("Longitude"),
+    "picture": Field("Picture", required=False),
+})
+PLACE_UPDATE_SCHEMA = Schema("Place", PLACE_FIELDS, partial=True)
+REVIEW_SCHEMA = Schema("Review", REVIEW_FIELDS)
+REVIEW_UPDATE_SCHEMA = Schema(
+    "Review", {key: REVIEW_FIELDS[key] for key in ("text", "rating")}, partial=True
+)
@@ -0,0 +1,90 @@
+"""services/amenity_catalog.py
+
+Catalogue des commodités (id -> nom, nom -> id), tenu en mémoire.
+
+Les commodités sont peu nombreuses et changent rarement : la liste des
+commodités et la vérification des identifiants lors des créations de lieux
+en masse sont servies depuis ce catalogue plutôt que relues en base.
+
+Le catalogue est chargé à la première utilisation. Sa fraîcheur est
+vérifiée en lisant le compteur "amenities" de la table catalog_versions,
+incrémenté par HBnBFacade.create_amenity / update_amenity dans la même
+transaction que la modification : un autre processus remarque donc le
+changement à sa prochaine vérification, sans bus de messages. Pour limiter
+les lectures, la vérification n'est faite qu'une fois par intervalle
+(check_interval) ; les écritures forcent une vérification.
+"""
+
+import threading
+import time
+from collections import namedtuple
+
+# Nom du compteur du catalogue dans la table catalog_versions
+CATALOG_NAME = "amenities"
+
+# Intervalle minimal, en secondes, entre deux lectures du compteur
+DEFAULT_CHECK_INTERVAL = 1.0
+
+# Copie immuable du catalogue à une version donnée
+AmenityCatalogSnapshot = namedtuple("AmenityCatalogSnapshot", ["version", "by_id", "by_name"])
+
+
+class AmenityCatalog:
+    """
+    Copie en mémoire du catalogue des commodités, rechargée quand le
+    compteur de version en base change.
+    """
+
+    def __init__(self, check_interval=DEFAULT_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self.reset()
+
+    def init_app(self, app):
+        """Lit la configuration et vide le catalogue, rechargé depuis la base de cette application."""
+        self.check_interval = app.config.get("AMENITY_CATALOG_CHECK_INTERVAL", DEFAULT_CHECK_INTERVAL)
+        self.reset()
+
+    def reset(self):
+        """Vide le catalogue ; il sera rechargé au prochain accès."""
+        with self._lock:
+            self._snapshot = None
+            self._check_at = 0.0
+
+    def invalidate(self):
+        """Force la vérification de la version au prochain accès."""
+        self._check_at = 0.0
+
+    def get(self, read_version, load_amenities, check=False):
+        """
+        Retourne le catalogue courant.
+
+        Paramètres :
+        - read_version (callable) : retourne le compteur de version en base
+        - load_amenities (callable) : retourne les couples (id, name) de
+          toutes les commodités ; appelée seulement si la version a changé
+        - check (bool) : vérifie la version même si l'intervalle n'est pas écoulé
+
+        Retour :
+        - AmenityCatalogSnapshot (version, by_id, by_name)
+        """
+        now = time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is not None and not check and now < self._check_at:
+            return snapshot
+        with self._lock:
+            version = read_version()
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                # Version lue avant les commodités : une modification
+                # concurrente sera vue à la vérification suivante
+                by_id = dict(load_amenities())
+                by_name = {name: amenity_id for amenity_id, name in by_id.items()}
+                snapshot = AmenityCatalogSnapshot(version, by_id, by_name)
+                self._snapshot = snapshot
+            self._check_at = now + self.check_interval
+        return snapshot
+
+
+# Catalogue partagé par l'application, initialisé dans create_app()
+amenity_catalog = AmenityCatalog()
@@ -0,0 +1,139 @@
+"""services/amenity_index.py
+
+Index bitmap des commodités des lieux, tenu en mémoire.
+
+Chaque lieu reçoit un numéro d'ordre (ordinal) ; chaque commodité garde
+un entier Python dont le bit n°k est à 1 si le lieu d'ordinal k la propose.
+Filtrer "wifi ET piscine ET parking" revient alors à un ET binaire entre
+trois entiers, "wifi OU piscine" à un OU binaire.
+
+L'index est construit depuis la table place_amenity, puis mis à jour par
+HBnBFacade lorsque create_place / update_place modifient les commodités
+d'un lieu. Il est propre à chaque processus : les modifications faites par
+les autres processus sont reportées en relisant périodiquement les
+commodités des seuls lieux modifiés (voir place_changes.py).
+"""
+
+import threading
+
+from app.services.place_changes import ChangeWindow, DEFAULT_CHECK_INTERVAL
+
+
+class AmenityBitmapIndex:
+    """
+    Index commodité -> ensemble de lieux, sous forme de bitsets.
+    """
+
+    def __init__(self, check_interval=DEFAULT_CHECK_INTERVAL):
+        self._changes = ChangeWindow(check_interval)
+        self._lock = threading.Lock()
+        self._clear()
+
+    def init_app(self, app):
+        """Lit la configuration et vide l'index, reconstruit depuis la base de cette application."""
+        self._changes.check_interval = app.config.get("AMENITY_INDEX_CHECK_INTERVAL", DEFAULT_CHECK_INTERVAL)
+        self.reset()
+
+    def reset(self):
+        """Vide l'index ; il sera reconstruit au prochain ensure_loaded()."""
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        self._ordinals = {}         # place_id -> ordinal
+        self._place_ids = []        # ordinal -> place_id
+        self._bitsets = {}          # amenity_id -> bitset des lieux
+        self._place_amenities = {}  # place_id -> frozenset des amenity_id
+        self._changes.reset()
+        self.loaded = False
+
+    # ========== CONSTRUCTION ET MISE À JOUR ==========
+
+    def ensure_loaded(self, load_links):
+        """
+        Construit l'index s'il ne l'est pas encore ; sinon, au plus une fois
+        par check_interval, y reporte les commodités des lieux modifiés.
+
+        Paramètres :
+        - load_links (callable) : load_links(since) retourne les couples
+          (place_id, amenity_id) des lieux modifiés depuis since, avec
+          amenity_id None pour un lieu sans commodité, ou ceux de toute la
+          table place_amenity si since vaut None ; appelée sous le verrou
+        """
+        if self.loaded and not self._changes.due():
+            return
+        with self._lock:
+            if self.loaded and not self._changes.due():
+                return
+            since = self._changes.advance()
+            links = {}
+            for place_id, amenity_id in load_links(None if not self.loaded else since):
+                amenity_ids = links.setdefault(place_id, set())
+                if amenity_id is not None:
+                    amenity_ids.add(amenity_id)
+            for place_id, amenity_ids in links.items():
+                self._set(place_id, amenity_ids)
+            self.loaded = True
+
+    def set_place_amenities(self, place_id, amenity_ids):
+        """
+        Remplace les commodités d'un lieu dans l'index.
+        Sans effet tant que l'index n'est pas construit : il sera alors lu
+        directement depuis la base.
+        """
+        self.set_places_amenities([(place_id, amenity_ids)])
+
+    def set_places_amenities(self, places):
+        """
+        Variante groupée de set_place_amenities pour des couples
+        (place_id, amenity_ids).
+        """
+        with self._lock:
+            if self.loaded:
+                for place_id, amenity_ids in places:
+                    self._set(place_id, amenity_ids)
+
+    def _set(self, place_id, amenity_ids):
+        ordinal = self._ordinals.get(place_id)
+        if ordinal is None:
+            ordinal = len(self._place_ids)
+            self._ordinals[place_id] = ordinal
+            self._place_ids.append(place_id)
+        bit = 1 << ordinal
+
+        old = self._place_amenities.get(place_id, frozenset())
+        new = frozenset(amenity_ids)
+        for amenity_id in old - new:
+            self._bitsets[amenity_id] &= ~bit
+        for amenity_id in new - old:
+            self._bitsets[amenity_id] = self._bitsets.get(amenity_id, 0) | bit
+        self._place_amenities[place_id] = new
+
+    # ========== LECTURE ==========
+
+    def match(self, amenity_ids, match_all=True):
+        """
+        Retourne les identifiants des lieux proposant toutes les commodités
+        demandées (match_all=True) ou au moins l'une d'entre elles.
+        """
+        with self._lock:
+            bitsets = [self._bitsets.get(amenity_id, 0) for amenity_id in amenity_ids]
+            if not bitsets:
+                return []
+            bits = bitsets[0]
+            for bitset in bitsets[1:]:
+                bits = bits & bitset if match_all else bits | bitset
+            place_ids = self._place_ids
+
+            # Positions des bits à 1, lues sur l'écriture binaire (bit 0 en premier)
+            digits = bin(bits)[:1:-1]
+            result = []
+            ordinal = digits.find("1")
+            while ordinal != -1:
+                result.append(place_ids[ordinal])
+                ordinal = digits.find("1", ordinal + 1)
+            return result
+
+
+# Index partagé par l'application, initialisé dans create_app()
+place_amenity_index = AmenityBitmapIndex()
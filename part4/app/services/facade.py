@@ -1,10 +1,34 @@
+import uuid
+from datetime import datetime, timezone
+from flask import g, has_request_context
 from app.models.user import User
 from app.models.place import Place
 from app.models.amenity import Amenity
 from app.models.review import Review
-from app.extensions import db
+from app.models.revoked_token import RevokedToken
+from sqlalchemy.exc import IntegrityError
+from app.extensions import db, response_cache
+from app.persistence import geo
+from app.schemas import (
+    USER_SCHEMA, USER_UPDATE_SCHEMA, PLACE_SCHEMA, PLACE_CREATE_SCHEMA, PLACE_UPDATE_SCHEMA,
+    REVIEW_SCHEMA, REVIEW_UPDATE_SCHEMA
+)
 from app.persistence.repository import UserRepository
 from app.persistence.repository import PlaceRepository, ReviewRepository, AmenityRepository
+from app.persistence.repository import RevokedTokenRepository, CatalogVersionRepository
+from app.persistence.repository import after_commit, unit_of_work
+from app.services.rankings import place_rankings
+from app.services.amenity_index import place_amenity_index
+from app.services.amenity_catalog import amenity_catalog, CATALOG_NAME as AMENITY_CATALOG
+from app.services.token_blocklist import token_blocklist
+from app.services.user_auth_cache import user_auth_cache
+
+# Au-delà de ce nombre de lieux retenus par l'index bitmap, le filtre sur
+# les commodités est laissé à la base plutôt que passé en liste d'identifiants
+MAX_INDEXED_PLACE_IDS = 5000
+
+# Nombre de lignes par INSERT (executemany) lors d'une création en masse
+BULK_INSERT_CHUNK_SIZE = 500
 
 
 class HBnBFacade:
@@ -13,6 +37,53 @@ class HBnBFacade:
         self.place_repo = PlaceRepository()
         self.review_repo = ReviewRepository()
         self.amenity_repo = AmenityRepository()
+        self.revoked_token_repo = RevokedTokenRepository()
+        self.catalog_version_repo = CatalogVersionRepository()
+
+    # ==========================
+    # Identity map de la requête
+    # ==========================
+
+    def _load_once(self, model, obj_id, load):
+        """
+        Charge une entité au plus une fois par requête HTTP : le résultat
+        (y compris None) est gardé dans flask.g et resservi aux appels
+        suivants pour le même identifiant. Hors requête, load est appelée.
+        """
+        if not has_request_context():
+            return load(obj_id)
+        identity_map = g.setdefault("facade_identity_map", {})
+        key = (model, obj_id)
+        if key not in identity_map:
+            identity_map[key] = load(obj_id)
+        return identity_map[key]
+
+    def _load_many_once(self, model, obj_ids, load_many):
+        """
+        Variante groupée de _load_once : seuls les identifiants pas encore
+        chargés pendant la requête sont passés, en un seul appel, à
+        load_many(ids), qui retourne les entités trouvées.
+        Retour : liste alignée sur obj_ids (None pour un identifiant introuvable).
+        """
+        if not has_request_context():
+            found = {entity.id: entity for entity in load_many(obj_ids)}
+            return [found.get(obj_id) for obj_id in obj_ids]
+        identity_map = g.setdefault("facade_identity_map", {})
+        unknown = [obj_id for obj_id in obj_ids if (model, obj_id) not in identity_map]
+        if unknown:
+            found = {entity.id: entity for entity in load_many(unknown)}
+            for obj_id in unknown:
+                identity_map[(model, obj_id)] = found.get(obj_id)
+        return [identity_map[(model, obj_id)] for obj_id in obj_ids]
+
+    def _forget(self, model, obj_id):
+        """Retire une entité supprimée de l'identity map de la requête."""
+        if has_request_context():
+            g.get("facade_identity_map", {}).pop((model, obj_id), None)
+
+    def end_request(self, exc=None):
+        """Vide l'identity map en fin de requête (appelée par teardown_request)."""
+        g.pop("facade_identity_map", None)
 
     # ==========================
     # Gestion de User
@@ -24,7 +95,15 @@ class HBnBFacade:
         Récupère un utilisateur par son identifiant.
         Retourne l'objet User ou None si non trouvé.
         """
-        return self.user_repo.get(user_id)
+        return self._load_once(User, user_id, self.user_repo.get)
+
+    def get_user_auth(self, user_id):
+        """
+        Retourne les informations d'authentification (id, is_admin) d'un
+        utilisateur, lues dans un cache à durée de vie courte.
+        Retourne None si l'utilisateur n'existe pas.
+        """
+        return user_auth_cache.get(user_id, self.get_user)
 
     def get_user_by_id(self, user_id):
         """
@@ -45,27 +124,30 @@ class HBnBFacade:
         """
         return self.user_repo.get_all()
 
+    @unit_of_work()
     def create_user(self, user_data):
         """
         Crée un nouvel utilisateur à partir d'un dictionnaire de données.
         Exige : first_name, last_name, email, password (is_admin est optionnel).
         Lève une ValueError si l’e-mail est déjà utilisé ou si les données sont invalides.
         """
-        # Vérifie l’unicité de l’e-mail via le repo
-        if self.get_user_by_email(user_data["email"]):
-            raise ValueError("Email already registered")
-
         try:
-            # Création de l’utilisateur avec validation explicite
+            # Validation en un passage (sans effet si déjà décodé par l'API)
+            data = USER_SCHEMA.decode(user_data)
+
+            # Vérifie l’unicité de l’e-mail via le repo
+            if self.get_user_by_email(data["email"]):
+                raise ValueError("Email already registered")
+
             user = User(
-                first_name=User().validate_name(user_data["first_name"], "First name"),
-                last_name=User().validate_name(user_data["last_name"], "Last name"),
-                email=User().validate_email(user_data["email"]),
-                is_admin=user_data.get("is_admin", False)
+                first_name=data["first_name"],
+                last_name=data["last_name"],
+                email=data["email"],
+                is_admin=data["is_admin"]
             )
 
             # Hachage sécurisé du mot de passe
-            user.hash_password(user_data["password"])
+            user.hash_password(data["password"])
 
             # Ajout via le repository
             self.user_repo.add(user)
@@ -74,6 +156,7 @@ class HBnBFacade:
         except (KeyError, TypeError, ValueError) as e:
             raise ValueError(f"Invalid user data: {e}")
 
+    @unit_of_work()
     def update_user(self, user_id, update_data):
         """
         Met à jour un utilisateur existant avec les données fournies.
@@ -82,33 +165,25 @@ class HBnBFacade:
         Gère correctement le hachage du mot de passe si modifié.
         Lève une ValueError si l'utilisateur n'existe pas.
         """
-        user = self.user_repo.get(user_id)
+        user = self.get_user(user_id)
         if not user:
             raise ValueError(f"User with ID {user_id} not found")
 
-        # Liste des champs modifiables
-        modifiables = {"first_name", "last_name", "email", "password", "is_admin"}
-
-        for key, value in update_data.items():
-            if key not in modifiables:
-                continue
-
-            if key in {"first_name", "last_name"}:
-                validated = user.validate_name(value, key.replace("_", " ").title())
-                setattr(user, key, validated)
-
-            elif key == "email":
-                validated = user.validate_email(value)
-                setattr(user, "email", validated)
-
-            elif key == "password":
-                user.hash_password(value)  # hachage interne
+        # Champs modifiables, validés en un passage
+        update_data = USER_UPDATE_SCHEMA.decode(update_data)
+        user.update(update_data)  # hachage interne du mot de passe, met à jour updated_at
 
-            elif key == "is_admin":
-                user.is_admin = bool(value)
+        # Nom et email sont embarqués dans les lieux possédés et les avis rédigés
+        place_ids = set()
+        if update_data.keys() & {"first_name", "last_name", "email"}:
+            place_ids = {place.id for place in self.place_repo.find_all_by_owner(user_id)}
+            place_ids.update(review.place_id for review in self.review_repo.find_by_user(user_id))
+            self.place_repo.bump_versions(place_ids)
 
-        user.save()  # met à jour updated_at
         self.user_repo.add(user)  # commit SQLAlchemy
+        after_commit(lambda: user_auth_cache.invalidate(user_id))
+        if place_ids:
+            self._invalidate_places(*place_ids)
         return user
 
 
@@ -124,11 +199,48 @@ class HBnBFacade:
         return False
     """
 
+    # ==========================
+    # Gestion des jetons révoqués
+    # ==========================
+
+    @unit_of_work()
+    def revoke_token(self, jti, user_id, expires_at):
+        """
+        Révoque un jeton JWT : la révocation est enregistrée en base, puis
+        ajoutée à l'ensemble tenu en mémoire.
+        Lève une ValueError si le jeton est déjà révoqué : un jeton de
+        rafraîchissement ne peut ainsi être consommé qu'une seule fois.
+        Les révocations de jetons expirés sont supprimées au passage, au
+        plus une fois par REVOKED_TOKEN_PURGE_INTERVAL.
+        """
+        try:
+            with unit_of_work():
+                self.revoked_token_repo.add(RevokedToken(jti=jti, user_id=user_id, expires_at=expires_at))
+        except IntegrityError:
+            raise ValueError("Token already revoked")
+
+        # Purge périodique des révocations de jetons expirés
+        if token_blocklist.purge_due():
+            if self.revoked_token_repo.delete_expired(datetime.now(timezone.utc)):
+                after_commit(token_blocklist.reset)
+        after_commit(lambda: token_blocklist.add(jti))
+
+    def is_token_revoked(self, jti):
+        """
+        Indique si un jeton est révoqué, sans requête SQL une fois
+        l'ensemble des révocations chargé.
+        """
+        token_blocklist.ensure_loaded(
+            lambda: self.revoked_token_repo.get_active_jtis(datetime.now(timezone.utc))
+        )
+        return jti in token_blocklist
+
     # ==========================
     # Gestion de Place
     # ==========================
 
     # Méthode placeholder pour récupérer un place par ID
+    @unit_of_work()
     def create_place(self, place_data):
         """
         Crée un nouveau lieu à partir d'un dictionnaire de données.
@@ -140,62 +252,190 @@ class HBnBFacade:
         place_data.pop('reviews', None)
         print("DEBUG - contenu final de place_data:", place_data)
 
+        # Validation des champs en un passage, avant la recherche sur le titre normalisé
+        try:
+            columns = PLACE_CREATE_SCHEMA.decode(place_data)
+        except ValueError as e:
+            raise ValueError(f"Invalid place data: {e}")
+
+        # Vérification de conflit sur le titre (index unique owner_id + title)
+        if self.place_repo.find_by_owner_and_title(place_data.get("owner_id"), columns["title"]):
+            raise ValueError("Title already used by this owner")
+
         try:
             # Vérifie l'existence de l'utilisateur propriétaire
-            owner = self.user_repo.get(place_data["owner_id"])
+            owner = self.get_user(place_data["owner_id"])
             if not owner:
                 raise ValueError("Owner not found")
 
             # Sécurité : forcer amenities à être une liste
-            raw_amenities = place_data.get("amenities", [])
+            raw_amenities = place_data.get("amenities") or []
             if not isinstance(raw_amenities, list):
                 raise TypeError("amenities must be a list")
 
-            # Création du lieu
+            # Commodités résolues en une requête, avant l'ajout du lieu à la session
+            amenities = self._resolve_amenities(raw_amenities)
+
+            # Création du lieu à partir des champs validés
             place = Place(
-                title=place_data["title"],
-                description=place_data["description"],
-                price=place_data["price"],
-                latitude=place_data["latitude"],
-                longitude=place_data["longitude"],
+                **columns,
+                geohash=geo.encode_geohash(columns["latitude"], columns["longitude"]),
                 owner_id=owner.id
             )
-            db.session.add(place)  # ajout à la session
-
-            # Ajout des commodités si elles sont valides
-            for amenity in raw_amenities:
-                if isinstance(amenity, Amenity):
-                    place.add_amenity(amenity)
-                elif isinstance(amenity, str):
-                    a = self.amenity_repo.get(amenity)
-                    if a:
-                        place.amenities.append(a)
-                else:
-                    raise TypeError(f"Invalid amenity type: {type(amenity)}")
-
-            self.place_repo.add(place)
-            print("PLACE CRÉÉ :", place)
-            return place
+            for amenity in amenities:
+                place.add_amenity(amenity)
 
         except (KeyError, TypeError, ValueError) as e:
             raise ValueError(f"Invalid place data: {e}")
 
+        try:
+            with unit_of_work():
+                self.place_repo.add(place)
+        except IntegrityError as e:
+            # Lieu du même titre créé entre la vérification et l'insertion
+            # (index unique_owner_place_title) ; sinon colonne invalide
+            message = str(e.orig).lower()
+            if "unique" in message or "duplicate" in message:
+                raise ValueError("Title already used by this owner")
+            raise ValueError(f"Invalid place data: {e.orig}")
+
+        # L'id du lieu n'est attribué qu'à l'écriture : lu après le commit
+        amenity_ids = [a.id for a in place.amenities]
+        after_commit(lambda: place_rankings.update_place(place.id, 0, 0))
+        if amenity_ids:
+            after_commit(lambda: place_amenity_index.set_place_amenities(place.id, amenity_ids))
+        self._invalidate_places()
+        print("PLACE CRÉÉ :", place)
+        return place
+
+    @unit_of_work()
+    def create_places_bulk(self, owner_id, places_data):
+        """
+        Crée en une seule transaction plusieurs lieux d'un même propriétaire.
+
+        Tous les lieux sont validés avant toute écriture ; les titres déjà
+        utilisés et les commodités sont vérifiés en une requête IN chacun,
+        puis les lieux valides sont insérés par lots (executemany).
+        Un lieu invalide n'empêche pas la création des autres.
+
+        Paramètres :
+        - owner_id (str) : identifiant du propriétaire
+        - places_data (list) : dictionnaires title, description, price,
+          latitude, longitude, picture (optionnel), amenities (liste d'ID, optionnel)
+
+        Retour :
+        - liste de résultats dans l'ordre de places_data :
+          {"index", "id"} si le lieu est créé, {"index", "error"} sinon
+
+        Lève une ValueError si le propriétaire est introuvable, ou si un
+        titre a été pris entre la validation et l'insertion (rien n'est créé).
+        """
+        if not self.get_user(owner_id):
+            raise ValueError("Owner not found")
+
+        errors = {}
+        valid = {}  # index -> (colonnes, liste d'ID de commodités)
+        titles = {}
+        for index, data in enumerate(places_data):
+            try:
+                columns, amenity_ids = self._validate_bulk_place(data)
+                if columns["title"] in titles:
+                    raise ValueError(f"Title already used in this request (item {titles[columns['title']]})")
+                titles[columns["title"]] = index
+                valid[index] = (columns, amenity_ids)
+            except (TypeError, ValueError) as e:
+                errors[index] = str(e)
+
+        # Titres déjà utilisés par le propriétaire : une seule requête
+        for title in self.place_repo.find_titles_by_owner(owner_id, list(titles)):
+            index = titles[title]
+            errors[index] = "Title already used by this owner"
+            del valid[index]
+
+        # Commodités inconnues : vérifiées dans le catalogue en mémoire
+        requested = {amenity_id for _, amenity_ids in valid.values() for amenity_id in amenity_ids}
+        missing = requested - self.get_amenity_catalog(check=True).by_id.keys()
+        for index, (_, amenity_ids) in list(valid.items()):
+            unknown = [amenity_id for amenity_id in amenity_ids if amenity_id in missing]
+            if unknown:
+                errors[index] = f"Amenity not found: {', '.join(unknown)}"
+                del valid[index]
+
+        now = datetime.now(timezone.utc)
+        rows = []
+        links = []
+        created = {}  # index -> (place_id, amenity_ids)
+        for index, (columns, amenity_ids) in valid.items():
+            place_id = str(uuid.uuid4())
+            rows.append({
+                **columns,
+                "id": place_id,
+                "owner_id": owner_id,
+                "geohash": geo.encode_geohash(columns["latitude"], columns["longitude"]),
+                "created_at": now,
+                "updated_at": now,
+            })
+            links.extend({"place_id": place_id, "amenity_id": amenity_id} for amenity_id in amenity_ids)
+            created[index] = (place_id, amenity_ids)
+
+        if rows:
+            try:
+                self.place_repo.bulk_insert(rows, links, BULK_INSERT_CHUNK_SIZE)
+            except IntegrityError:
+                raise ValueError("Title already used by this owner")
+
+            def index_created_places():
+                place_rankings.update_places([(place_id, 0, 0) for place_id, _ in created.values()])
+                if links:
+                    place_amenity_index.set_places_amenities(created.values())
+            after_commit(index_created_places)
+            self._invalidate_places()
+
+        return [
+            {"index": index, "id": created[index][0]} if index in created
+            else {"index": index, "error": errors[index]}
+            for index in range(len(places_data))
+        ]
+
+    @staticmethod
+    def _validate_bulk_place(data):
+        """
+        Valide un lieu d'une création en masse avec PLACE_SCHEMA.
+        Retour : (colonnes validées, liste dédoublonnée des ID de commodités)
+        """
+        columns = PLACE_SCHEMA.decode(data)
+
+        amenity_ids = data.get("amenities") or []
+        if not isinstance(amenity_ids, list) or not all(isinstance(a, str) for a in amenity_ids):
+            raise TypeError("amenities must be a list of amenity IDs")
+        return columns, list(dict.fromkeys(amenity_ids))
+
     def get_place(self, place_id):
         """
         Récupère un lieu par son identifiant.
         """
-        return self.place_repo.get(place_id)
+        return self._load_once(Place, place_id, self.place_repo.get)
+
+    def get_place_details(self, place_id, include=None):
+        """
+        Récupère un lieu par son identifiant avec les relations demandées
+        (owner, amenities, reviews) préchargées. include=None les charge toutes.
+        """
+        return self.place_repo.get_listing(place_id, include)
 
-    def get_place_by_title(self, title):
+    def get_place_version(self, place_id):
+        """
+        Retourne l'état de version (updated_at, version) d'un lieu,
+        sans charger le lieu ni ses relations. None si le lieu est introuvable.
+        """
+        return self.place_repo.get_version(place_id)
+
+    def get_place_by_title(self, title, include=None):
         """
         Recherche un lieu par son titre exact (sensible à la casse).
         Retourne l'objet Place ou None si non trouvé.
         """
-        return next(
-            (place for place in self.place_repo.get_all() if place.title ==
-             title),
-            None
-        )
+        return self.place_repo.find_by_title(title, include)
 
     def get_all_places(self):
         """
@@ -203,25 +443,96 @@ class HBnBFacade:
         """
         return self.place_repo.get_all()
 
-    def get_places_by_user(self, user_id):
+    def get_places_page(self, limit, after=None, include=None,
+                        min_price=None, max_price=None, sort=None, bbox=None,
+                        amenity_ids=None, match_all=True):
+        """
+        Retourne une page de lieux, avec les relations demandées
+        préchargées (toutes si include=None).
+        Filtres optionnels : min_price, max_price (bornes incluses),
+        bbox (min_lon, min_lat, max_lon, max_lat),
+        amenity_ids (toutes les commodités si match_all, sinon au moins une).
+        Tri optionnel : 'price', '-price' ou 'newest' (par défaut : date de création).
+        Retour : (liste de Place, curseur de la page suivante ou None)
+        Lève une ValueError si le curseur ou le tri est invalide.
+        """
+        place_ids = None
+        if amenity_ids:
+            # Sélection des lieux par l'index bitmap des commodités
+            place_amenity_index.ensure_loaded(self.place_repo.get_amenity_links)
+            place_ids = place_amenity_index.match(amenity_ids, match_all)
+            if not place_ids:
+                return [], None
+            if len(place_ids) > MAX_INDEXED_PLACE_IDS:
+                place_ids = None
+            else:
+                amenity_ids = None
+
+        return self.place_repo.get_listing_page(
+            limit, after, include,
+            min_price=min_price, max_price=max_price, sort=sort, bbox=bbox,
+            place_ids=place_ids, amenity_ids=amenity_ids, match_all=match_all
+        )
+
+    def iter_places_for_export(self, include=None, batch_size=500):
+        """
+        Retourne un itérateur sur tous les lieux, lus par lots de batch_size,
+        avec les relations demandées préchargées. Destiné à l'export en flux.
+        """
+        return self.place_repo.iter_listing(include, batch_size)
+
+    def get_places_nearby(self, latitude, longitude, radius_km, limit, include=None):
+        """
+        Retourne les lieux situés à moins de radius_km d'une position,
+        du plus proche au plus éloigné.
+
+        Seules les cellules geohash couvrant le cercle sont lues en base ;
+        les relations ne sont chargées que pour les lieux retenus.
+        Retour : liste de tuples (Place, distance en km)
+        """
+        bbox = geo.bbox_around(latitude, longitude, radius_km)
+
+        nearby = []
+        for place_id, place_lat, place_lon in self.place_repo.find_positions_in_bbox(bbox):
+            distance = geo.haversine_km(latitude, longitude, place_lat, place_lon)
+            if distance <= radius_km:
+                nearby.append((distance, place_id))
+        nearby.sort()
+        nearby = nearby[:limit]
+
+        places = self.place_repo.get_listing_many([place_id for _, place_id in nearby], include)
+        distances = {place_id: distance for distance, place_id in nearby}
+        return [(place, distances[place.id]) for place in places]
+
+    def get_top_places(self, limit, min_reviews=1, include=None):
+        """
+        Retourne les lieux les mieux notés (note bayésienne), lus dans le
+        classement tenu en mémoire ; seuls les lieux retournés sont chargés.
+        Retour : liste de tuples (Place, score)
         """
-        Retourne la liste des lieux appartenant à un utilisateur donné.
+        place_rankings.ensure_loaded(self.place_repo.get_rating_stats)
+        top = place_rankings.top(limit, min_reviews)
+
+        places = self.place_repo.get_listing_many([place_id for place_id, _, _ in top], include)
+        scores = {place_id: score for place_id, score, _ in top}
+        return [(place, scores[place.id]) for place in places]
+
+    def get_places_by_user(self, user_id, limit, after=None, include=None):
+        """
+        Retourne une page des lieux appartenant à un utilisateur donné.
         Utile pour afficher tous les logements d’un hôte.
+        Retour : (liste de Place, curseur de la page suivante ou None)
+        Lève une ValueError si le curseur est invalide.
         """
-        return [
-            place for place in self.place_repo.get_all()
-            if place.owner and place.owner.id == user_id
-        ]
+        return self.place_repo.find_by_owner(user_id, limit, after, include)
 
     def get_places_by_owner(self, owner_id):
         """
         Retourne tous les lieux appartenant à un propriétaire donné.
         """
-        return [
-            p for p in self.place_repo.get_all()
-            if hasattr(p, "owner") and p.owner and p.owner.id == owner_id
-        ]
+        return self.place_repo.find_all_by_owner(owner_id)
 
+    @unit_of_work()
     def update_place(self, place_id, update_data):
         """
         Met à jour un lieu existant avec les données fournies.
@@ -231,30 +542,37 @@ class HBnBFacade:
         if not place:
             raise ValueError(f"Place with ID {place_id} not found")
 
+        # - Séparation de la liste des amenities, si présente
+        amenities = update_data.get("amenities")
+
+        # - Validation des autres champs en un passage
+        update_data = PLACE_UPDATE_SCHEMA.decode(update_data)
+
         # - Vérification de conflit sur le titre
         if "title" in update_data and update_data["title"] != place.title:
-            for other_place in self.get_places_by_owner(place.owner.id):
-                if other_place.id != place.id and other_place.title == update_data["title"]:
-                    raise ValueError("Title already used by this owner")
-
-        # - Séparation de la liste des amenities, si présente
-        amenities = update_data.pop("amenities", None)
+            other_place = self.place_repo.find_by_owner_and_title(place.owner_id, update_data["title"])
+            if other_place and other_place.id != place.id:
+                raise ValueError("Title already used by this owner")
 
         # - Mise à jour des autres champs
-        place.update(**update_data)
+        place.update(update_data)
+
+        # - Synchronisation de l'index spatial avec la position
+        place.geohash = geo.encode_geohash(place.latitude, place.longitude)
 
         # - Mise à jour des amenities si fournie
         if amenities is not None:
+            resolved = self._resolve_amenities(amenities)
+            place.bump_version()
             place.amenities.clear()
-            for amenity in amenities:
-                if isinstance(amenity, Amenity):
-                    place.add_amenity(amenity)
-                elif isinstance(amenity, str):
-                    a = self.amenity_repo.get(amenity)
-                    if a:
-                        place.add_amenity(a)
+            for amenity in resolved:
+                place.add_amenity(amenity)
 
         self.place_repo.add(place)
+        if amenities is not None:
+            amenity_ids = [a.id for a in place.amenities]
+            after_commit(lambda: place_amenity_index.set_place_amenities(place_id, amenity_ids))
+        self._invalidate_places(place_id)
         return place
 
     """ A activer plus tard
@@ -274,19 +592,92 @@ class HBnBFacade:
     # ==========================
 
     # Gestion des commodités (Amenity)
+    @unit_of_work()
     def create_amenity(self, amenity_data):
         """
         Crée une nouvelle commodité.
         """
         amenity = Amenity(**amenity_data)
         self.amenity_repo.add(amenity)
+        self._invalidate_amenity_catalog()
+        after_commit(lambda: response_cache.invalidate("amenities"))
         return amenity
 
+    def get_amenity_catalog(self, check=False):
+        """
+        Retourne le catalogue des commodités tenu en mémoire
+        (AmenityCatalogSnapshot : version, by_id id -> nom, by_name nom -> id).
+
+        Paramètres :
+        - check (bool) : relit le compteur de version en base même si la
+          dernière vérification est récente (à utiliser avant une écriture)
+        """
+        return amenity_catalog.get(
+            lambda: self.catalog_version_repo.get_version(AMENITY_CATALOG),
+            self.amenity_repo.get_catalog,
+            check
+        )
+
+    def _invalidate_amenity_catalog(self):
+        """
+        Incrémente la version du catalogue dans la transaction en cours :
+        les autres processus rechargeront leur copie ; celle de ce processus
+        est revérifiée dès le commit.
+        """
+        self.catalog_version_repo.bump(AMENITY_CATALOG)
+        after_commit(amenity_catalog.invalidate)
+
     def get_amenity(self, amenity_id):
         """
         Récupère une commodité par son identifiant.
         """
-        return self.amenity_repo.get(amenity_id)
+        return self._load_once(Amenity, amenity_id, self.amenity_repo.get)
+
+    def get_amenities(self, amenity_ids):
+        """
+        Récupère plusieurs commodités en une seule requête.
+
+        Paramètres :
+        - amenity_ids (list) : identifiants recherchés (les doublons sont ignorés)
+
+        Retour :
+        - (commodités trouvées, identifiants introuvables), dans l'ordre de amenity_ids
+
+        Les identifiants absents du catalogue en mémoire ne sont pas recherchés en base.
+        """
+        amenity_ids = list(dict.fromkeys(amenity_ids))
+        if amenity_ids:
+            known = self.get_amenity_catalog(check=True).by_id
+            amenities = self._load_many_once(
+                Amenity,
+                [amenity_id for amenity_id in amenity_ids if amenity_id in known],
+                lambda ids: self.amenity_repo.get_many(ids)[0]
+            )
+            found = {amenity.id: amenity for amenity in amenities if amenity is not None}
+            amenities = [found.get(amenity_id) for amenity_id in amenity_ids]
+        else:
+            amenities = []
+        return (
+            [amenity for amenity in amenities if amenity is not None],
+            [amenity_id for amenity_id, amenity in zip(amenity_ids, amenities) if amenity is None]
+        )
+
+    def _resolve_amenities(self, amenities):
+        """
+        Convertit une liste d'objets Amenity et/ou d'ID en objets Amenity ;
+        les ID sont résolus en une seule requête.
+        Lève une TypeError pour un élément d'un autre type, une ValueError
+        si des commodités sont introuvables.
+        """
+        for amenity in amenities:
+            if not isinstance(amenity, (Amenity, str)):
+                raise TypeError(f"Invalid amenity type: {type(amenity)}")
+        ids = [amenity for amenity in amenities if isinstance(amenity, str)]
+        found, missing = self.get_amenities(ids)
+        if missing:
+            raise ValueError(f"Amenity not found: {', '.join(missing)}")
+        by_id = {amenity.id: amenity for amenity in found}
+        return [by_id[amenity] if isinstance(amenity, str) else amenity for amenity in amenities]
 
     def get_all_amenities(self):
         """
@@ -294,6 +685,7 @@ class HBnBFacade:
         """
         return self.amenity_repo.get_all()
 
+    @unit_of_work()
     def update_amenity(self, amenity_id, update_data):
         """
         Met à jour une commodité existante.
@@ -310,9 +702,16 @@ class HBnBFacade:
         for key, value in update_data.items():
             setattr(amenity, key, value)
 
+        # - Le nom de la commodité est embarqué dans les lieux qui la proposent
+        place_ids = self.place_repo.find_ids_by_amenity(amenity_id)
+        self.place_repo.bump_versions(place_ids)
+
         # - Mise à jour dans le repo
         self.amenity_repo.update(amenity_id, update_data)
+        self._invalidate_amenity_catalog()
 
+        after_commit(lambda: response_cache.invalidate("amenities", f"amenity:{amenity_id}"))
+        self._invalidate_places(*place_ids)
         return amenity
 
     # ==========================
@@ -320,31 +719,48 @@ class HBnBFacade:
     # ==========================
 
     # Création d'un nouvel avis utilisateur
+    @unit_of_work()
     def create_review(self, review_data):
         """
         Crée un nouvel avis à partir d'un dictionnaire de données.
         Exige : text, rating, user_id, place_id.
         """
         try:
+            # Validation en un passage (sans effet si déjà décodé par l'API)
+            review_data = REVIEW_SCHEMA.decode(review_data)
+
             # correspondance avec le champ attendu par Swagger
-            user = self.user_repo.get(review_data["user_id"])
+            user = self.get_user(review_data["user_id"])
             if not user:
                 raise ValueError("User not found")
 
-            place = self.place_repo.get(review_data["place_id"])
+            place = self.get_place(review_data["place_id"])
             if not place:
                 raise ValueError("Place not found")
 
+            # Un seul avis par utilisateur et par lieu (index unique_user_place_review)
+            if self.has_reviewed_place(user.id, place.id):
+                raise ValueError("You have already reviewed this place")
+
             review = Review(
                 text=review_data["text"],
                 rating=review_data["rating"],
                 author=user,  # l’attribut dans Review reste "author"
                 place=place
             )
-
-            self.review_repo.add(review)
-            place.reviews.append(review)     # synchronisation relationnelle
-            self.place_repo.add(place)    # re-save du lieu avec la review liée
+            # Agrégats et version du lieu, enregistrés dans le même commit que l'avis
+            place.add_rating(review.rating)
+            place.bump_version()
+
+            # Avis et agrégats du lieu (déjà lié par Review(place=...)) : un seul commit
+            try:
+                with unit_of_work():
+                    self.review_repo.add(review)
+            except IntegrityError:
+                # Avis concurrent enregistré entre la vérification et l'insertion
+                raise ValueError("You have already reviewed this place")
+            self._refresh_place_ranking(place)
+            self._invalidate_review(review.id, review.place_id, review.user_id)
 
             return review
 
@@ -355,7 +771,14 @@ class HBnBFacade:
         """
         Récupère un avis par son identifiant.
         """
-        return self.review_repo.get(review_id)
+        return self._load_once(Review, review_id, self.review_repo.get)
+
+    def get_review_version(self, review_id):
+        """
+        Retourne l'état de version (updated_at,) d'un avis, sans le charger.
+        None si l'avis est introuvable.
+        """
+        return self.review_repo.get_version(review_id)
 
     def get_all_reviews(self):
         """
@@ -368,15 +791,13 @@ class HBnBFacade:
         Retourne la liste des avis associés à un lieu donné.
         Soulève une erreur si le lieu est introuvable.
         """
-        place = self.place_repo.get(place_id)
+        place = self.get_place(place_id)
         if not place:
             raise ValueError("Place not found")
 
-        return [
-            review for review in self.review_repo.get_all()
-            if review.place and review.place.id == place_id
-        ]
+        return self.review_repo.find_by_place(place_id)
 
+    @unit_of_work()
     def update_review(self, review_id, update_data):
         """
         Met à jour le texte et/ou la note d'un avis existant.
@@ -387,18 +808,25 @@ class HBnBFacade:
             raise ValueError(f"Review with ID {review_id} not found")
 
         # Mise à jour conditionnelle
+        update_data = REVIEW_UPDATE_SCHEMA.decode(update_data)
         if "text" in update_data:
-            review.text = review.validate_text(update_data["text"], "Text")
+            review.text = update_data["text"]
 
         if "rating" in update_data:
-            review.rating = review.validate_rating(update_data["rating"],
-                                                   "Rating")
+            old_rating = review.rating
+            review.rating = update_data["rating"]
+            review.place.replace_rating(old_rating, review.rating)
+        review.place.bump_version()
 
         # Sauvegarde dans le repo
         self.review_repo.add(review)
+        if "rating" in update_data:
+            self._refresh_place_ranking(review.place)
+        self._invalidate_review(review.id, review.place_id, review.user_id)
 
         return review
 
+    @unit_of_work()
     def delete_review(self, review_id):
         """
         Supprime un avis par son identifiant.
@@ -409,34 +837,74 @@ class HBnBFacade:
         if not review:
             raise ValueError("Review not found")
 
-        # Nettoyage de la relation dans le Place concerné
+        review_keys = (review.id, review.place_id, review.user_id)
+
+        # Nettoyage de la relation dans le Place concerné ; les agrégats
+        # sont enregistrés dans le même commit que la suppression de l'avis
         place = review.place
+        if place:
+            place.remove_rating(review.rating)
+            place.bump_version()
         if place and review in place.reviews:
             place.reviews.remove(review)
-            self.place_repo.add(place)
-
         self.review_repo.delete(review_id)
+        self._forget(Review, review_id)
+        if place:
+            self._refresh_place_ranking(place)
+        self._invalidate_review(*review_keys)
 
     def get_reviews_by_user(self, user_id):
         """
         Retourne la liste des avis rédigés par un utilisateur donné.
         Soulève une erreur si l'utilisateur est introuvable.
         """
-        user = self.user_repo.get(user_id)
+        user = self.get_user(user_id)
         if not user:
             raise ValueError("User not found")
 
-        return [
-            review for review in self.review_repo.get_all()
-            if review.author and review.author.id == user_id
-        ]
+        return self.review_repo.find_by_user(user_id)
+
+    def _invalidate_review(self, review_id, place_id, user_id):
+        """
+        Invalide les réponses en cache contenant un avis : l'avis, les listes
+        d'avis de son lieu et de son auteur, et le lieu lui-même (agrégats).
+        """
+        after_commit(lambda: response_cache.invalidate(
+            "reviews", f"review:{review_id}",
+            f"reviews:place:{place_id}", f"reviews:user:{user_id}"
+        ))
+        self._invalidate_places(place_id)
+
+    def _invalidate_places(self, *place_ids):
+        """
+        Invalide les listes de lieux en cache et le détail des lieux donnés,
+        après le commit de l'opération en cours.
+        """
+        tags = ["places", *(f"place:{place_id}" for place_id in place_ids)]
+        after_commit(lambda: response_cache.invalidate(*tags))
+
+    def _refresh_place_ranking(self, place):
+        """
+        Reporte les agrégats d'avis d'un lieu dans le classement en mémoire,
+        après le commit de l'avis (les agrégats sont alors relus en base).
+        Les autres processus relisent le lieu, modifié dans la même
+        transaction (updated_at).
+        """
+        after_commit(lambda: place_rankings.update_place(place.id, place.review_count, place.rating_sum))
+
+    def has_reviewed_place(self, user_id, place_id):
+        """
+        Indique si un utilisateur a déjà publié un avis sur un lieu.
+        """
+        return self.review_repo.find_by_user_and_place(user_id, place_id) is not None
 
     def get_average_rating_for_place(self, place_id):
         """
-        Calcule la moyenne des notes pour un lieu donné.
+        Retourne la moyenne des notes pour un lieu donné, lue dans les
+        agrégats du lieu (sans charger ses avis).
         Retourne None si aucun avis.
         """
-        reviews = self.get_reviews_by_place(place_id)
-        if not reviews:
-            return None
-        return sum(r.rating for r in reviews) / len(reviews)
+        place = self.get_place(place_id)
+        if not place:
+            raise ValueError("Place not found")
+        return place.average_rating
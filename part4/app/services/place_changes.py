@@ -0,0 +1,62 @@
+"""services/place_changes.py
+
+Relecture périodique des lieux modifiés, pour les structures tenues en
+mémoire par chaque processus (classement, index des commodités).
+
+Chaque écriture touchant un lieu (avis, commodités, création) met à jour
+sa colonne updated_at. Au plus une fois par check_interval, une structure
+relit seulement les lieux modifiés depuis sa lecture précédente, via
+l'index idx_places_updated_at, et les applique un par un : les écritures
+des autres processus sont prises en compte sans ligne de compteur partagée
+ni rechargement complet.
+
+La fenêtre relue commence margin secondes avant la lecture précédente,
+pour couvrir les transactions validées après avoir daté leur écriture et
+un léger décalage d'horloge entre processus. Relire un lieu deux fois est
+sans effet : les valeurs lues remplacent simplement les précédentes.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+# Intervalle minimal, en secondes, entre deux relectures des lieux modifiés
+DEFAULT_CHECK_INTERVAL = 1.0
+
+# Recouvrement entre deux fenêtres de relecture
+DEFAULT_MARGIN = timedelta(seconds=5)
+
+
+class ChangeWindow:
+    """
+    Date de la dernière relecture des lieux modifiés et échéance de la
+    suivante. N'est pas protégée par un verrou : les méthodes sont appelées
+    sous le verrou de la structure.
+    """
+
+    def __init__(self, check_interval=DEFAULT_CHECK_INTERVAL, margin=DEFAULT_MARGIN):
+        self.check_interval = check_interval
+        self.margin = margin
+        self.reset()
+
+    def reset(self):
+        """Oublie la dernière relecture : la structure sera reconstruite."""
+        self._since = None
+        self._check_at = 0.0
+
+    def due(self):
+        """Indique si les lieux modifiés doivent être relus."""
+        return time.monotonic() >= self._check_at
+
+    def advance(self):
+        """
+        Ouvre une nouvelle relecture.
+
+        Retour :
+        - date à partir de laquelle relire les lieux modifiés, ou None si la
+          structure n'a jamais été construite (tout relire)
+        """
+        now = datetime.now(timezone.utc)
+        since = None if self._since is None else self._since - self.margin
+        self._since = now
+        self._check_at = time.monotonic() + self.check_interval
+        return since
@@ -0,0 +1,209 @@
+"""services/rankings.py
+
+Classement des lieux par note bayésienne, tenu en mémoire.
+
+La note bayésienne d'un lieu rapproche sa moyenne de la moyenne globale
+tant qu'il a peu d'avis :
+
+    score = (C * m + somme des notes) / (C + nombre d'avis)
+
+où m est la moyenne globale des notes et C le poids de cet a priori
+(équivalent à C avis "virtuels" de note m).
+
+Le classement est construit à partir des agrégats stockés sur les lieux
+(review_count, rating_sum), puis mis à jour lieu par lieu par HBnBFacade
+à chaque modification d'avis. La moyenne globale m est figée lors de la
+construction : le classement n'est reconstruit entièrement que lorsque la
+moyenne réelle s'en écarte de plus de max_prior_drift.
+
+Les avis écrits par d'autres processus sont pris en compte en relisant
+périodiquement les agrégats des seuls lieux modifiés (voir place_changes.py).
+"""
+
+import threading
+from bisect import bisect_left, insort
+from heapq import merge
+
+from app.services.place_changes import ChangeWindow, DEFAULT_CHECK_INTERVAL
+
+# Nombre d'avis "virtuels" donnant le poids de la moyenne globale
+DEFAULT_PRIOR_WEIGHT = 5
+
+# Écart toléré entre la moyenne globale figée et la moyenne réelle
+DEFAULT_MAX_PRIOR_DRIFT = 0.05
+
+# Moyenne globale utilisée tant qu'aucun avis n'existe
+DEFAULT_PRIOR_MEAN = 3.0
+
+
+class PlaceLeaderboard:
+    """
+    Classement des lieux par note bayésienne décroissante.
+
+    Les lieux ayant au moins un avis sont gardés dans une liste triée de
+    clés (-score, place_id) ; repositionner un lieu après un avis coûte une
+    recherche dichotomique. Les lieux sans avis, tous notés m, sont gardés
+    à part et ne sont triés puis parcourus que si min_reviews vaut 0.
+
+    Lire le haut du classement parcourt la liste jusqu'à trouver limit
+    lieux ayant au moins min_reviews avis : avec min_reviews=1 (par défaut),
+    le coût ne dépend que de limit ; au-delà, il croît avec le nombre de
+    lieux mieux notés ayant moins de min_reviews avis.
+    """
+
+    def __init__(self, prior_weight=DEFAULT_PRIOR_WEIGHT, max_prior_drift=DEFAULT_MAX_PRIOR_DRIFT,
+                 check_interval=DEFAULT_CHECK_INTERVAL):
+        self.prior_weight = prior_weight
+        self.max_prior_drift = max_prior_drift
+        self._changes = ChangeWindow(check_interval)
+        self._lock = threading.Lock()
+        self._clear()
+
+    def init_app(self, app):
+        """
+        Lit la configuration de l'application et vide le classement,
+        qui sera reconstruit depuis la base de cette application.
+        """
+        self.prior_weight = app.config.get("PLACE_RANKING_PRIOR_WEIGHT", DEFAULT_PRIOR_WEIGHT)
+        self.max_prior_drift = app.config.get("PLACE_RANKING_MAX_PRIOR_DRIFT", DEFAULT_MAX_PRIOR_DRIFT)
+        self._changes.check_interval = app.config.get("PLACE_RANKING_CHECK_INTERVAL", DEFAULT_CHECK_INTERVAL)
+        self.reset()
+
+    def reset(self):
+        """Vide le classement ; il sera reconstruit au prochain ensure_loaded()."""
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        self._stats = {}        # place_id -> (review_count, rating_sum)
+        self._keys = {}         # place_id -> clé (-score, place_id) dans _ranking
+        self._ranking = []      # clés des lieux avec avis, meilleur score en premier
+        self._unreviewed = set()  # lieux sans avis
+        self._total_count = 0
+        self._total_sum = 0
+        self._prior_mean = DEFAULT_PRIOR_MEAN
+        self._changes.reset()
+        self.loaded = False
+
+    # ========== CONSTRUCTION ET MISE À JOUR ==========
+
+    def ensure_loaded(self, load_stats):
+        """
+        Construit le classement s'il ne l'est pas encore ; sinon, au plus une
+        fois par check_interval, y reporte les agrégats des lieux modifiés.
+
+        Paramètres :
+        - load_stats (callable) : load_stats(since) retourne les tuples
+          (place_id, review_count, rating_sum) des lieux modifiés depuis
+          since (tous si since vaut None) ; appelée sous le verrou
+        """
+        if self.loaded and not self._changes.due():
+            return
+        with self._lock:
+            if self.loaded and not self._changes.due():
+                return
+            since = self._changes.advance()
+            if since is None or not self.loaded:
+                self._load(load_stats(None))
+            else:
+                self._apply(load_stats(since))
+
+    def _load(self, stats):
+        self._stats = {}
+        self._total_count = 0
+        self._total_sum = 0
+        for place_id, review_count, rating_sum in stats:
+            self._stats[place_id] = (review_count, rating_sum)
+            self._total_count += review_count
+            self._total_sum += rating_sum
+        self._rebuild()
+        self.loaded = True
+
+    def update_place(self, place_id, review_count, rating_sum):
+        """
+        Enregistre les nouveaux agrégats d'un lieu et le repositionne.
+        Sans effet tant que le classement n'est pas construit : il sera
+        alors lu directement depuis la base.
+        """
+        self.update_places([(place_id, review_count, rating_sum)])
+
+    def update_places(self, stats):
+        """
+        Variante groupée de update_place pour des tuples
+        (place_id, review_count, rating_sum).
+        """
+        with self._lock:
+            if self.loaded:
+                self._apply(stats)
+
+    def _apply(self, stats):
+        for place_id, review_count, rating_sum in stats:
+            old_count, old_sum = self._stats.get(place_id, (0, 0))
+            self._stats[place_id] = (review_count, rating_sum)
+            self._total_count += review_count - old_count
+            self._total_sum += rating_sum - old_sum
+
+            if abs(self._current_mean() - self._prior_mean) > self.max_prior_drift:
+                self._rebuild()
+            else:
+                self._reposition(place_id)
+
+    def _current_mean(self):
+        if not self._total_count:
+            return DEFAULT_PRIOR_MEAN
+        return self._total_sum / self._total_count
+
+    def _score(self, review_count, rating_sum):
+        weight = self.prior_weight
+        return (weight * self._prior_mean + rating_sum) / (weight + review_count)
+
+    def _rebuild(self):
+        self._prior_mean = self._current_mean()
+        self._keys = {
+            place_id: (-self._score(review_count, rating_sum), place_id)
+            for place_id, (review_count, rating_sum) in self._stats.items()
+            if review_count
+        }
+        self._ranking = sorted(self._keys.values())
+        self._unreviewed = {place_id for place_id, (review_count, _) in self._stats.items() if not review_count}
+
+    def _reposition(self, place_id):
+        old_key = self._keys.pop(place_id, None)
+        if old_key is not None:
+            del self._ranking[bisect_left(self._ranking, old_key)]
+        review_count, rating_sum = self._stats[place_id]
+        if not review_count:
+            self._unreviewed.add(place_id)
+            return
+        self._unreviewed.discard(place_id)
+        key = (-self._score(review_count, rating_sum), place_id)
+        self._keys[place_id] = key
+        insort(self._ranking, key)
+
+    # ========== LECTURE ==========
+
+    def top(self, limit, min_reviews=1):
+        """
+        Retourne les meilleurs lieux ayant au moins min_reviews avis.
+
+        Retour :
+        - liste de tuples (place_id, score, review_count), meilleur score en premier
+        """
+        results = []
+        with self._lock:
+            ranking = self._ranking
+            if not min_reviews and self._unreviewed:
+                # Lieux sans avis insérés à leur rang, la note a priori m
+                prior_key = -self._score(0, 0)
+                ranking = merge(ranking, sorted((prior_key, place_id) for place_id in self._unreviewed))
+            for neg_score, place_id in ranking:
+                review_count = self._stats[place_id][0]
+                if review_count >= min_reviews:
+                    results.append((place_id, -neg_score, review_count))
+                    if len(results) >= limit:
+                        break
+        return results
+
+
+# Classement partagé par l'application, initialisé dans create_app()
+place_rankings = PlaceLeaderboard()
@@ -0,0 +1,96 @@
+"""services/token_blocklist.py
+
+Ensemble des jetons de rafraîchissement révoqués, tenu en mémoire.
+
+Chaque requête authentifiée par un jeton de rafraîchissement vérifie que
+son jti n'est pas révoqué : la vérification est une simple lecture d'un
+ensemble Python. L'ensemble est construit une seule fois depuis la table
+revoked_tokens (jetons non expirés), puis complété par HBnBFacade à chaque
+révocation, persistée dans cette table.
+
+L'ensemble est propre à chaque processus ; l'unicité de revoked_tokens.jti
+garantit qu'un jeton n'est consommé qu'une seule fois, même si un autre
+processus ne connaît pas encore sa révocation.
+
+La rotation des jetons de rafraîchissement ajoute une ligne à chaque
+renouvellement : au plus une fois par purge_interval, une révocation
+supprime aussi les lignes des jetons expirés, qui ne peuvent plus être
+présentés, et l'ensemble est alors reconstruit sans eux.
+"""
+
+import threading
+import time
+
+# Intervalle minimal, en secondes, entre deux purges des jetons expirés
+DEFAULT_PURGE_INTERVAL = 3600
+
+
+class TokenBlocklist:
+    """
+    Ensemble des jti révoqués.
+    """
+
+    def __init__(self, purge_interval=DEFAULT_PURGE_INTERVAL):
+        self.purge_interval = purge_interval
+        self._purge_at = 0.0
+        self._lock = threading.Lock()
+        self._clear()
+
+    def init_app(self, app):
+        """
+        Lit la configuration et vide l'ensemble, qui sera reconstruit depuis
+        la base de cette application ; la prochaine révocation purge la table.
+        """
+        self.purge_interval = app.config.get("REVOKED_TOKEN_PURGE_INTERVAL", DEFAULT_PURGE_INTERVAL)
+        self._purge_at = 0.0
+        self.reset()
+
+    def reset(self):
+        """Vide l'ensemble ; il sera reconstruit au prochain ensure_loaded()."""
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        self._jtis = set()
+        self.loaded = False
+
+    def ensure_loaded(self, load_jtis):
+        """
+        Construit l'ensemble s'il ne l'est pas encore.
+
+        Paramètres :
+        - load_jtis (callable) : retourne les jti révoqués non expirés ;
+          appelée une seule fois, sous le verrou
+        """
+        if self.loaded:
+            return
+        with self._lock:
+            if self.loaded:
+                return
+            self._jtis = set(load_jtis())
+            self.loaded = True
+
+    def add(self, jti):
+        """Ajoute un jti révoqué (sans effet tant que l'ensemble n'est pas construit)."""
+        with self._lock:
+            if self.loaded:
+                self._jtis.add(jti)
+
+    def purge_due(self):
+        """
+        Indique si les jetons expirés doivent être purgés ; retourne True au
+        plus une fois par purge_interval.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._purge_at:
+                return False
+            self._purge_at = now + self.purge_interval
+            return True
+
+    def __contains__(self, jti):
+        return jti in self._jtis
+
+
+# Ensemble partagé par l'application, initialisé dans create_app()
+token_blocklist = TokenBlocklist()
@@ -0,0 +1,93 @@
+"""services/user_auth_cache.py
+
+Cache des informations d'authentification des utilisateurs (id, is_admin).
+
+Les endpoints protégés par JWT vérifient que l'utilisateur du jeton existe
+toujours et s'il est administrateur : ces informations changent rarement,
+elles sont gardées quelques secondes (TTL) plutôt que relues en base à
+chaque requête. HBnBFacade.update_user invalide l'entrée de l'utilisateur
+modifié dans son propre processus seulement : un utilisateur dont les
+droits administrateur sont retirés par un autre processus les conserve ici
+jusqu'à l'expiration de l'entrée (USER_AUTH_CACHE_TTL ; 0 désactive le
+cache et relit ces informations à chaque requête).
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+# Durée de vie d'une entrée, en secondes
+DEFAULT_TTL = 30
+
+# Nombre maximum d'utilisateurs gardés en cache
+DEFAULT_MAX_ENTRIES = 10000
+
+# Informations d'authentification d'un utilisateur
+UserAuth = namedtuple("UserAuth", ["id", "is_admin"])
+
+
+class UserAuthCache:
+    """
+    Cache user_id -> UserAuth, avec expiration (TTL) et taille bornée.
+    Un TTL ou une taille nuls désactivent le cache.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # user_id -> (expiration, UserAuth)
+
+    def init_app(self, app):
+        """Lit la configuration de l'application et vide le cache."""
+        self.ttl = app.config.get("USER_AUTH_CACHE_TTL", DEFAULT_TTL)
+        self.max_entries = app.config.get("USER_AUTH_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        self.clear()
+
+    def get(self, user_id, load_user):
+        """
+        Retourne les informations d'authentification d'un utilisateur.
+
+        Paramètres :
+        - user_id (str) : identifiant de l'utilisateur
+        - load_user (callable) : load_user(user_id) retourne le User ou None,
+          appelée seulement si l'entrée est absente ou expirée
+
+        Retour :
+        - UserAuth, ou None si l'utilisateur n'existe pas (non mis en cache)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        user = load_user(user_id)
+        if user is None:
+            self.invalidate(user_id)
+            return None
+        auth = UserAuth(user.id, bool(user.is_admin))
+        if self.ttl > 0 and self.max_entries > 0:
+            with self._lock:
+                self._entries.pop(user_id, None)
+                self._entries[user_id] = (now + self.ttl, auth)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return auth
+
+    def invalidate(self, user_id):
+        """Supprime l'entrée d'un utilisateur."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        """Vide entièrement le cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Cache partagé par l'application, initialisé dans create_app()
+user_auth_cache = UserAuthCache()
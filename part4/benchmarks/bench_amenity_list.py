@@ -0,0 +1,88 @@
+"""
+benchmarks/bench_amenity_list.py
+
+Latence de GET /api/v1/amenities/ selon le nombre de lieux en base.
+
+La liste des commodités ne renvoie que id et name : les lieux liés ne sont
+plus chargés (relation Amenity.places en lazy="select"), la latence doit
+rester stable quand le nombre de lieux augmente. À titre de comparaison,
+la même lecture est mesurée avec préchargement explicite des lieux
+(load=("places",)), proche de l'ancien comportement lazy="subquery".
+
+Le cache des réponses est désactivé (RESPONSE_CACHE_TTL = 0) afin que
+chaque requête lise la base.
+
+Utilisation (depuis part4/) :
+    python -m benchmarks.bench_amenity_list [commodités] [répétitions]
+"""
+
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from app import create_app
+from app.extensions import db
+from app.services import facade
+from config import TestingConfig
+
+PLACE_COUNTS = (0, 1000, 5000, 20000)
+
+
+def make_app(database_path, amenity_count, place_count):
+    config = type("BenchConfig", (TestingConfig,), {
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{database_path}",
+        "RESPONSE_CACHE_TTL": 0,
+    })
+    app = create_app(config)
+    with app.app_context():
+        db.create_all()
+        owner = facade.create_user({"first_name": "Bench", "last_name": "User",
+                                    "email": "bench@example.com", "password": "Benchmark123!!"})
+        amenity_ids = [facade.create_amenity({"name": f"Amenity {i}"}).id for i in range(amenity_count)]
+        # Chaque lieu propose toutes les commodités
+        facade.create_places_bulk(owner.id, [
+            {"title": f"Place {i}", "description": "Benchmark", "price": 80.0,
+             "latitude": 45.0, "longitude": 3.0, "amenities": amenity_ids}
+            for i in range(place_count)
+        ])
+    return app
+
+
+def measure(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def run(app, repeat):
+    with app.test_client() as client:
+        endpoint = measure(lambda: client.get("/api/v1/amenities/"), repeat)
+
+    def eager():
+        with app.app_context():
+            facade.amenity_repo.get_all(load=("places",))
+            db.session.remove()
+    return endpoint, measure(eager, repeat)
+
+
+def main(amenity_count=10, repeat=20):
+    print(f"{amenity_count} commodités, chacune liée à tous les lieux ; médiane sur {repeat} requêtes")
+    print(f"{'lieux':>7} {'GET /amenities/':>17} {'avec load=places':>18}")
+    for place_count in PLACE_COUNTS:
+        with tempfile.TemporaryDirectory() as directory:
+            # create_app et les requêtes écrivent des traces sur la sortie standard
+            with contextlib.redirect_stdout(io.StringIO()):
+                app = make_app(os.path.join(directory, "bench.db"), amenity_count, place_count)
+                endpoint, eager = run(app, repeat)
+        print(f"{place_count:>7} {endpoint:>14.2f} ms {eager:>15.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,111 @@
+"""
+benchmarks/bench_json_provider.py
+
+Encodage JSON des grosses réponses de lieux selon le fournisseur JSON
+(JSON_PROVIDER : "json", bibliothèque standard, ou "orjson").
+
+Une base SQLite temporaire est remplie une seule fois : des lieux avec
+leur propriétaire, toutes les commodités et plusieurs avis chacun. Pour
+chaque fournisseur, on mesure :
+- l'encodage seul d'une page de lieux déjà sérialisée ;
+- GET /api/v1/places/ (page maximale, relations embarquées) ;
+- GET /api/v1/places/export (tous les lieux en NDJSON).
+
+Le cache des réponses est désactivé (RESPONSE_CACHE_TTL = 0).
+
+Utilisation (depuis part4/) :
+    python -m benchmarks.bench_json_provider [lieux] [répétitions]
+"""
+
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+
+from app import create_app
+from app.api.v1.places import MAX_PAGE_SIZE
+from app.extensions import db
+from app.models.review import Review
+from app.models.user import User
+from app.services import facade
+from config import TestingConfig
+
+PROVIDERS = ("json", "orjson")
+AMENITIES = 10
+REVIEWS_PER_PLACE = 3
+INCLUDE = "owner,amenities,reviews"
+
+
+def make_app(database_path, provider):
+    config = type("BenchConfig", (TestingConfig,), {
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{database_path}",
+        "RESPONSE_CACHE_TTL": 0,
+        "JSON_PROVIDER": provider,
+    })
+    return create_app(config)
+
+
+def populate(app, place_count):
+    with app.app_context():
+        db.create_all()
+        users = [User(first_name="Guest", last_name=f"N°{i}", email=f"guest{i}@example.com",
+                      password="not-a-real-hash") for i in range(REVIEWS_PER_PLACE + 1)]
+        db.session.add_all(users)
+        db.session.commit()
+        amenity_ids = [facade.create_amenity({"name": f"Commodité {i}"}).id for i in range(AMENITIES)]
+        results = facade.create_places_bulk(users[0].id, [
+            {"title": f"Lieu {i}", "description": "Bel appartement lumineux, proche du centre. " * 4,
+             "price": 80.0 + i % 50, "latitude": 45.0, "longitude": 3.0, "amenities": amenity_ids}
+            for i in range(place_count)
+        ])
+        db.session.add_all(
+            Review(text="Séjour parfait, hôte très réactif.", rating=1 + (i + j) % 5,
+                   user_id=users[j + 1].id, place_id=result["id"])
+            for i, result in enumerate(results) for j in range(REVIEWS_PER_PLACE)
+        )
+        db.session.commit()
+
+
+def median_ms(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def run(app, repeat):
+    page_url = f"/api/v1/places/?limit={MAX_PAGE_SIZE}&include={INCLUDE}"
+    with app.app_context(), app.test_client() as client:
+        payload = client.get(page_url).get_json()
+        encode = min(timeit.repeat(lambda: app.json.response(payload), number=repeat, repeat=3)) / repeat * 1000
+        page = median_ms(lambda: client.get(page_url).data, repeat)
+        export = median_ms(lambda: client.get(f"/api/v1/places/export?include={INCLUDE}").data, max(repeat // 5, 1))
+    return encode, page, export, len(payload["places"])
+
+
+def main(place_count=2000, repeat=20):
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = os.path.join(directory, "bench.db")
+        results = {}
+        # create_app et les requêtes écrivent des traces sur la sortie standard
+        with contextlib.redirect_stdout(io.StringIO()):
+            populate(make_app(database_path, "json"), place_count)
+            for provider in PROVIDERS:
+                results[provider] = run(make_app(database_path, provider), repeat)
+
+    page_size = results[PROVIDERS[0]][3]
+    print(f"{place_count} lieux, {AMENITIES} commodités et {REVIEWS_PER_PLACE} avis par lieu ; "
+          f"page de {page_size} lieux")
+    print(f"{'fournisseur':>11} {'encodage page':>14} {'GET /places':>12} {'GET /export':>12}")
+    for provider, (encode, page, export, _) in results.items():
+        print(f"{provider:>11} {encode:>11.2f} ms {page:>9.2f} ms {export:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,107 @@
+"""
+benchmarks/bench_login_throughput.py
+
+Débit de POST /api/v1/auth/login selon le facteur de coût bcrypt
+(BCRYPT_LOG_ROUNDS) et la taille du pool de hachage (PASSWORD_HASH_POOL_SIZE,
+0 : bcrypt dans le thread de la requête).
+
+Pour chaque combinaison, des threads clients envoient des connexions en
+rafale pendant qu'un autre thread mesure la latence d'une lecture rapide
+(GET /api/v1/amenities/) : la rafale ne doit pas la bloquer. Les connexions
+refusées faute de place dans le pool (503) sont comptées à part.
+
+Utilisation (depuis part4/) :
+    python -m benchmarks.bench_login_throughput [clients] [connexions_par_client]
+"""
+
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from app import create_app
+from app.extensions import db, password_hasher
+from app.services import facade
+from config import TestingConfig
+
+COSTS = (10, 12)
+POOL_SIZES = (0, 1, 2, 4)
+
+EMAIL = "bench@example.com"
+PASSWORD = "Benchmark123!!"
+
+
+def make_app(database_path, cost, pool_size, clients):
+    config = type("BenchConfig", (TestingConfig,), {
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{database_path}",
+        "BCRYPT_LOG_ROUNDS": cost,
+        "PASSWORD_HASH_POOL_SIZE": pool_size,
+        "PASSWORD_HASH_MAX_PENDING": clients,
+        "RESPONSE_CACHE_TTL": 0,
+    })
+    app = create_app(config)
+    with app.app_context():
+        db.create_all()
+        facade.create_user({"first_name": "Bench", "last_name": "User", "email": EMAIL, "password": PASSWORD})
+    return app
+
+
+def run(app, clients, logins_per_client):
+    statuses = []
+    latencies = []
+    done = threading.Event()
+
+    def login():
+        with app.test_client() as client:
+            for _ in range(logins_per_client):
+                res = client.post("/api/v1/auth/login", json={"email": EMAIL, "password": PASSWORD})
+                statuses.append(res.status_code)
+
+    def read():
+        with app.test_client() as client:
+            while not done.is_set():
+                start = time.perf_counter()
+                client.get("/api/v1/amenities/")
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=login) for _ in range(clients)]
+    reader = threading.Thread(target=read)
+    start = time.perf_counter()
+    reader.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    reader.join()
+
+    accepted = statuses.count(200)
+    return {
+        "logins_per_s": accepted / elapsed,
+        "rejected": statuses.count(503),
+        "read_ms": statistics.median(latencies) * 1000 if latencies else float("nan"),
+    }
+
+
+def main(clients=8, logins_per_client=10):
+    print(f"{clients} clients x {logins_per_client} connexions, {os.cpu_count()} CPU")
+    print(f"{'coût':>5} {'pool':>5} {'connexions/s':>14} {'503':>6} {'lecture (médiane)':>19}")
+    for cost in COSTS:
+        for pool_size in POOL_SIZES:
+            with tempfile.TemporaryDirectory() as directory:
+                # create_app et les requêtes écrivent des traces sur la sortie standard
+                with contextlib.redirect_stdout(io.StringIO()):
+                    app = make_app(os.path.join(directory, "bench.db"), cost, pool_size, clients)
+                    result = run(app, clients, logins_per_client)
+                    password_hasher.shutdown()
+            print(f"{cost:>5} {pool_size:>5} {result['logins_per_s']:>14.1f} "
+                  f"{result['rejected']:>6} {result['read_ms']:>16.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,113 @@
+"""
+benchmarks/bench_place_serializer.py
+
+Micro-benchmark de la sérialisation des lieux : sérialiseur partagé
+(app/api/v1/serializers.py) contre l'ancien code écrit à la main dans
+places.py, recopié ci-dessous.
+
+Les lieux sont construits en mémoire (sans base de données), avec leur
+propriétaire, leurs commodités et leurs avis, afin de ne mesurer que la
+sérialisation.
+
+Utilisation (depuis part4/) :
+    python -m benchmarks.bench_place_serializer [nombre_de_lieux] [répétitions]
+"""
+
+import sys
+import timeit
+
+from sqlalchemy.orm import configure_mappers
+
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from app.models.review import Review
+from app.api.v1.serializers import PLACE_FIELDS, PLACE_RELATIONS, get_place_serializer
+
+
+# ========== ANCIEN CODE (places.py, avant le sérialiseur partagé) ==========
+
+def inline_serialize_user(user):
+    return {
+        "id": user.id,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "email": user.email
+    }
+
+
+def inline_serialize_place(place, place_fields=PLACE_FIELDS, include=PLACE_RELATIONS):
+    data = {field: getattr(place, field) for field in place_fields}
+    if 'owner' in include:
+        data["owner"] = inline_serialize_user(place.owner)
+    if 'amenities' in include:
+        data["amenities"] = [
+            {
+                "id": amenity.id,
+                "name": amenity.name
+            }
+            for amenity in place.amenities
+        ]
+    if 'reviews' in include:
+        data["reviews"] = [
+            {
+                "id": review.id,
+                "text": review.text,
+                "rating": review.rating,
+                "user": inline_serialize_user(review.author)
+            }
+            for review in place.reviews
+        ]
+    return data
+
+
+# ========== JEU DE DONNÉES ==========
+
+def build_places(count, amenities_per_place=5, reviews_per_place=5):
+    configure_mappers()
+    users = [
+        User(id=f"user-{i}", first_name="First", last_name=f"Last {i}",
+             email=f"user{i}@example.com", password="not-a-real-hash")
+        for i in range(reviews_per_place + 1)
+    ]
+    amenities = [Amenity(id=f"amenity-{i}", name=f"Amenity {i}") for i in range(amenities_per_place)]
+
+    places = []
+    for i in range(count):
+        place = Place(
+            id=f"place-{i}", title=f"Place {i}", description="Nice place",
+            price=80.0 + i, latitude=45.0, longitude=3.0,
+            review_count=0, rating_sum=0,
+            rating_1=0, rating_2=0, rating_3=0, rating_4=0, rating_5=0
+        )
+        place.owner = users[0]
+        place.amenities.extend(amenities)
+        for j, author in enumerate(users[1:]):
+            Review(id=f"review-{i}-{j}", text="Great stay", rating=4, author=author, place=place)
+        places.append(place)
+    return places
+
+
+def measure(name, serialize, places, repeat):
+    seconds = min(timeit.repeat(lambda: [serialize(place) for place in places], number=1, repeat=repeat))
+    print(f"{name:<32} {len(places) / seconds:>12,.0f} places/s")
+    return seconds
+
+
+def main(count=2000, repeat=5):
+    places = build_places(count)
+    shared = get_place_serializer(PLACE_FIELDS, PLACE_RELATIONS)
+    assert [shared(p) for p in places[:10]] == [inline_serialize_place(p) for p in places[:10]]
+
+    print(f"{count} lieux, 5 commodités et 5 avis par lieu, meilleur de {repeat} passes")
+    for include in (PLACE_RELATIONS, ()):
+        label = "avec relations" if include else "sans relations"
+        shared = get_place_serializer(PLACE_FIELDS, include)
+        inline = measure(f"code inline ({label})", lambda p: inline_serialize_place(p, PLACE_FIELDS, include),
+                         places, repeat)
+        fast = measure(f"partagé ({label})", shared, places, repeat)
+        print(f"{'gain':<32} {inline / fast:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
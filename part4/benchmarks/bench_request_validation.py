@@ -0,0 +1,185 @@
+"""
+benchmarks/bench_request_validation.py
+
+Validation des requêtes : schémas (app/schemas.py) contre
+l'ancien chemin, recopié ci-dessous :
+- POST /reviews et POST /users : validation JSON Schema de flask-restx
+  (@api.expect(..., validate=True)) ;
+- POST /users : validateurs du modèle appelés sur des User() jetables ;
+- lieux : validateurs validate_* du modèle Place (création en masse).
+
+Mesure ensuite le débit de bout en bout (requêtes/s, client de test Flask,
+base SQLite dans un fichier temporaire) de POST /api/v1/places/ et
+POST /api/v1/reviews/.
+
+Utilisation (depuis part4/) :
+    python -m benchmarks.bench_request_validation [répétitions] [requêtes]
+"""
+
+import contextlib
+import io
+import os
+import re
+import sys
+import tempfile
+import time
+import timeit
+
+from flask_jwt_extended import create_access_token
+
+from app import create_app
+from app.extensions import db
+from app.models.user import User
+from app.api.v1.reviews import review_model
+from app.api.v1.users import user_input_model
+from app.schemas import PLACE_SCHEMA, REVIEW_SCHEMA, USER_SCHEMA
+from app.services import facade
+from config import TestingConfig
+
+PLACE = {"title": "Loft", "description": "Nice place", "price": 80.0,
+         "latitude": 45.0, "longitude": 3.0, "amenities": []}
+REVIEW = {"text": "Great stay", "rating": 4, "user_id": "u", "place_id": "p"}
+USER = {"first_name": "Leia", "last_name": "Organa", "email": "leia@rebellion.org",
+        "password": "Alderaan123!!"}
+
+
+# ========== ANCIEN CODE (validateurs des modèles) ==========
+
+def validate_string(value, field_name, max_length=None):
+    if not isinstance(value, str):
+        raise TypeError(f"{field_name} must be a string")
+    value = value.strip()
+    if not value:
+        raise ValueError(f"{field_name} is required")
+    if max_length is not None and len(value) > max_length:
+        raise ValueError(f"{field_name} must be at most {max_length} characters")
+    return value
+
+
+def validate_email(value):
+    if not isinstance(value, str):
+        raise TypeError("Email must be a string")
+    value = value.strip().lower()
+    if not value:
+        raise ValueError("Email is required")
+    if value.count("@") != 1:
+        raise ValueError("Email must contain exactly one '@'")
+    if not re.match(r"^[^@]+@[^@]+\.[^@]+$", value):
+        raise ValueError("Invalid email format")
+    return value
+
+
+def validate_coordinate(value, field_name, limit):
+    if value is None:
+        return None
+    if not isinstance(value, float):
+        raise TypeError(f"{field_name} must be a float")
+    if not (-limit <= value <= limit):
+        raise ValueError(f"{field_name} must be between {-limit} and {limit}")
+    return value
+
+
+def legacy_place(data):
+    if not isinstance(data, dict):
+        raise TypeError("Place must be a JSON object")
+    missing = [field for field in ("title", "description", "price", "latitude", "longitude")
+               if field not in data]
+    if missing:
+        raise ValueError(f"Missing required field(s): {', '.join(missing)}")
+    price = data["price"]
+    if isinstance(price, bool) or not isinstance(price, (float, int)):
+        raise TypeError("Price must be a float or int")
+    if price <= 0:
+        raise ValueError("Price must be greater than 0")
+    columns = {
+        "title": validate_string(data["title"], "Title", 100),
+        "description": validate_string(data["description"], "Description"),
+        "price": float(price),
+        "latitude": validate_coordinate(data["latitude"], "Latitude", 90.0),
+        "longitude": validate_coordinate(data["longitude"], "Longitude", 180.0),
+        "picture": None,
+    }
+    if data.get("picture") is not None:
+        columns["picture"] = validate_string(data["picture"], "Picture")
+    return columns
+
+
+def legacy_review(data):
+    review_model.validate(data)
+    return data
+
+
+def legacy_user(data):
+    user_input_model.validate(data)
+    # create_user construisait un User() jetable par validateur appelé
+    columns = {}
+    User()
+    columns["first_name"] = validate_string(data["first_name"], "First name", 50)
+    User()
+    columns["last_name"] = validate_string(data["last_name"], "Last name", 50)
+    User()
+    columns["email"] = validate_email(data["email"])
+    return columns
+
+
+# ========== DÉBIT DE BOUT EN BOUT ==========
+
+def make_app(database_path):
+    config = type("BenchConfig", (TestingConfig,), {
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{database_path}",
+        "RESPONSE_CACHE_TTL": 0,
+    })
+    app = create_app(config)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def throughput(requests):
+    with tempfile.TemporaryDirectory() as directory:
+        # create_app et les requêtes écrivent des traces sur la sortie standard
+        with contextlib.redirect_stdout(io.StringIO()):
+            app = make_app(os.path.join(directory, "bench.db"))
+            with app.app_context(), app.test_client() as client:
+                owner = facade.create_user({**USER, "email": "owner@example.com"})
+                guest = facade.create_user({**USER, "email": "guest@example.com"})
+                owner_headers = {"Authorization": f"Bearer {create_access_token(identity=owner.id)}"}
+                guest_headers = {"Authorization": f"Bearer {create_access_token(identity=guest.id)}"}
+
+                start = time.perf_counter()
+                place_ids = []
+                for i in range(requests):
+                    res = client.post("/api/v1/places/", json={**PLACE, "title": f"Place {i}"},
+                                      headers=owner_headers)
+                    place_ids.append(res.get_json()["id"])
+                places = requests / (time.perf_counter() - start)
+
+                start = time.perf_counter()
+                for place_id in place_ids:
+                    res = client.post("/api/v1/reviews/", json={**REVIEW, "place_id": place_id},
+                                      headers=guest_headers)
+                    assert res.status_code == 201
+                reviews = requests / (time.perf_counter() - start)
+    return places, reviews
+
+
+def main(repeat=20000, requests=300):
+    print(f"Validation seule, {repeat} décodages :")
+    print(f"{'requête':>10} {'ancien (µs)':>12} {'schéma (µs)':>13} {'gain':>6}")
+    for name, legacy, schema, payload in (
+        ("place", legacy_place, PLACE_SCHEMA, PLACE),
+        ("review", legacy_review, REVIEW_SCHEMA, REVIEW),
+        ("user", legacy_user, USER_SCHEMA, USER),
+    ):
+        old = min(timeit.repeat(lambda: legacy(payload), number=repeat, repeat=3)) / repeat * 1e6
+        new = min(timeit.repeat(lambda: schema.decode(payload), number=repeat, repeat=3)) / repeat * 1e6
+        print(f"{name:>10} {old:>12.2f} {new:>13.2f} {old / new:>5.1f}x")
+
+    places, reviews = throughput(requests)
+    print(f"\nDe bout en bout, {requests} requêtes :")
+    print(f"POST /places  : {places:>8.1f} requêtes/s")
+    print(f"POST /reviews : {reviews:>8.1f} requêtes/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
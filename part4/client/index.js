@@ -59,13 +59,27 @@ document.addEventListener("DOMContentLoaded", () => {
   }
   fetchPlaces(); // récupérer les lieux 
   setupPriceFilter(); // initialiser le filtre de prix
+  setupLoadMore(); // bouton de la page suivante
   }
 );
 
-// fetch des lieux depuis l'API
-async function fetchPlaces() {
+// état de la pagination : filtre courant et curseur de la page suivante
+let currentMaxPrice = null;
+let nextCursor = null;
+
+// fetch d'une page de lieux depuis l'API
+// maxPrice : prix maximal par nuit, filtré côté serveur (optionnel)
+// cursor : next_cursor de la page précédente ; sans curseur, la liste est remplacée
+async function fetchPlaces(maxPrice = null, cursor = null) {
   try {
-    const response = await fetch("http://127.0.0.1:5000/api/v1/places", {
+    const url = new URL("http://127.0.0.1:5000/api/v1/places");
+    // seuls les champs affichés sur les cartes, sans relations embarquées
+    url.searchParams.set("fields", "title,price,picture");
+    url.searchParams.set("include", "");
+    if (maxPrice) url.searchParams.set("max_price", maxPrice);
+    if (cursor) url.searchParams.set("after", cursor);
+
+    const response = await fetch(url, {
       method: "GET",
     });
 
@@ -74,20 +88,35 @@ async function fetchPlaces() {
     }
 
     const data = await response.json();
-    displayPlaces(data.places); // afficher les lieux
+    currentMaxPrice = maxPrice;
+    nextCursor = data.next_cursor;
+    displayPlaces(data.places, Boolean(cursor)); // afficher les lieux
+    updateLoadMoreButton();
   } catch (error) {
     alert("Error: " + error.message);
   }
 }
 
-function displayPlaces(places) {
+// bouton "Load more" : demande la page suivante avec next_cursor
+function setupLoadMore() {
+  const button = document.getElementById("load-more");
+  button.addEventListener("click", () => {
+    if (nextCursor) fetchPlaces(currentMaxPrice, nextCursor);
+  });
+}
+
+function updateLoadMoreButton() {
+  document.getElementById("load-more").style.display = nextCursor ? "block" : "none";
+}
+
+// append : ajoute les lieux à la suite de ceux déjà affichés (page suivante)
+function displayPlaces(places, append = false) {
   const placesList = document.getElementById("places-list");
-  placesList.innerHTML = ""; // reset
+  if (!append) placesList.innerHTML = ""; // reset
 
   places.forEach((place) => {
     const card = document.createElement("div");
     card.className = "place-card";
-    card.setAttribute("data-price", place.price); // pour filtrer
 
     card.innerHTML = `
       <img src="${place.picture}" alt="${place.title}">
@@ -118,17 +147,9 @@ function setupPriceFilter() {
     filter.value = "All";
   }
 
+  // le filtrage est fait par l'API : seuls les lieux correspondants sont téléchargés
   filter.addEventListener("change", (event) => {
     const maxPrice = event.target.value;
-    const cards = document.querySelectorAll(".place-card");
-
-    cards.forEach((card) => {
-      const price = parseInt(card.getAttribute("data-price"));
-      if (maxPrice === "All" || price <= parseInt(maxPrice)) {
-        card.classList.remove("hidden");
-      } else {
-        card.classList.add("hidden");
-      }
-    });
+    fetchPlaces(maxPrice === "All" ? null : maxPrice);
   });
 }
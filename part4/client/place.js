@@ -72,6 +72,8 @@ async function fetchPlaceDetails(placeId, token) {
       {
         method: "GET",
         headers: headers,
+        // Revalide avec If-None-Match : 304 si le lieu n'a pas changé
+        cache: "no-cache",
       }
     );
 
@@ -0,0 +1,103 @@
+import time
+import pytest
+from app import create_app
+from app.extensions import db
+from app.models.user import User
+from app.models.amenity import Amenity
+from app.services import facade
+from app.services.amenity_catalog import amenity_catalog
+from config import TestingConfig
+from tests.test_places_endpoint import count_queries
+
+
+class UncachedConfig(TestingConfig):
+    RESPONSE_CACHE_TTL = 0
+
+
+@pytest.fixture
+def client():
+    app = create_app(UncachedConfig)
+    with app.app_context():
+        db.create_all()
+        with app.test_client() as client:
+            yield client
+        db.session.remove()
+        db.drop_all()
+
+
+def create_places(amenities, count):
+    owner = User(first_name="Owner", last_name="Test", email="owner@example.com", password="not-a-real-hash")
+    db.session.add(owner)
+    db.session.commit()
+    facade.create_places_bulk(owner.id, [
+        {"title": f"Place {i}", "description": "Nice place", "price": 80.0,
+         "latitude": 45.0, "longitude": 3.0, "amenities": [a.id for a in amenities]}
+        for i in range(count)
+    ])
+
+
+def list_amenities(client):
+    amenity_catalog.reset()
+    db.session.expire_all()
+    with count_queries() as statements:
+        res = client.get("/api/v1/amenities/")
+    assert res.status_code == 200
+    return res.get_json(), statements
+
+
+def test_amenity_list_does_not_load_places(client):
+    amenities = [facade.create_amenity({"name": name}) for name in ("Wi-Fi", "Pool")]
+    _, before = list_amenities(client)
+
+    create_places(amenities, 25)
+    data, after = list_amenities(client)
+
+    assert sorted(a["name"] for a in data) == ["Pool", "Wi-Fi"]
+    assert len(after) == len(before)
+    assert not any("places" in statement for statement in after)
+
+
+def test_amenity_places_are_loaded_on_request(client):
+    wifi = facade.create_amenity({"name": "Wi-Fi"})
+    create_places([wifi], 3)
+    db.session.expire_all()
+
+    with count_queries() as statements:
+        amenities = facade.amenity_repo.get_all(load=("places",))
+        assert len(amenities[0].places) == 3
+    assert len(statements) == 2
+
+    with pytest.raises(ValueError):
+        facade.amenity_repo.get_all(load=("reviews",))
+
+
+def test_amenity_catalog_is_served_from_memory(client):
+    wifi = facade.create_amenity({"name": "Wi-Fi"})
+    assert client.get("/api/v1/amenities/").get_json() == [{"id": wifi.id, "name": "Wi-Fi"}]
+
+    with count_queries() as statements:
+        assert client.get(f"/api/v1/amenities/{wifi.id}").get_json()["name"] == "Wi-Fi"
+        assert client.get("/api/v1/amenities/").status_code == 200
+        assert client.get("/api/v1/amenities/missing").status_code == 404
+    assert statements == []
+
+    # Modification locale : le catalogue est revérifié dès le commit
+    facade.update_amenity(wifi.id, {"name": "Fiber"})
+    assert client.get(f"/api/v1/amenities/{wifi.id}").get_json()["name"] == "Fiber"
+
+
+def test_amenity_catalog_notices_changes_from_other_workers(client):
+    amenity_catalog.check_interval = 0.05
+    facade.create_amenity({"name": "Wi-Fi"})
+    assert len(client.get("/api/v1/amenities/").get_json()) == 1
+
+    # Écriture d'un autre processus : commodité et compteur de version
+    db.session.add(Amenity(name="Sauna"))
+    facade.catalog_version_repo.bump("amenities")
+    db.session.commit()
+    assert len(client.get("/api/v1/amenities/").get_json()) == 1
+
+    # Intervalle de vérification écoulé
+    time.sleep(0.1)
+    names = [a["name"] for a in client.get("/api/v1/amenities/").get_json()]
+    assert sorted(names) == ["Sauna", "Wi-Fi"]
@@ -0,0 +1,110 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from app import create_app
+from app.extensions import db, password_hasher
+from app.models.revoked_token import RevokedToken
+from app.services import facade
+from app.services.token_blocklist import token_blocklist
+from config import TestingConfig
+
+CREDENTIALS = {"email": "leia@rebellion.org", "password": "Alderaan123!!"}
+
+
+@pytest.fixture
+def client():
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+        facade.create_user({"first_name": "Leia", "last_name": "Organa", **CREDENTIALS})
+        with app.test_client() as client:
+            yield client
+        db.session.remove()
+        db.drop_all()
+
+
+def bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def login(client):
+    res = client.post("/api/v1/auth/login", json=CREDENTIALS)
+    assert res.status_code == 200
+    return res.get_json()
+
+
+def test_login_returns_access_and_refresh_tokens(client):
+    tokens = login(client)
+
+    assert set(tokens) == {"access_token", "refresh_token"}
+    assert client.get("/api/v1/auth/protected", headers=bearer(tokens["access_token"])).status_code == 200
+
+
+def test_refresh_rotates_tokens_without_checking_password(client, monkeypatch):
+    tokens = login(client)
+
+    def fail(*args):
+        raise AssertionError("bcrypt must not run on refresh")
+    monkeypatch.setattr(password_hasher, "verify", fail)
+
+    res = client.post("/api/v1/auth/refresh", headers=bearer(tokens["refresh_token"]))
+
+    assert res.status_code == 200
+    renewed = res.get_json()
+    assert renewed["refresh_token"] != tokens["refresh_token"]
+    assert client.get("/api/v1/auth/protected", headers=bearer(renewed["access_token"])).status_code == 200
+    assert client.post("/api/v1/auth/refresh", headers=bearer(renewed["refresh_token"])).status_code == 200
+
+
+def test_refresh_token_is_single_use_across_restarts(client):
+    tokens = login(client)
+    assert client.post("/api/v1/auth/refresh", headers=bearer(tokens["refresh_token"])).status_code == 200
+
+    assert client.post("/api/v1/auth/refresh", headers=bearer(tokens["refresh_token"])).status_code == 401
+    assert db.session.query(RevokedToken).count() == 1
+
+    # Nouveau processus : les révocations sont rechargées depuis la base
+    token_blocklist.reset()
+    assert client.post("/api/v1/auth/refresh", headers=bearer(tokens["refresh_token"])).status_code == 401
+
+
+def test_refresh_purges_revocations_of_expired_tokens(client):
+    expired = RevokedToken(jti="expired-jti", user_id="someone",
+                           expires_at=datetime.now(timezone.utc) - timedelta(days=1))
+    db.session.add(expired)
+    db.session.commit()
+    tokens = login(client)
+
+    renewed = client.post("/api/v1/auth/refresh", headers=bearer(tokens["refresh_token"])).get_json()
+    assert db.session.query(RevokedToken).filter_by(jti="expired-jti").count() == 0
+    assert db.session.query(RevokedToken).count() == 1
+
+    # Purge faite au plus une fois par intervalle ; le jeton révoqué reste refusé
+    assert client.post("/api/v1/auth/refresh", headers=bearer(renewed["refresh_token"])).status_code == 200
+    assert db.session.query(RevokedToken).count() == 2
+    assert client.post("/api/v1/auth/refresh", headers=bearer(tokens["refresh_token"])).status_code == 401
+
+
+def test_refresh_accepts_tokens_without_expiration(client):
+    client.application.config["JWT_REFRESH_TOKEN_EXPIRES"] = False
+    expired = RevokedToken(jti="expired-jti", user_id="someone",
+                           expires_at=datetime.now(timezone.utc) - timedelta(days=1))
+    db.session.add(expired)
+    db.session.commit()
+    tokens = login(client)
+
+    assert client.post("/api/v1/auth/refresh", headers=bearer(tokens["refresh_token"])).status_code == 200
+
+    # La révocation sans date survit à la purge des jetons expirés
+    revoked = db.session.query(RevokedToken).one()
+    assert revoked.jti != "expired-jti"
+    assert revoked.expires_at is None
+    assert client.post("/api/v1/auth/refresh", headers=bearer(tokens["refresh_token"])).status_code == 401
+
+
+def test_refresh_rejects_access_tokens(client):
+    tokens = login(client)
+
+    res = client.post("/api/v1/auth/refresh", headers=bearer(tokens["access_token"]))
+
+    assert res.status_code == 422
+    assert db.session.query(RevokedToken).count() == 0
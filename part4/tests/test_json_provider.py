@@ -0,0 +1,65 @@
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+import pytest
+from flask_jwt_extended import create_access_token
+from app import create_app
+from app.extensions import db
+from app.json_provider import OrjsonProvider, StdlibJSONProvider
+from app.services import facade
+from config import TestingConfig
+
+
+def make_app(provider):
+    config = type("JSONConfig", (TestingConfig,), {"JSON_PROVIDER": provider, "RESPONSE_CACHE_TTL": 0})
+    return create_app(config)
+
+
+@pytest.mark.parametrize("provider, provider_class", [("json", StdlibJSONProvider), ("orjson", OrjsonProvider)])
+def test_provider_encodes_api_responses_and_parses_requests(provider, provider_class):
+    app = make_app(provider)
+    assert type(app.json) is provider_class
+
+    with app.app_context():
+        db.create_all()
+        headers = {"Authorization": f"Bearer {create_access_token(identity='admin', additional_claims={'is_admin': True})}"}
+        with app.test_client() as client:
+            res = client.post("/api/v1/amenities/", json={"name": "Café"}, headers=headers)
+            assert res.status_code == 201
+
+            res = client.get("/api/v1/amenities/")
+            assert res.mimetype == "application/json"
+            # Clés dans l'ordre des dictionnaires, quel que soit le fournisseur
+            assert list(json.loads(res.data)[0]) == ["id", "name"]
+            assert res.get_json()[0]["name"] == "Café"
+
+            res = client.post("/api/v1/amenities/", data="{not json", headers=headers,
+                              content_type="application/json")
+            assert res.status_code == 400
+        db.drop_all()
+
+
+def test_orjson_provider_matches_stdlib_encoding():
+    app = make_app("orjson")
+    data = {"price": Decimal("80.50"), "histogram": {1: 0, 5: 2}, "title": "Château"}
+
+    with app.app_context():
+        assert json.loads(app.json.dumps(data)) == {"price": "80.50", "histogram": {"1": 0, "5": 2},
+                                                    "title": "Château"}
+        assert app.json.loads(b'{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+
+
+def test_providers_encode_dates_identically():
+    data = {"created_at": datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc), "day": date(2024, 5, 1)}
+    encoded = []
+    for provider in ("json", "orjson"):
+        with make_app(provider).app_context() as ctx:
+            encoded.append(json.loads(ctx.app.json.dumps(data)))
+
+    assert encoded[0] == encoded[1] == {"created_at": "Wed, 01 May 2024 12:30:00 GMT",
+                                        "day": "Wed, 01 May 2024 00:00:00 GMT"}
+
+
+def test_unknown_json_provider_is_rejected():
+    with pytest.raises(ValueError, match="Unknown JSON provider"):
+        make_app("simplejson")
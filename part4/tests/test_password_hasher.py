@@ -0,0 +1,62 @@
+import pytest
+from app import create_app
+from app.extensions import db, password_hasher
+from app.passwords import PasswordHasher, PasswordHasherBusy
+from app.services import facade
+from config import TestingConfig
+
+
+class PooledTestingConfig(TestingConfig):
+    PASSWORD_HASH_POOL_SIZE = 1
+    PASSWORD_HASH_MAX_PENDING = 1
+
+
+@pytest.fixture
+def client():
+    app = create_app(PooledTestingConfig)
+    with app.app_context():
+        db.create_all()
+        with app.test_client() as client:
+            yield client
+        db.session.remove()
+        db.drop_all()
+    # Arrête le pool et revient au hachage dans le thread des autres tests
+    password_hasher.configure(TestingConfig.BCRYPT_LOG_ROUNDS, TestingConfig.PASSWORD_HASH_POOL_SIZE, 1)
+
+
+def test_pool_hashes_and_verifies_with_configured_cost():
+    hasher = PasswordHasher(log_rounds=4, pool_size=1, max_pending=2)
+    try:
+        hashed = hasher.hash("Force1234!!@#")
+        assert hashed.startswith("$2b$04$")
+        assert hasher.verify("Force1234!!@#", hashed) is True
+        assert hasher.verify("WrongPassword!!", hashed) is False
+    finally:
+        hasher.shutdown()
+
+
+def test_full_queue_is_rejected_without_hashing():
+    hasher = PasswordHasher(log_rounds=4, pool_size=1, max_pending=1)
+    hasher._slots.acquire()
+
+    with pytest.raises(PasswordHasherBusy):
+        hasher.hash("Force1234!!@#")
+    assert hasher._pool is None
+
+
+def test_login_answers_503_when_hashing_pool_is_saturated(client):
+    facade.create_user({"first_name": "Leia", "last_name": "Organa",
+                        "email": "leia@rebellion.org", "password": "Alderaan123!!"})
+    credentials = {"email": "leia@rebellion.org", "password": "Alderaan123!!"}
+
+    assert client.post("/api/v1/auth/login", json=credentials).status_code == 200
+
+    password_hasher._slots.acquire()
+    try:
+        res = client.post("/api/v1/auth/login", json=credentials)
+    finally:
+        password_hasher._slots.release()
+
+    assert res.status_code == 503
+    assert res.headers["Retry-After"] == "1"
+    assert client.post("/api/v1/auth/login", json=credentials).status_code == 200
@@ -0,0 +1,875 @@
+import time
+import pytest
+from contextlib import contextmanager
+from sqlalchemy import event, text
+from flask_jwt_extended import create_access_token
+from app import create_app
+from app.extensions import db, response_cache
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from app.models.review import Review
+from app.services import facade
+from config import TestingConfig
+
+
+@pytest.fixture
+def app():
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    with app.test_client() as client:
+        yield client
+
+
+def create_user(email="owner@example.com"):
+    user = User(first_name="Owner", last_name="Test", email=email, password="not-a-real-hash")
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def create_places(owner, count):
+    places = []
+    for i in range(count):
+        place = Place(
+            title=f"Place {i}",
+            description="Nice place",
+            price=10.0 + i,
+            latitude=45.0,
+            longitude=3.0,
+            owner_id=owner.id
+        )
+        db.session.add(place)
+        places.append(place)
+    db.session.commit()
+    return places
+
+
+def add_amenities_and_reviews(places, reviewers):
+    amenities = [Amenity(name="Wi-Fi"), Amenity(name="Pool")]
+    db.session.add_all(amenities)
+    db.session.flush()
+    for place in places:
+        place.amenities.extend(amenities)
+        for reviewer in reviewers:
+            db.session.add(Review(text="Great", rating=5, user_id=reviewer.id, place_id=place.id))
+    db.session.commit()
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def fetch_all_pages(client, limit):
+    ids = []
+    cursor = None
+    while True:
+        url = f"/api/v1/places/?limit={limit}"
+        if cursor:
+            url += f"&after={cursor}"
+        res = client.get(url)
+        assert res.status_code == 200, res.get_json()
+        data = res.get_json()
+        assert len(data["places"]) <= limit
+        ids.extend(p["id"] for p in data["places"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            return ids
+
+
+def test_get_places_paginates_with_cursor(client):
+    owner = create_user()
+    places = create_places(owner, 7)
+
+    ids = fetch_all_pages(client, limit=3)
+
+    assert sorted(ids) == sorted(p.id for p in places)
+    assert len(ids) == len(set(ids))
+
+
+def test_get_places_cursor_breaks_ties_on_id(client):
+    # Les données insérées en SQL (SQL/data.sql) partagent le même created_at,
+    # au format CURRENT_TIMESTAMP (sans microsecondes)
+    owner = create_user()
+    places = create_places(owner, 5)
+    db.session.execute(text("UPDATE places SET created_at = '2025-07-30 10:59:11'"))
+    db.session.commit()
+
+    ids = fetch_all_pages(client, limit=2)
+
+    assert ids == sorted(p.id for p in places)
+
+
+def test_get_places_last_page_has_no_cursor(client):
+    owner = create_user()
+    create_places(owner, 2)
+
+    res = client.get("/api/v1/places/?limit=5")
+
+    assert res.status_code == 200
+    assert res.get_json()["next_cursor"] is None
+
+
+def test_get_places_rejects_invalid_pagination(client):
+    assert client.get("/api/v1/places/?limit=0").status_code == 400
+    assert client.get("/api/v1/places/?limit=abc").status_code == 400
+    assert client.get("/api/v1/places/?after=not-a-cursor").status_code == 400
+
+
+@pytest.mark.parametrize("url", [
+    "/api/v1/places/?limit=100",
+    "/api/v1/places/user/{owner_id}",
+    "/api/v1/places/search?title=Place 0",
+])
+def test_place_listings_issue_fixed_number_of_queries(client, url):
+    owner = create_user()
+    reviewers = [create_user(f"reviewer{i}@example.com") for i in range(3)]
+    add_amenities_and_reviews(create_places(owner, 3), reviewers)
+    url = url.format(owner_id=owner.id)
+
+    db.session.expire_all()
+    with count_queries() as small:
+        assert client.get(url).status_code == 200
+
+    more_places = [
+        Place(title=f"Extra {i}", description="Nice place", price=50.0,
+              latitude=45.0, longitude=3.0, owner_id=owner.id)
+        for i in range(20)
+    ]
+    db.session.add_all(more_places)
+    add_amenities_and_reviews(more_places, reviewers[:1])
+
+    # Écriture directe en base, sans passer par la facade qui invalide le cache
+    response_cache.clear()
+    db.session.expire_all()
+    with count_queries() as large:
+        assert client.get(url).status_code == 200
+
+    # owner (jointure) + amenities + reviews/auteurs, quel que soit le nombre de lieux
+    assert len(small) <= 3
+    assert len(large) == len(small)
+
+
+def test_get_places_sparse_fieldset_skips_relations(client):
+    owner = create_user()
+    reviewers = [create_user("reviewer@example.com")]
+    add_amenities_and_reviews(create_places(owner, 3), reviewers)
+
+    db.session.expire_all()
+    with count_queries() as statements:
+        res = client.get("/api/v1/places/?fields=title,price&include=")
+
+    assert res.status_code == 200
+    for place in res.get_json()["places"]:
+        assert set(place) == {"id", "title", "price"}
+    assert len(statements) == 1
+
+
+def test_get_place_includes_only_requested_relations(client):
+    owner = create_user()
+    place = create_places(owner, 1)[0]
+    add_amenities_and_reviews([place], [create_user("reviewer@example.com")])
+
+    res = client.get(f"/api/v1/places/{place.id}?include=owner")
+
+    assert res.status_code == 200
+    data = res.get_json()
+    assert data["owner"]["id"] == owner.id
+    assert "amenities" not in data and "reviews" not in data
+
+
+def test_get_places_rejects_unknown_projection(client):
+    assert client.get("/api/v1/places/?fields=password").status_code == 400
+    assert client.get("/api/v1/places/?include=secrets").status_code == 400
+
+
+def test_get_places_filters_by_price_in_database(client):
+    owner = create_user()
+    create_places(owner, 6)  # prix de 10.0 à 15.0
+
+    res = client.get("/api/v1/places/?min_price=11&max_price=13.5&include=")
+
+    assert res.status_code == 200
+    prices = sorted(p["price"] for p in res.get_json()["places"])
+    assert prices == [11.0, 12.0, 13.0]
+
+
+@pytest.mark.parametrize("sort, descending", [("price", False), ("-price", True)])
+def test_get_places_sorted_by_price_across_pages(client, sort, descending):
+    owner = create_user()
+    create_places(owner, 7)
+
+    prices = []
+    cursor = None
+    while True:
+        url = f"/api/v1/places/?sort={sort}&limit=3&include="
+        if cursor:
+            url += f"&after={cursor}"
+        data = client.get(url).get_json()
+        prices.extend(p["price"] for p in data["places"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert prices == sorted(prices, reverse=descending)
+    assert len(prices) == 7
+
+
+def test_get_places_rejects_invalid_price_filters(client):
+    assert client.get("/api/v1/places/?min_price=cheap").status_code == 400
+    assert client.get("/api/v1/places/?max_price=nan").status_code == 400
+    assert client.get("/api/v1/places/?sort=rating").status_code == 400
+
+
+def create_place_at(owner, title, latitude, longitude):
+    return facade.create_place({
+        "title": title,
+        "description": "Nice place",
+        "price": 80.0,
+        "latitude": latitude,
+        "longitude": longitude,
+        "owner_id": owner.id,
+        "amenities": []
+    })
+
+
+def test_get_places_nearby_sorted_by_distance(client):
+    owner = create_user()
+    create_place_at(owner, "Louvre", 48.8606, 2.3376)
+    create_place_at(owner, "Versailles", 48.8049, 2.1204)
+    create_place_at(owner, "Lyon", 45.7640, 4.8357)
+
+    res = client.get("/api/v1/places/nearby?lat=48.8566&lon=2.3522&radius_km=30&include=")
+
+    assert res.status_code == 200
+    places = res.get_json()["places"]
+    assert [p["title"] for p in places] == ["Louvre", "Versailles"]
+    assert places[0]["distance_km"] < places[1]["distance_km"] <= 30
+
+
+def test_update_place_keeps_spatial_index_in_sync(client):
+    owner = create_user()
+    place = create_place_at(owner, "Moving", 45.7640, 4.8357)
+
+    facade.update_place(place.id, {"latitude": 48.8606, "longitude": 2.3376})
+
+    res = client.get("/api/v1/places/nearby?lat=48.8566&lon=2.3522&radius_km=5&include=")
+    assert [p["id"] for p in res.get_json()["places"]] == [place.id]
+
+
+def test_get_places_filters_by_bbox(client):
+    owner = create_user()
+    create_place_at(owner, "Louvre", 48.8606, 2.3376)
+    create_place_at(owner, "Lyon", 45.7640, 4.8357)
+
+    res = client.get("/api/v1/places/?bbox=2.0,48.5,2.6,49.0&include=")
+
+    assert res.status_code == 200
+    assert [p["title"] for p in res.get_json()["places"]] == ["Louvre"]
+
+
+def test_get_places_nearby_rejects_invalid_parameters(client):
+    assert client.get("/api/v1/places/nearby?lat=48.8&lon=2.3").status_code == 400
+    assert client.get("/api/v1/places/nearby?lat=95&lon=2.3&radius_km=5").status_code == 400
+    assert client.get("/api/v1/places/nearby?lat=48.8&lon=2.3&radius_km=5000").status_code == 400
+    assert client.get("/api/v1/places/?bbox=1,2,3").status_code == 400
+
+
+def auth_headers(user):
+    token = create_access_token(identity=user.id, additional_claims={"is_admin": False})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_create_place_title_conflict_for_same_owner(client):
+    owner = create_user()
+    other = create_user("other@example.com")
+    create_place_at(other, "Shared title", 45.0, 3.0)
+    payload = {
+        "title": "Shared title",
+        "description": "Nice place",
+        "price": 80.0,
+        "latitude": 45.0,
+        "longitude": 3.0,
+        "amenities": []
+    }
+
+    first = client.post("/api/v1/places/", json=payload, headers=auth_headers(owner))
+    second = client.post("/api/v1/places/", json=payload, headers=auth_headers(owner))
+
+    assert first.status_code == 201
+    assert second.status_code == 409
+
+
+def test_create_place_title_conflict_ignores_surrounding_spaces(client):
+    owner = create_user()
+    payload = {
+        "title": "Loft",
+        "description": "Nice place",
+        "price": 80.0,
+        "latitude": 45.0,
+        "longitude": 3.0,
+        "amenities": []
+    }
+
+    first = client.post("/api/v1/places/", json=payload, headers=auth_headers(owner))
+    padded = client.post("/api/v1/places/", json={**payload, "title": " Loft "}, headers=auth_headers(owner))
+
+    assert first.status_code == 201
+    assert padded.status_code == 409
+    assert padded.get_json() == {"error": "Title already used by this owner"}
+
+
+def test_create_place_keeps_accepting_integer_coordinates_and_empty_description(client):
+    owner = create_user()
+    payload = {"title": "Loft", "description": "", "price": 80, "latitude": 48, "longitude": 2,
+               "amenities": []}
+
+    res = client.post("/api/v1/places/", json=payload, headers=auth_headers(owner))
+
+    assert res.status_code == 201
+    place = Place.query.filter_by(title="Loft").one()
+    assert (place.latitude, place.longitude, place.description) == (48, 2, "")
+
+
+def test_create_place_maps_concurrent_title_insert_to_conflict(app, monkeypatch):
+    owner = create_user()
+    create_place_at(owner, "Loft", 45.0, 3.0)
+    # Simule une création concurrente, invisible lors de la vérification
+    monkeypatch.setattr(facade.place_repo, "find_by_owner_and_title", lambda owner_id, title: None)
+
+    with pytest.raises(ValueError, match="^Title already used by this owner$"):
+        facade.create_place({
+            "title": "Loft", "description": "Nice place", "price": 80.0,
+            "latitude": 45.0, "longitude": 3.0, "owner_id": owner.id
+        })
+    assert Place.query.filter_by(title="Loft").count() == 1
+
+
+def test_update_place_title_conflict_for_same_owner(client):
+    owner = create_user()
+    create_place_at(owner, "Taken", 45.0, 3.0)
+    place = create_place_at(owner, "Free", 45.0, 3.0)
+
+    with pytest.raises(ValueError, match="Title already used"):
+        facade.update_place(place.id, {"title": "Taken"})
+
+
+def test_search_place_by_title(client):
+    owner = create_user()
+    place = create_place_at(owner, "Unique title", 45.0, 3.0)
+
+    res = client.get("/api/v1/places/search?title=Unique title&include=owner")
+
+    assert res.status_code == 200
+    assert res.get_json()["id"] == place.id
+    assert client.get("/api/v1/places/search?title=Missing").status_code == 404
+
+
+def test_get_places_by_user_paginates_owner_places_only(client):
+    owner = create_user()
+    other = create_user("other@example.com")
+    places = create_places(owner, 5)
+    create_place_at(other, "Not mine", 45.0, 3.0)
+
+    first = client.get(f"/api/v1/places/user/{owner.id}?limit=3&include=").get_json()
+    second = client.get(
+        f"/api/v1/places/user/{owner.id}?limit=3&include=&after={first['next_cursor']}"
+    ).get_json()
+
+    ids = [p["id"] for p in first["places"] + second["places"]]
+    assert sorted(ids) == sorted(p.id for p in places)
+    assert second["next_cursor"] is None
+    assert client.get("/api/v1/places/user/unknown").status_code == 404
+
+
+def add_review(place, author, rating):
+    return facade.create_review({"text": "Review", "rating": rating,
+                                 "user_id": author.id, "place_id": place.id})
+
+
+def top_titles(client, query=""):
+    res = client.get(f"/api/v1/places/top?fields=title&include={query}")
+    assert res.status_code == 200
+    return [p["title"] for p in res.get_json()["places"]]
+
+
+def test_top_places_ranked_by_bayesian_average(client):
+    owner = create_user()
+    one_review, many_reviews, low_rated = create_places(owner, 3)
+    reviewers = [create_user(f"guest{i}@example.com") for i in range(3)]
+    add_review(one_review, reviewers[0], 5)
+    for reviewer in reviewers:
+        add_review(many_reviews, reviewer, 5)
+    add_review(low_rated, reviewers[0], 1)
+
+    # Un seul avis parfait pèse moins que trois avis parfaits
+    assert top_titles(client) == [many_reviews.title, one_review.title, low_rated.title]
+    assert top_titles(client, "&min_reviews=2") == [many_reviews.title]
+    assert top_titles(client, "&limit=1") == [many_reviews.title]
+
+
+def test_top_places_follow_review_changes_incrementally(client):
+    from app.services.rankings import place_rankings
+
+    owner = create_user()
+    first, second = create_places(owner, 2)
+    reviewers = [create_user(f"guest{i}@example.com") for i in range(3)]
+    add_review(first, reviewers[0], 4)
+    add_review(second, reviewers[0], 3)
+    assert top_titles(client) == [first.title, second.title]
+
+    # Classement déjà construit : mis à jour par les avis suivants
+    add_review(second, reviewers[1], 5)
+    add_review(second, reviewers[2], 5)
+    review = add_review(first, reviewers[1], 2)
+    assert top_titles(client) == [second.title, first.title]
+
+    facade.delete_review(review.id)
+    incremental = client.get("/api/v1/places/top?include=").get_json()["places"]
+    place_rankings.reset()
+    rebuilt = client.get("/api/v1/places/top?include=").get_json()["places"]
+    assert [p["id"] for p in incremental] == [p["id"] for p in rebuilt]
+
+
+def test_top_places_notice_reviews_from_other_workers(app):
+    from app.services.rankings import PlaceLeaderboard
+
+    owner = create_user()
+    first, second, unreviewed = create_places(owner, 3)
+    reviewers = [create_user(f"guest{i}@example.com") for i in range(2)]
+    add_review(first, reviewers[0], 4)
+
+    # Classement d'un autre processus, construit avant l'avis suivant
+    other = PlaceLeaderboard(check_interval=0.05)
+    windows = []
+
+    def load_stats(since):
+        windows.append(since)
+        return facade.place_repo.get_rating_stats(since)
+
+    other.ensure_loaded(load_stats)
+    assert [place_id for place_id, _, _ in other.top(10)] == [first.id]
+
+    add_review(second, reviewers[1], 5)
+    other.ensure_loaded(load_stats)
+    assert [place_id for place_id, _, _ in other.top(10)] == [first.id]
+
+    # Intervalle écoulé : seuls les lieux modifiés sont relus
+    time.sleep(0.1)
+    with count_queries() as statements:
+        other.ensure_loaded(load_stats)
+    assert [place_id for place_id, _, _ in other.top(10)] == [second.id, first.id]
+    assert windows[0] is None and windows[1] is not None
+    assert "updated_at" in statements[0] and "catalog_versions" not in " ".join(statements)
+    # Lieu sans avis : seulement avec min_reviews=0, à la note a priori
+    assert unreviewed.id not in [place_id for place_id, _, _ in other.top(10)]
+    assert [place_id for place_id, _, _ in other.top(10, min_reviews=0)] == [second.id, unreviewed.id, first.id]
+
+
+def test_top_places_rejects_invalid_parameters(client):
+    assert client.get("/api/v1/places/top?min_reviews=-1").status_code == 400
+    assert client.get("/api/v1/places/top?min_reviews=x").status_code == 400
+    assert client.get("/api/v1/places/top?limit=0").status_code == 400
+
+
+def create_place_with_amenities(owner, title, amenities, price=80.0):
+    return facade.create_place({
+        "title": title,
+        "description": "Nice place",
+        "price": price,
+        "latitude": 45.0,
+        "longitude": 3.0,
+        "owner_id": owner.id,
+        "amenities": [amenity.id for amenity in amenities]
+    })
+
+
+def amenity_filter_titles(client, amenities, match="all", extra=""):
+    ids = ",".join(amenity.id for amenity in amenities)
+    res = client.get(f"/api/v1/places/?fields=title&include=&amenities={ids}&amenities_match={match}{extra}")
+    assert res.status_code == 200
+    return sorted(p["title"] for p in res.get_json()["places"])
+
+
+def test_get_places_filters_by_amenities(client):
+    owner = create_user()
+    wifi, pool, parking = (facade.create_amenity({"name": name}) for name in ("Wi-Fi", "Pool", "Parking"))
+    create_place_with_amenities(owner, "All", [wifi, pool, parking], price=50.0)
+    create_place_with_amenities(owner, "Wifi and pool", [wifi, pool], price=150.0)
+    create_place_with_amenities(owner, "Parking only", [parking])
+    create_place_with_amenities(owner, "Nothing", [])
+
+    assert amenity_filter_titles(client, [wifi, pool]) == ["All", "Wifi and pool"]
+    assert amenity_filter_titles(client, [wifi, pool, parking]) == ["All"]
+    assert amenity_filter_titles(client, [pool, parking], "any") == ["All", "Parking only", "Wifi and pool"]
+    assert amenity_filter_titles(client, [wifi], extra="&max_price=100") == ["All"]
+
+
+def test_amenity_filter_follows_place_updates(client):
+    owner = create_user()
+    wifi, pool = facade.create_amenity({"name": "Wi-Fi"}), facade.create_amenity({"name": "Pool"})
+    place = create_place_with_amenities(owner, "Changing", [wifi])
+    assert amenity_filter_titles(client, [wifi]) == ["Changing"]
+
+    # Index déjà construit : mis à jour par update_place et create_place
+    facade.update_place(place.id, {"amenities": [pool.id]})
+    create_place_with_amenities(owner, "New", [wifi, pool])
+
+    assert amenity_filter_titles(client, [wifi]) == ["New"]
+    assert amenity_filter_titles(client, [pool]) == ["Changing", "New"]
+
+
+def test_amenity_filter_unknown_amenity_matches_nothing(client):
+    owner = create_user()
+    wifi = facade.create_amenity({"name": "Wi-Fi"})
+    create_place_with_amenities(owner, "Wifi", [wifi])
+
+    res = client.get(f"/api/v1/places/?amenities={wifi.id},unknown")
+
+    assert res.status_code == 200
+    assert res.get_json()["places"] == []
+    assert client.get("/api/v1/places/?amenities_match=some").status_code == 400
+
+
+def test_amenity_index_notices_links_from_other_workers(app):
+    from app.services.amenity_index import AmenityBitmapIndex
+
+    owner = create_user()
+    wifi = facade.create_amenity({"name": "Wi-Fi"})
+    create_place_with_amenities(owner, "First", [wifi])
+    create_place_with_amenities(owner, "Untouched", [wifi])
+
+    # Index d'un autre processus, construit avant les écritures suivantes
+    other = AmenityBitmapIndex(check_interval=0.05)
+    other.ensure_loaded(facade.place_repo.get_amenity_links)
+    first = Place.query.filter_by(title="First").one()
+    untouched = Place.query.filter_by(title="Untouched").one()
+    assert sorted(other.match([wifi.id])) == sorted([first.id, untouched.id])
+
+    second = create_place_with_amenities(owner, "Second", [wifi])
+    facade.update_place(first.id, {"amenities": []})
+    other.ensure_loaded(facade.place_repo.get_amenity_links)
+    assert first.id in other.match([wifi.id])
+
+    # Intervalle écoulé : seuls les lieux modifiés sont relus
+    time.sleep(0.1)
+    with count_queries() as statements:
+        other.ensure_loaded(facade.place_repo.get_amenity_links)
+    assert sorted(other.match([wifi.id])) == sorted([untouched.id, second.id])
+    assert len(statements) == 1 and "updated_at" in statements[0]
+
+
+def test_cached_place_listing_skips_database_until_invalidated(client):
+    owner = create_user()
+    place = create_place_at(owner, "Cached", 45.0, 3.0)
+    url = "/api/v1/places/?include=&fields=title,price"
+
+    first = client.get(url).get_json()
+    with count_queries() as queries:
+        # Paramètres dans un autre ordre : même clé de cache
+        assert client.get("/api/v1/places/?fields=title,price&include=").get_json() == first
+    assert queries == []
+
+    facade.update_place(place.id, {"price": 99.0})
+
+    assert client.get(url).get_json()["places"][0]["price"] == 99.0
+
+
+def test_review_changes_invalidate_only_affected_place(client):
+    owner = create_user()
+    reviewed = create_place_at(owner, "Reviewed", 45.0, 3.0)
+    untouched = create_place_at(owner, "Untouched", 45.0, 3.0)
+    guest = create_user("guest@example.com")
+    for place in (reviewed, untouched):
+        client.get(f"/api/v1/places/{place.id}?include=")
+        client.get(f"/api/v1/reviews/places/{place.id}/reviews")
+
+    untouched_id = untouched.id
+    add_review(reviewed, guest, 4)
+
+    with count_queries() as queries:
+        assert client.get(f"/api/v1/places/{untouched_id}?include=").status_code == 200
+        assert client.get(f"/api/v1/reviews/places/{untouched_id}/reviews").get_json() == []
+    assert queries == []
+    assert client.get(f"/api/v1/places/{reviewed.id}?include=").get_json()["review_count"] == 1
+    assert len(client.get(f"/api/v1/reviews/places/{reviewed.id}/reviews").get_json()) == 1
+
+
+def test_get_place_answers_304_from_version_only(client):
+    owner = create_user()
+    place_id = create_place_at(owner, "Tagged", 45.0, 3.0).id
+    url = f"/api/v1/places/{place_id}"
+
+    res = client.get(url)
+    etag = res.headers["ETag"]
+    assert res.headers["Cache-Control"] == "no-cache"
+    assert client.get(url + "?include=").headers["ETag"] != etag
+
+    # Sans cache de réponse : seule la version du lieu est lue
+    response_cache.clear()
+    with count_queries() as queries:
+        res = client.get(url, headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.data == b""
+    assert len(queries) == 1
+
+    # Réponse servie par le cache : 304 également
+    client.get(url)
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_place_etag_changes_with_reviews_and_amenities(client):
+    owner = create_user()
+    place = create_place_at(owner, "Tagged", 45.0, 3.0)
+    place_id = place.id
+    url = f"/api/v1/places/{place_id}"
+    etag = client.get(url).headers["ETag"]
+
+    add_review(place, create_user("guest@example.com"), 4)
+    res = client.get(url, headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["ETag"] != etag
+
+    etag = res.headers["ETag"]
+    wifi = facade.create_amenity({"name": "Wi-Fi"})
+    facade.update_place(place_id, {"amenities": [wifi.id]})
+    res = client.get(url, headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.get_json()["amenities"] == [{"id": wifi.id, "name": "Wi-Fi"}]
+
+    etag = res.headers["ETag"]
+    facade.update_amenity(wifi.id, {"name": "Fibre"})
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_create_place_response_shape(client):
+    owner = create_user()
+    payload = {"title": "Fresh", "description": "Nice place", "price": 80.0,
+               "latitude": 45.0, "longitude": 3.0, "amenities": []}
+
+    res = client.post("/api/v1/places/", json=payload, headers=auth_headers(owner))
+
+    assert res.status_code == 201
+    data = res.get_json()
+    assert set(data) == {"id", "title", "description", "price", "latitude", "longitude", "owner_id"}
+    assert data["owner_id"] == owner.id
+
+
+def test_place_serializer_loads_expired_attributes(app):
+    from app.api.v1.serializers import get_place_serializer
+
+    owner = create_user()
+    place = create_places(owner, 1)[0]
+    db.session.expire(place)
+
+    data = get_place_serializer(("id", "title", "average_rating"), ("owner",))(place)
+
+    assert data == {"id": place.id, "title": "Place 0", "average_rating": None,
+                    "owner": {"id": owner.id, "first_name": "Owner",
+                              "last_name": "Test", "email": "owner@example.com"}}
+
+
+def test_export_streams_all_places_as_ndjson(client):
+    import json
+
+    owner = create_user()
+    create_places(owner, 7)
+
+    res = client.get("/api/v1/places/export?fields=title&include=owner")
+
+    assert res.status_code == 200
+    assert res.mimetype == "application/x-ndjson"
+    assert res.is_streamed
+    lines = [json.loads(line) for line in res.get_data(as_text=True).splitlines()]
+    assert [line["title"] for line in lines] == [f"Place {i}" for i in range(7)]
+    assert all(line["owner"]["id"] == owner.id for line in lines)
+
+
+def test_export_keeps_a_bounded_number_of_places_in_memory(client, monkeypatch):
+    import gc
+    import app.api.v1.places as places_module
+
+    monkeypatch.setattr(places_module, "EXPORT_BATCH_SIZE", 5)
+    create_places(create_user(), 40)
+    db.session.expunge_all()
+    gc.collect()
+
+    res = client.get("/api/v1/places/export?include=", buffered=False)
+    loaded = []
+    count = 0
+    for _ in res.response:
+        count += 1
+        gc.collect()
+        loaded.append(len(db.session.identity_map))
+    res.close()
+
+    assert count == 40
+    assert max(loaded) <= 2 * 5
+
+
+def bulk_payload(titles, amenities=()):
+    return [
+        {"title": title, "description": "Nice place", "price": 80.0,
+         "latitude": 45.0, "longitude": 3.0, "amenities": [a.id for a in amenities]}
+        for title in titles
+    ]
+
+
+def test_bulk_create_places_in_fixed_number_of_queries(client):
+    owner = create_user()
+    wifi, pool = facade.create_amenity({"name": "Wi-Fi"}), facade.create_amenity({"name": "Pool"})
+    headers = auth_headers(owner)
+    assert amenity_filter_titles(client, [wifi]) == []
+    facade.get_amenity_catalog()
+
+    small = bulk_payload([f"Small {i}" for i in range(3)], [wifi])
+    db.session.expire_all()
+    with count_queries() as small_statements:
+        res = client.post("/api/v1/places/bulk", json=small, headers=headers)
+    assert res.status_code == 201
+
+    large = bulk_payload([f"Large {i}" for i in range(60)], [wifi, pool])
+    db.session.expire_all()
+    with count_queries() as large_statements:
+        res = client.post("/api/v1/places/bulk", json=large, headers=headers)
+
+    assert res.status_code == 201
+    data = res.get_json()
+    assert data["created"] == 60 and data["failed"] == 0
+    assert [r["index"] for r in data["results"]] == list(range(60))
+    assert len(large_statements) == len(small_statements)
+
+    places = facade.get_places_by_owner(owner.id)
+    assert len(places) == 63
+    assert all(place.geohash for place in places)
+    # Index des commodités et cache des listes tenus à jour
+    assert len(amenity_filter_titles(client, [wifi, pool], extra="&limit=100")) == 60
+    assert len(amenity_filter_titles(client, [wifi], "any", extra="&limit=100")) == 63
+
+
+def test_bulk_create_places_reports_per_item_errors(client):
+    owner = create_user()
+    create_place_at(owner, "Taken", 45.0, 3.0)
+    payload = bulk_payload(["Fine", "Taken", "Twice", "Twice", "Bad amenity", "Bad price"])
+    payload[4]["amenities"] = ["unknown"]
+    payload[5]["price"] = -1
+    payload.append({"title": "Missing fields"})
+
+    res = client.post("/api/v1/places/bulk", json=payload, headers=auth_headers(owner))
+
+    assert res.status_code == 207
+    data = res.get_json()
+    assert data["created"] == 2 and data["failed"] == 5
+    results = data["results"]
+    assert "id" in results[0] and "id" in results[2]
+    assert results[1]["error"] == "Title already used by this owner"
+    assert "Title already used in this request" in results[3]["error"]
+    assert results[4]["error"] == "Amenity not found: unknown"
+    assert results[5]["error"] == "Price must be greater than 0"
+    assert "Missing required field(s)" in results[6]["error"]
+    assert sorted(p.title for p in facade.get_places_by_owner(owner.id)) == ["Fine", "Taken", "Twice"]
+
+
+def test_bulk_create_places_rejects_invalid_requests(client):
+    owner = create_user()
+    headers = auth_headers(owner)
+
+    assert client.post("/api/v1/places/bulk", json={"title": "Not a list"}, headers=headers).status_code == 400
+    assert client.post("/api/v1/places/bulk", json=[], headers=headers).status_code == 400
+    res = client.post("/api/v1/places/bulk", json=[{"title": ""}], headers=headers)
+    assert res.status_code == 400
+    assert res.get_json()["created"] == 0
+    assert client.post("/api/v1/places/bulk", json=bulk_payload(["A"])).status_code == 401
+
+
+def test_owner_updates_place_loading_it_once(client):
+    owner = create_user()
+    other = create_user("other@example.com")
+    place = create_place_at(owner, "Before", 45.0, 3.0)
+    url = f"/api/v1/places/{place.id}"
+
+    assert client.put(url, json={"title": "Hijacked"}, headers=auth_headers(other)).status_code == 403
+
+    db.session.expire_all()
+    with count_queries() as statements:
+        res = client.put(url, json={"title": "After"}, headers=auth_headers(owner))
+
+    assert res.status_code == 200
+    assert res.get_json()["title"] == "After"
+    place_loads = [s for s in statements if s.startswith("SELECT places.") and "WHERE places.id = ?" in s]
+    # Commit unique après la sérialisation de la réponse : pas de rechargement
+    assert len(place_loads) == 1
+
+
+def test_facade_loads_each_entity_once_per_request(app):
+    owner = create_user()
+    place = create_places(owner, 1)[0]
+
+    def load(times):
+        db.session.expire_all()
+        with app.test_request_context():
+            with count_queries() as statements:
+                for _ in range(times):
+                    assert facade.get_place(place.id).id == place.id
+                    assert facade.get_user(owner.id).id == owner.id
+                    assert facade.get_place("missing") is None
+        return len(statements)
+
+    assert load(3) == load(1)
+    # Chaque requête part d'une identity map vide
+    assert load(1) == load(1) > 0
+
+
+def test_place_amenities_are_resolved_in_one_query(client):
+    owner = create_user()
+    amenities = [facade.create_amenity({"name": f"Amenity {i}"}) for i in range(30)]
+    amenity_ids = [a.id for a in amenities]
+    place = create_place_at(owner, "Loft", 45.0, 3.0)
+    url = f"/api/v1/places/{place.id}"
+    headers = auth_headers(owner)
+    facade.get_amenity_catalog()
+
+    db.session.expire_all()
+    with count_queries() as statements:
+        res = client.put(url, json={"amenities": amenity_ids}, headers=headers)
+    assert res.status_code == 200
+    assert len(res.get_json()["amenities"]) == 30
+    # Une requête IN pour les 30 commodités (plus le chargement des commodités actuelles)
+    amenity_loads = [s for s in statements if s.startswith("SELECT amenities.") and "place_amenity" not in s]
+    assert len(amenity_loads) == 1
+
+    res = client.put(url, json={"amenities": [amenity_ids[0], "unknown", "gone"]}, headers=headers)
+    assert res.status_code == 400
+    assert res.get_json()["error"] == "Amenity not found: unknown, gone"
+
+    owner_id = owner.id
+    db.session.expire_all()
+    with count_queries() as statements:
+        created = facade.create_place({"title": "Studio", "description": "Nice place", "price": 80.0,
+                                       "latitude": 45.0, "longitude": 3.0, "owner_id": owner_id,
+                                       "amenities": amenity_ids})
+    assert len(created.amenities) == 30
+    assert len([s for s in statements if s.startswith("SELECT amenities.") and "place_amenity" not in s]) == 1
+
+    with pytest.raises(ValueError, match="Amenity not found: unknown"):
+        facade.create_place({"title": "Attic", "description": "Nice place", "price": 80.0,
+                             "latitude": 45.0, "longitude": 3.0, "owner_id": owner_id,
+                             "amenities": ["unknown"]})
@@ -0,0 +1,38 @@
+from app.cache import ResponseCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_expired_entry_is_not_returned(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache(max_entries=10, ttl=30)
+    cache.set("a", 1)
+
+    now[0] += 31
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_invalidate_removes_only_tagged_entries():
+    cache = ResponseCache(max_entries=10, ttl=60)
+    cache.set("list", 1, tags=["places"])
+    cache.set("detail", 2, tags=["place:1"])
+    cache.set("other", 3, tags=["place:2"])
+
+    cache.invalidate("places", "place:1")
+
+    assert cache.get("list") is None
+    assert cache.get("detail") is None
+    assert cache.get("other") == 3
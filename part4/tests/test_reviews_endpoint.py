@@ -0,0 +1,205 @@
+import pytest
+from flask_jwt_extended import create_access_token
+from app import create_app
+from app.extensions import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from config import TestingConfig
+
+
+@pytest.fixture
+def app():
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    with app.test_client() as client:
+        yield client
+
+
+def create_user(email="user@example.com"):
+    user = User(first_name="User", last_name="Test", email=email, password="not-a-real-hash")
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def create_place(owner, title="Test Place"):
+    place = Place(title=title, description="Nice place", price=100.0,
+                  latitude=45.0, longitude=3.0, owner_id=owner.id)
+    db.session.add(place)
+    db.session.commit()
+    return place
+
+
+def auth_headers(user):
+    token = create_access_token(identity=user.id, additional_claims={"is_admin": bool(user.is_admin)})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def post_review(client, user, place, rating=4):
+    data = {"text": "Great stay", "rating": rating, "user_id": user.id, "place_id": place.id}
+    return client.post("/api/v1/reviews/", json=data, headers=auth_headers(user))
+
+
+def test_create_review_success(client):
+    place = create_place(create_user("owner@example.com"))
+    guest = create_user()
+
+    res = post_review(client, guest, place)
+
+    assert res.status_code == 201
+    assert res.get_json()["place_id"] == place.id
+
+
+def test_create_review_twice_is_conflict(client):
+    place = create_place(create_user("owner@example.com"))
+    guest = create_user()
+
+    assert post_review(client, guest, place).status_code == 201
+    assert post_review(client, guest, place).status_code == 409
+    assert Review.query.count() == 1
+
+
+def test_create_review_on_own_place_is_forbidden(client):
+    owner = create_user("owner@example.com")
+    place = create_place(owner)
+
+    assert post_review(client, owner, place).status_code == 403
+
+
+def test_get_reviews_by_place_returns_only_that_place(client):
+    owner = create_user("owner@example.com")
+    place, other_place = create_place(owner, "First"), create_place(owner, "Second")
+    guest = create_user()
+    post_review(client, guest, place)
+    post_review(client, guest, other_place)
+
+    res = client.get(f"/api/v1/reviews/places/{place.id}/reviews")
+
+    assert res.status_code == 200
+    assert [r["place_id"] for r in res.get_json()] == [place.id]
+
+
+def get_place_json(client, place):
+    return client.get(f"/api/v1/places/{place.id}?include=").get_json()
+
+
+def test_place_rating_aggregates_follow_review_changes(client):
+    owner = create_user("owner@example.com")
+    place = create_place(owner)
+    guest, other_guest = create_user(), create_user("other@example.com")
+
+    review_id = post_review(client, guest, place, rating=4).get_json()["id"]
+    post_review(client, other_guest, place, rating=1)
+
+    data = get_place_json(client, place)
+    assert data["review_count"] == 2
+    assert data["average_rating"] == 2.5
+    assert data["rating_histogram"] == {"1": 1, "2": 0, "3": 0, "4": 1, "5": 0}
+
+    update = {"text": "Even better", "rating": 5, "user_id": guest.id, "place_id": place.id}
+    assert client.put(f"/api/v1/reviews/{review_id}", json=update,
+                      headers=auth_headers(guest)).status_code == 200
+    data = get_place_json(client, place)
+    assert data["review_count"] == 2
+    assert data["rating_histogram"] == {"1": 1, "2": 0, "3": 0, "4": 0, "5": 1}
+
+    assert client.delete(f"/api/v1/reviews/{review_id}", headers=auth_headers(guest)).status_code == 200
+    data = get_place_json(client, place)
+    assert data["review_count"] == 1
+    assert data["average_rating"] == 1.0
+    assert data["rating_histogram"] == {"1": 1, "2": 0, "3": 0, "4": 0, "5": 0}
+
+
+def test_place_without_reviews_has_empty_aggregates(client):
+    place = create_place(create_user("owner@example.com"))
+
+    data = get_place_json(client, place)
+
+    assert data["review_count"] == 0
+    assert data["average_rating"] is None
+
+
+def test_duplicate_review_does_not_change_aggregates(client):
+    place = create_place(create_user("owner@example.com"))
+    guest = create_user()
+    post_review(client, guest, place, rating=3)
+    post_review(client, guest, place, rating=5)
+
+    data = get_place_json(client, place)
+
+    assert data["review_count"] == 1
+    assert data["rating_histogram"]["5"] == 0
+
+
+def test_review_and_place_reviews_support_conditional_get(client):
+    place = create_place(create_user("owner@example.com"))
+    guest = create_user()
+    place_id = place.id
+    review_id = post_review(client, guest, place, rating=3).get_json()["id"]
+
+    for url in (f"/api/v1/reviews/{review_id}", f"/api/v1/reviews/places/{place_id}/reviews"):
+        etag = client.get(url).headers["ETag"]
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    etags = {url: client.get(url).headers["ETag"]
+             for url in (f"/api/v1/reviews/{review_id}", f"/api/v1/reviews/places/{place_id}/reviews")}
+    update = {"text": "Changed my mind", "rating": 4, "user_id": guest.id, "place_id": place_id}
+    client.put(f"/api/v1/reviews/{review_id}", json=update, headers=auth_headers(guest))
+
+    for url, etag in etags.items():
+        res = client.get(url, headers={"If-None-Match": etag})
+        assert res.status_code == 200
+        assert res.headers["ETag"] != etag
+
+
+def test_review_author_auth_info_is_cached_until_user_update(client):
+    from app.services import facade
+    from tests.test_places_endpoint import count_queries
+
+    place = create_place(create_user("owner@example.com"))
+    guest = create_user()
+    other = create_user("other@example.com")
+    review_id = post_review(client, guest, place).get_json()["id"]
+    update = {"text": "Changed", "rating": 3, "user_id": other.id, "place_id": place.id}
+
+    headers = auth_headers(other)
+
+    assert client.put(f"/api/v1/reviews/{review_id}", json=update, headers=headers).status_code == 403
+    with count_queries() as statements:
+        res = client.put(f"/api/v1/reviews/{review_id}", json=update, headers=headers)
+    assert res.status_code == 403
+    assert not any("WHERE users.id = ?" in statement for statement in statements)
+
+    # Promotion en administrateur : l'entrée en cache est invalidée
+    facade.update_user(other.id, {"is_admin": True})
+    res = client.put(f"/api/v1/reviews/{review_id}", json=update, headers=headers)
+    assert res.status_code == 200
+
+
+def test_invalid_review_payloads_are_rejected_before_any_write(client):
+    place = create_place(create_user("owner@example.com"))
+    guest = create_user()
+
+    for payload, message in [
+        ({"text": "Great", "rating": 6, "place_id": place.id}, "Rating must be between 1 and 5"),
+        ({"text": "  ", "rating": 4, "place_id": place.id}, "Text is required"),
+        ({"text": "Great", "rating": 4}, "Missing required field(s): place_id"),
+    ]:
+        res = client.post("/api/v1/reviews/", json=payload, headers=auth_headers(guest))
+        assert res.status_code == 400
+        assert res.get_json()["error"] == message
+
+    review_id = post_review(client, guest, place).get_json()["id"]
+    res = client.put(f"/api/v1/reviews/{review_id}", json={"rating": "5"}, headers=auth_headers(guest))
+    assert res.status_code == 400
+    assert Review.query.count() == 1
+    assert Review.query.one().rating == 4
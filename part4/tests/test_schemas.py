@@ -0,0 +1,70 @@
+import pytest
+from app.schemas import (
+    PLACE_SCHEMA, PLACE_UPDATE_SCHEMA, REVIEW_SCHEMA, REVIEW_UPDATE_SCHEMA, USER_SCHEMA, USER_UPDATE_SCHEMA,
+    ValidationError
+)
+
+PLACE = {"title": " Loft ", "description": "Nice place", "price": 80,
+         "latitude": 45.0, "longitude": None, "owner_id": "ignored"}
+
+
+def test_decode_normalizes_and_drops_unknown_fields():
+    data = PLACE_SCHEMA.decode(PLACE)
+
+    assert data == {"title": "Loft", "description": "Nice place", "price": 80.0,
+                    "latitude": 45.0, "longitude": None, "picture": None}
+    assert USER_SCHEMA.decode({"first_name": "Leia", "last_name": "Organa", "email": " Leia@Rebellion.org",
+                               "password": "secret"})["email"] == "leia@rebellion.org"
+
+
+@pytest.mark.parametrize("changes, message", [
+    ({"title": "  "}, "Title is required"),
+    ({"title": "x" * 101}, "Title must be at most 100 characters"),
+    ({"price": True}, "Price must be a float or int"),
+    ({"price": 0}, "Price must be greater than 0"),
+    ({"latitude": 91.0}, "Latitude must be between -90.0 and 90.0"),
+    ({"picture": 3}, "Picture must be a string"),
+])
+def test_decode_reports_first_invalid_field(changes, message):
+    with pytest.raises(ValidationError, match=f"^{message}$"):
+        PLACE_SCHEMA.decode({**PLACE, **changes})
+
+
+def test_decode_reports_missing_fields_and_non_objects():
+    with pytest.raises(ValidationError, match="^Missing required field\\(s\\): price, latitude, longitude$"):
+        PLACE_SCHEMA.decode({"title": "Loft", "description": "Nice place"})
+    with pytest.raises(ValidationError, match="^Place must be a JSON object$"):
+        PLACE_SCHEMA.decode(None)
+
+
+def test_partial_schema_decodes_only_given_fields():
+    assert PLACE_UPDATE_SCHEMA.decode({"price": 99, "picture": None}) == {"price": 99.0, "picture": None}
+    with pytest.raises(ValidationError, match="^Description is required$"):
+        PLACE_UPDATE_SCHEMA.decode({"description": ""})
+
+
+def test_decoded_data_is_not_decoded_twice():
+    data = REVIEW_SCHEMA.decode({"text": "Great", "rating": 5, "place_id": "p", "user_id": "forged"},
+                                user_id="from-token")
+
+    assert data["user_id"] == "from-token"
+    assert REVIEW_SCHEMA.decode(data) is data
+    # Un autre schéma décode à nouveau
+    assert REVIEW_UPDATE_SCHEMA.decode(data) == {"text": "Great", "rating": 5}
+
+
+def test_user_update_coerces_is_admin_like_before():
+    assert USER_UPDATE_SCHEMA.decode({"is_admin": 1}) == {"is_admin": True}
+    assert USER_UPDATE_SCHEMA.decode({"is_admin": None}) == {"is_admin": False}
+    with pytest.raises(ValidationError, match="^Is admin must be a boolean$"):
+        USER_SCHEMA.decode({"first_name": "Leia", "last_name": "Organa", "email": "leia@rebellion.org",
+                            "password": "secret", "is_admin": 1})
+
+
+def test_coordinates_accept_integers():
+    data = PLACE_SCHEMA.decode({**PLACE, "latitude": 48, "longitude": -2})
+
+    assert data["latitude"] == 48.0 and isinstance(data["latitude"], float)
+    assert data["longitude"] == -2.0
+    with pytest.raises(ValidationError, match="^Latitude must be a float$"):
+        PLACE_SCHEMA.decode({**PLACE, "latitude": True})
@@ -0,0 +1,125 @@
+import pytest
+from contextlib import contextmanager
+from sqlalchemy import event
+from app import create_app
+from app.extensions import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from app.persistence.repository import after_commit, unit_of_work
+from app.services import facade
+from config import TestingConfig
+
+
+@pytest.fixture
+def app():
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@contextmanager
+def count_commits():
+    commits = []
+
+    def after_commit_listener(session):
+        commits.append(session)
+
+    session = db.session()
+    event.listen(session, "after_commit", after_commit_listener)
+    try:
+        yield commits
+    finally:
+        event.remove(session, "after_commit", after_commit_listener)
+
+
+def create_user(email):
+    user = User(first_name="User", last_name="Test", email=email, password="not-a-real-hash")
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def create_place(owner):
+    place = Place(title="Test Place", description="Nice place", price=100.0,
+                  latitude=45.0, longitude=3.0, owner_id=owner.id)
+    db.session.add(place)
+    db.session.commit()
+    return place
+
+
+def test_review_create_and_delete_commit_once(app):
+    place = create_place(create_user("owner@example.com"))
+    guest = create_user("guest@example.com")
+
+    with count_commits() as commits:
+        review = facade.create_review({"text": "Great", "rating": 4, "user_id": guest.id, "place_id": place.id})
+    assert len(commits) == 1
+    assert place.review_count == 1
+
+    with count_commits() as commits:
+        facade.delete_review(review.id)
+    assert len(commits) == 1
+    assert place.review_count == 0
+    assert place.reviews == []
+
+
+def test_nested_units_of_work_commit_once_then_run_callbacks(app):
+    calls = []
+
+    with count_commits() as commits:
+        with unit_of_work():
+            facade.create_amenity({"name": "Wi-Fi"})
+            with unit_of_work():
+                db.session.add(Amenity(name="Pool"))
+                after_commit(lambda: calls.append(len(commits)))
+            assert commits == [] and calls == []
+
+    assert len(commits) == 1
+    assert calls == [1]
+    assert db.session.query(Amenity).count() == 2
+
+
+def test_failed_unit_of_work_rolls_back_and_skips_callbacks(app):
+    calls = []
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work():
+            facade.create_amenity({"name": "Wi-Fi"})
+            after_commit(lambda: calls.append("run"))
+            raise RuntimeError("boom")
+
+    assert calls == []
+    assert db.session.query(Amenity).count() == 0
+
+
+def test_request_level_unit_of_work_rolls_back_failed_handler(app):
+    from flask_jwt_extended import create_access_token
+
+    owner = create_user("owner@example.com")
+    place = create_place(owner)
+    taken = Place(title="Taken", description="Nice place", price=100.0, owner_id=owner.id)
+    db.session.add(taken)
+    db.session.commit()
+    wifi = facade.create_amenity({"name": "Wi-Fi"})
+    headers = {"Authorization": f"Bearer {create_access_token(identity=owner.id)}"}
+    url = f"/api/v1/places/{place.id}"
+
+    with app.test_client() as client:
+        # Les commodités sont modifiées en mémoire avant le refus du titre (409)
+        with count_commits() as commits:
+            res = client.put(url, json={"title": "Taken", "amenities": [wifi.id]}, headers=headers)
+        assert res.status_code == 409
+        assert commits == []
+
+        with count_commits() as commits:
+            res = client.put(url, json={"title": "Renamed"}, headers=headers)
+        assert res.status_code == 200
+        assert len(commits) == 1
+
+    db.session.expire_all()
+    assert place.title == "Renamed"
+    assert place.amenities == []